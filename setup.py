@@ -24,8 +24,15 @@ setup(
     ],
     extras_require={
         "data": ["pandas","numpy"],
+        "async": ["httpx"],
+        "fast": ["orjson"],
         "viz": ["matplotlib","seaborn","wordcloud","plotly"],
         "ml": ["bertopic","scikit-learn","hdbscan","umap-learn"],
         "nlp": ["nltk", "spacy", "transformers", "sentence-transformers"],
     },
+    entry_points={
+        "console_scripts": [
+            "sify-batch=sify.aiplatform.jobs.cli:main",
+        ],
+    },
 )
@@ -1,5 +1,7 @@
 from .app import AIApplication
 from .datamind import DataMind
+from .async_app import AsyncAIApplication
+from .async_datamind import AsyncDataMind
 from .types import (
     ChatCompletionResponse, 
     FileObject,
@@ -2,18 +2,43 @@ import json
 import os
 import mimetypes
 import requests
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 from sify.aiplatform.aistudio.types import ChatCompletionResponse, ChatCompletionStreamResponse, FileObject, MessageFile, AgentThought, RetrieverResource, Message, Conversation, FileUploadResponse
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, HTTPTransport, get_transport
+from sify.aiplatform.transport.concurrency import limited_request
+from sify.aiplatform.transport.errors import (
+    CONNECTION_ERRORS,
+    TIMEOUT_ERRORS,
+    APIConnectionError,
+    APIRequestError,
+    APITimeoutError,
+    error_for_status,
+)
+from sify.aiplatform.transport.sse import iter_sse_json
+from sify.aiplatform.observability.langfuse import get_tracer
+from sify.aiplatform.observability.metrics import record_usage
+from sify.aiplatform.observability.stream_metrics import StreamStatsCallback, StreamTimer, finish_stream
 
 
 class AIApplication:
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        transport: Optional[HTTPTransport] = None,
+        on_stream_stats: Optional[StreamStatsCallback] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
         """
         Initialize the AIApplication with a base URL and api  key.
 
         Args:
             base_url (str): The base URL for the API (e.g., https://copilot-dev.sifymdp.digital/v1).
             api_key (str): The API key for authentication.
+            transport (Optional[HTTPTransport]): Pooled HTTP transport to use. Defaults to the shared transport.
+            on_stream_stats (Optional[Callable[[StreamStats], None]]): Called with the TTFT and
+                inter-chunk latency profile of every streamed chat message.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive cap on requests in flight.
 
         Raises:
             ValueError: If base_url or api_key is empty or invalid.
@@ -25,6 +50,55 @@ class AIApplication:
 
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        self.transport = transport or get_transport()
+        self.on_stream_stats = on_stream_stats
+        self.concurrency_limiter = concurrency_limiter
+        self.tracer = get_tracer()
+
+    def _headers(self, json_body: bool = True) -> Dict[str, str]:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        # Note: Don't set Content-Type for multipart/form-data - the HTTP client will set it automatically
+        if json_body:
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    @staticmethod
+    def _raise_for_status(response, default_msg: str, missing_msg: str) -> None:
+        if response.status_code >= 400:
+            # Attempt to get error message from JSON or fallback to text
+            error_msg = default_msg
+            try:
+                err_resp = response.json()
+                if 'message' in err_resp and isinstance(err_resp['message'], str):
+                    error_msg = err_resp['message']
+                else:
+                    error_msg = missing_msg
+            except json.JSONDecodeError:
+                error_msg = response.text if response.text else "Non-JSON Error"
+            raise error_for_status(response.status_code, error_msg, retries=getattr(response, "retries", 0))
+
+    @staticmethod
+    def _parse_result(response, content: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            result = json.loads(content) if content is not None else response.json()
+        except json.JSONDecodeError:
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                raise ValueError(f"HTML Response: {response.text[:100]}")
+            else:
+                raise ValueError(response.text if response.text else "Non-JSON Response")
+        return {"status_code": response.status_code, "result": result}
+
+    @staticmethod
+    def _raise_request_error(e: Exception) -> None:
+        retries = getattr(e, "retries", 0)
+        if isinstance(e, TIMEOUT_ERRORS):
+            raise APITimeoutError("Request timeout", retries=retries) from e
+        elif isinstance(e, CONNECTION_ERRORS):
+            raise APIConnectionError("Connection error", retries=retries) from e
+        else:
+            raise APIRequestError("Something Went Wrong", retries=retries) from e
 
     def _send_request(
         self,
@@ -35,68 +109,41 @@ class AIApplication:
         stream: bool = False
     ) -> Union[Dict[str, Any], Generator[Dict[str, Any], None, None]]:
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = limited_request(
+                self.concurrency_limiter,
+                self.transport.request,
                 method=method,
                 url=url,
+                endpoint=endpoint,
                 json=json_data,
                 params=params,
-                headers=headers,
-                stream=stream,
-                timeout=300
+                headers=self._headers(),
+                stream=stream
             )
 
-            if response.status_code >= 400:
-                # Attempt to get error message from JSON or fallback to text
-                error_msg = "Something Went Wrong"
-                try:
-                    err_resp = response.json()
-                    if 'message' in err_resp and isinstance(err_resp['message'], str):
-                        error_msg = err_resp['message']
-                    else:
-                        error_msg = "Output error: No valid error message provided"
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
-
             if stream:
+                if response.status_code >= 400:
+                    try:
+                        self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+                    finally:
+                        response.close()
+
                 def line_generator():
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line.startswith("data:"):
-                            data_str = line[len("data:"):].strip()
-                            if data_str:
-                                try:
-                                    yield json.loads(data_str)
-                                except json.JSONDecodeError:
-                                    continue
+                    try:
+                        yield from iter_sse_json(response.iter_content(chunk_size=None))
+                    finally:
+                        response.close()
                 return line_generator()
 
-            else:
-                content = response.content.decode()
-                try:
-                    result = json.loads(content)
-                except json.JSONDecodeError:
-                    if 'text/html' in response.headers.get('Content-Type', ''):
-                        raise ValueError(f"HTML Response: {response.text[:100]}")
-                    else:
-                        raise ValueError(response.text if response.text else "Non-JSON Response")
-                return {"status_code": response.status_code, "result": result}
+            self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+            return self._parse_result(response, response.content.decode())
 
         except requests.RequestException as e:
-            error_msg = str(e).lower()
-            if "timeout" in error_msg:
-                error_msg = "Request timeout"
-            elif "connection" in error_msg:
-                error_msg = "Connection error"
-            else:
-                error_msg = "Something Went Wrong"
-            raise ValueError(error_msg)
+            self._raise_request_error(e)
+
     def _send_file_request(
         self,
         method: str,
@@ -105,59 +152,194 @@ class AIApplication:
         data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-            # Note: Don't set Content-Type for multipart/form-data - requests will set it automatically
-        }
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = limited_request(
+                self.concurrency_limiter,
+                self.transport.request,
                 method=method,
                 url=url,
+                endpoint=endpoint,
                 files=files,
                 data=data,
-                headers=headers,
-                timeout=300
+                headers=self._headers(json_body=False)
             )
 
-            if response.status_code >= 400:
-                # Attempt to get error message from JSON or fallback to text
-                error_msg = "Request failed"
-                try:
-                    err_resp = response.json()
-                    if 'message' in err_resp and isinstance(err_resp['message'], str):
-                        error_msg = err_resp['message']
-                    else:
-                        error_msg = "API error: No valid error message provided"
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
-
-            try:
-                result = response.json()
-                return {"status_code": response.status_code, "result": result}
-            except json.JSONDecodeError:
-                if 'text/html' in response.headers.get('Content-Type', ''):
-                    raise ValueError(f"HTML Response: {response.text[:100]}")
-                else:
-                    raise ValueError(response.text if response.text else "Non-JSON Response")
+            self._raise_for_status(response, "Request failed", "API error: No valid error message provided")
+            return self._parse_result(response)
 
         except requests.RequestException as e:
-            error_msg = str(e).lower()
-            if "timeout" in error_msg:
-                error_msg = "Request timeout"
-            elif "connection" in error_msg:
-                error_msg = "Connection error"
-            else:
-                error_msg = "Something Went Wrong"
-            raise ValueError(error_msg)
+            self._raise_request_error(e)
 
     def _validate_required_params(self, params: Dict[str, Any]) -> None:
         for param_name, param_value in params.items():
             if not param_value:
                 raise ValueError(f"{param_name} must not be empty")
         
+    def _chat_message_data(
+        self,
+        query: str,
+        user: str,
+        response_mode: str,
+        inputs: Optional[Dict[str, Any]],
+        conversation_id: Optional[str],
+        files: Optional[List[FileObject]],
+        auto_generate_name: bool,
+    ) -> Dict[str, Any]:
+        if response_mode not in ["blocking", "streaming"]:
+            raise ValueError("response_mode must be 'blocking' or 'streaming'")
+
+        self._validate_required_params({
+            "query": query,
+            "user": user,
+            "response_mode": response_mode
+        })
+
+        data = {
+            "inputs": inputs or {},
+            "query": query,
+            "user": user,
+            "response_mode": response_mode,
+            "auto_generate_name": auto_generate_name
+        }
+
+        if conversation_id:
+            data["conversation_id"] = conversation_id
+
+        if files:
+            data["files"] = [file.to_dict() for file in files]
+        return data
+
+    def _upload_file_info(self, file_path: str, user: str) -> Tuple[str, str]:
+        self._validate_required_params({
+            "file_path": file_path,
+            "user": user
+        })
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        # Get file information
+        file_name = os.path.basename(file_path)
+        mime_type, _ = mimetypes.guess_type(file_path)
+        
+        # Validate file type (only images supported)
+        supported_types = ['image/png', 'image/jpeg', 'image/jpg', 'image/webp', 'image/gif']
+        if mime_type not in supported_types:
+            raise ValueError(f"Unsupported file type: {mime_type}. Supported types: {', '.join(supported_types)}")
+        return file_name, mime_type
+
+    def _conversation_messages_params(self, user: str, conversation_id: str,
+                                      first_id: Optional[str], limit: Optional[int]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "user": user,
+            "conversation_id": conversation_id
+        })        
+        params = {
+            "user": user,
+            "conversation_id": conversation_id
+        }
+        if first_id is not None:
+            params["first_id"] = first_id
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    @staticmethod
+    def _parse_conversation_messages(result: Dict[str, Any]) -> Dict[str, Any]:
+        messages = [
+            Message(
+                id=msg["id"],
+                conversation_id=msg["conversation_id"],
+                inputs=msg["inputs"],
+                query=msg["query"],
+                answer=msg["answer"],
+                message_files=[MessageFile(**mf) for mf in msg["message_files"]],
+                feedback=msg["feedback"],
+                retriever_resources=[RetrieverResource(**rr) for rr in msg["retriever_resources"]],
+                agent_thoughts=[AgentThought(**at) for at in msg["agent_thoughts"]],
+                created_at=msg["created_at"]
+            ) for msg in result["data"]
+        ]
+        return {
+            "limit": result["limit"],
+            "has_more": result["has_more"],
+            "data": messages
+        }
+
+    def _conversations_params(self, user: str, last_id: Optional[str],
+                              limit: Optional[int], pinned: Optional[bool]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "user": user
+        })
+
+        params = {"user": user}
+        if last_id:
+            params["last_id"] = last_id
+        if limit is None:
+            limit = 20
+        params["limit"] = limit
+        if pinned is not None:
+            params["pinned"] = pinned
+        return params
+
+    @staticmethod
+    def _parse_conversations(result: Dict[str, Any]) -> Dict[str, Any]:
+        conversations = [
+            Conversation(**conv) for conv in result["data"]
+        ]
+        return {
+            "limit": result["limit"],
+            "has_more": result["has_more"],
+            "data": conversations
+        }
+
+    def _feedback_data(self, message_id: str, user: str, rating: str) -> Dict[str, Any]:
+        self._validate_required_params({
+            "message_id": message_id,
+            "user": user,
+            "rating": rating
+        })
+        return {
+            "rating": rating,
+            "user": user
+        }
+
+    def _rename_conversation_data(self, conversation_id: str, user: str, name: Optional[str],
+                                  auto_generate: bool) -> Dict[str, Any]:
+        self._validate_required_params({
+            "conversation_id": conversation_id,
+            "user": user
+        })
+        if not auto_generate and not name:
+            raise ValueError("Name must not be empty when auto_generate is False")
+
+        data = {
+            "user": user,
+            "auto_generate": auto_generate
+        }
+        if name:
+            data["name"] = name
+        return data
+
+    def _stop_generate_data(self, task_id: str, user: str) -> Dict[str, Any]:
+        self._validate_required_params({
+            "task_id": task_id,
+            "user": user
+        })
+        return {"user": user}
+
+    @staticmethod
+    def _record_message_usage(span, result: Dict[str, Any]) -> None:
+        """Report the ``metadata.usage`` of a blocking reply or ``message_end`` event, if any."""
+        metadata = result.get("metadata")
+        usage = metadata.get("usage") if isinstance(metadata, dict) else None
+        if not isinstance(usage, dict):
+            return
+        record_usage("/chat-messages", None, usage)
+        span.set_metadata({"usage": usage})
+
     def chat_message(
         self,
         query: str,
@@ -239,47 +421,53 @@ class AIApplication:
         Raises:
             ValueError: If query or user is empty, conversation_id is not a valid UUID, or Output  request fails.
         """
-        if response_mode not in ["blocking", "streaming"]:
-            raise ValueError("response_mode must be 'blocking' or 'streaming'")
-
-        self._validate_required_params({
-            "query": query,
-            "user": user,
-            "response_mode": response_mode
-        })
-
-        data = {
-            "inputs": inputs or {},
-            "query": query,
-            "user": user,
-            "response_mode": response_mode,
-            "auto_generate_name": auto_generate_name
-        }
-
-        if conversation_id:
-            data["conversation_id"] = conversation_id
-
-        if files:
-            data["files"] = [file.to_dict() for file in files]
+        data = self._chat_message_data(query, user, response_mode, inputs, conversation_id, files, auto_generate_name)
         
         def stream_mode():
-            response_generator = self._send_request(
-                method="POST",
-                endpoint="/chat-messages",
-                json_data=data,
-                stream=True
-            )
-            for line in response_generator:
-                yield ChatCompletionStreamResponse.from_dict(line)
+            span = self.tracer.start_span("aistudio.chat_message", data)
+            timer = StreamTimer("aistudio.chat_message")
+            response_generator = None
+            completed = False
+            error = None
+            try:
+                response_generator = self._send_request(
+                    method="POST",
+                    endpoint="/chat-messages",
+                    json_data=data,
+                    stream=True
+                )
+                for line in response_generator:
+                    timer.tick()
+                    if line.get("event") == "message_end":
+                        self._record_message_usage(span, line)
+                    yield ChatCompletionStreamResponse.from_dict(line)
+                completed = True
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # Also runs when the caller stops early (break, close()).
+                if response_generator is not None:
+                    response_generator.close()
+                finish_stream(span, timer, self.on_stream_stats, completed)
+                span.end(error=error)
 
         def blocking_mode():
-            response = self._send_request(
-                method="POST",
-                endpoint="/chat-messages",
-                json_data=data,
-                stream=False
-            )
-            return ChatCompletionResponse.from_dict(response["result"])
+            span = self.tracer.start_span("aistudio.chat_message", data)
+            try:
+                response = self._send_request(
+                    method="POST",
+                    endpoint="/chat-messages",
+                    json_data=data,
+                    stream=False
+                )
+                self._record_message_usage(span, response["result"])
+                result = ChatCompletionResponse.from_dict(response["result"])
+            except Exception as e:
+                span.end(error=e)
+                raise
+            span.end()
+            return result
 
 
         if response_mode == "streaming":
@@ -310,23 +498,7 @@ class AIApplication:
             ValueError: If file_path or user is empty, file doesn't exist, or upload request fails.
             FileNotFoundError: If the specified file path doesn't exist.
         """
-        
-        self._validate_required_params({
-            "file_path": file_path,
-            "user": user
-        })
-        
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        # Get file information
-        file_name = os.path.basename(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        
-        # Validate file type (only images supported)
-        supported_types = ['image/png', 'image/jpeg', 'image/jpg', 'image/webp', 'image/gif']
-        if mime_type not in supported_types:
-            raise ValueError(f"Unsupported file type: {mime_type}. Supported types: {', '.join(supported_types)}")
+        file_name, mime_type = self._upload_file_info(file_path, user)
         
         # Prepare file and data for upload
         with open(file_path, 'rb') as file:
@@ -398,40 +570,9 @@ class AIApplication:
         Raises:
             ValueError: If user is empty, conversation_id or first_id is not a valid UUID, or Output  request fails.
 """
-        self._validate_required_params({
-            "user": user,
-            "conversation_id": conversation_id
-        })        
-        params = {
-            "user": user,
-            "conversation_id": conversation_id
-        }
-        if first_id is not None:
-            params["first_id"] = first_id
-        if limit is not None:
-            params["limit"] = limit
-
+        params = self._conversation_messages_params(user, conversation_id, first_id, limit)
         response = self._send_request(method="GET", endpoint="/messages", params=params)
-        result = response["result"]
-        messages = [
-            Message(
-                id=msg["id"],
-                conversation_id=msg["conversation_id"],
-                inputs=msg["inputs"],
-                query=msg["query"],
-                answer=msg["answer"],
-                message_files=[MessageFile(**mf) for mf in msg["message_files"]],
-                feedback=msg["feedback"],
-                retriever_resources=[RetrieverResource(**rr) for rr in msg["retriever_resources"]],
-                agent_thoughts=[AgentThought(**at) for at in msg["agent_thoughts"]],
-                created_at=msg["created_at"]
-            ) for msg in result["data"]
-        ]
-        return {
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-            "data": messages
-        }
+        return self._parse_conversation_messages(response["result"])
 
     def get_conversations(self, user: str, last_id: Optional[str] = None, 
                           limit: Optional[int] = None, pinned: Optional[bool] = None) -> Dict[str, Any]:
@@ -459,28 +600,9 @@ class AIApplication:
         Raises:
             ValueError: If user is empty, or Output  request fails.
         """
-        self._validate_required_params({
-            "user": user
-        })
-
-        params = {"user": user}
-        if last_id:
-            params["last_id"] = last_id
-        if limit is None:
-            limit = 20
-        params["limit"] = limit
-        if pinned is not None:
-            params["pinned"] = pinned
+        params = self._conversations_params(user, last_id, limit, pinned)
         response = self._send_request(method="GET", endpoint="/conversations", params=params)
-        result = response["result"]
-        conversations = [
-            Conversation(**conv) for conv in result["data"]
-        ]
-        return {
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-            "data": conversations
-        }
+        return self._parse_conversations(response["result"])
 
     def send_message_feedback(self, message_id: str, user: str, rating: str) -> Dict[str, str]:
         """
@@ -498,16 +620,7 @@ class AIApplication:
         Raises:
             ValueError: If message_id, user, or rating is empty, or Output  request fails.
         """
-        self._validate_required_params({
-            "message_id": message_id,
-            "user": user,
-            "rating": rating
-        })
-
-        data = {
-            "rating": rating,
-            "user": user
-        }
+        data = self._feedback_data(message_id, user, rating)
         response = self._send_request(
             method="POST",
             endpoint=f"/messages/{message_id}/feedbacks",
@@ -537,21 +650,7 @@ class AIApplication:
         Raises:
             ValueError: If conversation_id or user is empty, name is empty when auto_generate is False.
         """
-
-        self._validate_required_params({
-            "conversation_id": conversation_id,
-            "user": user
-        })
-        if not auto_generate and not name:
-            raise ValueError("Name must not be empty when auto_generate is False")
-
-        data = {
-            "user": user,
-            "auto_generate": auto_generate
-        }
-        if name:
-            data["name"] = name
-
+        data = self._rename_conversation_data(conversation_id, user, name, auto_generate)
         response = self._send_request(
             method="POST",
             endpoint=f"/conversations/{conversation_id}/name",
@@ -574,13 +673,7 @@ class AIApplication:
         Raises:
             ValueError: If task_id or user is empty, or request fails.
         """
-        self._validate_required_params({
-            "task_id": task_id,
-            "user": user
-        })
-
-        data = {"user": user}
-
+        data = self._stop_generate_data(task_id, user)
         response = self._send_request(
             method="POST",
             endpoint=f"/chat-messages/{task_id}/stop",
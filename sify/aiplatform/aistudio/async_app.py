@@ -0,0 +1,271 @@
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from sify.aiplatform.aistudio.app import AIApplication
+from sify.aiplatform.aistudio.types import ChatCompletionResponse, ChatCompletionStreamResponse, FileObject, Conversation, FileUploadResponse
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, AsyncHTTPTransport, get_async_transport
+from sify.aiplatform.transport.concurrency import limited_request_async
+from sify.aiplatform.transport.async_transport import httpx
+from sify.aiplatform.transport.sse import aiter_sse_json
+from sify.aiplatform.observability.stream_metrics import StreamStatsCallback, StreamTimer, finish_stream
+
+
+def _read_file(file_path: str) -> bytes:
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+class AsyncAIApplication(AIApplication):
+    """
+    asyncio counterpart of ``AIApplication``.
+
+    Methods take the same arguments and return the same types from
+    ``aistudio/types.py`` but are coroutines. ``chat_message`` with
+    ``response_mode="streaming"`` resolves to an async generator of
+    ``ChatCompletionStreamResponse``::
+
+        stream = await app.chat_message(query, user, "streaming")
+        async for event in stream:
+            ...
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+        on_stream_stats: Optional[StreamStatsCallback] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
+        """
+        Initialize the AsyncAIApplication with a base URL and api key.
+
+        Args:
+            base_url (str): The base URL for the API (e.g., https://copilot-dev.sifymdp.digital/v1).
+            api_key (str): The API key for authentication.
+            transport (Optional[AsyncHTTPTransport]): Pooled async transport to use. Defaults to the shared one.
+            on_stream_stats (Optional[Callable[[StreamStats], None]]): Called with the latency
+                profile of every streamed chat message.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive cap on requests in flight.
+
+        Raises:
+            ValueError: If base_url or api_key is empty or invalid.
+        """
+        super().__init__(
+            base_url, api_key, on_stream_stats=on_stream_stats, concurrency_limiter=concurrency_limiter
+        )
+        self.transport = transport or get_async_transport()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> Union[Dict[str, Any], AsyncGenerator[Dict[str, Any], None]]:
+
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            response = await limited_request_async(
+                self.concurrency_limiter,
+                self.transport.request,
+                method=method,
+                url=url,
+                endpoint=endpoint,
+                json=json_data,
+                params=params,
+                headers=self._headers(),
+                stream=stream
+            )
+
+            if stream:
+                if response.status_code >= 400:
+                    try:
+                        await response.aread()
+                    finally:
+                        await response.aclose()
+                    self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+
+                async def line_generator():
+                    try:
+                        async for chunk in aiter_sse_json(response.aiter_bytes()):
+                            yield chunk
+                    finally:
+                        await response.aclose()
+                return line_generator()
+
+            self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+            return self._parse_result(response, response.content.decode())
+
+        except httpx.HTTPError as e:
+            self._raise_request_error(e)
+
+    async def _send_file_request(
+        self,
+        method: str,
+        endpoint: str,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            response = await limited_request_async(
+                self.concurrency_limiter,
+                self.transport.request,
+                method=method,
+                url=url,
+                endpoint=endpoint,
+                files=files,
+                data=data,
+                headers=self._headers(json_body=False)
+            )
+
+            self._raise_for_status(response, "Request failed", "API error: No valid error message provided")
+            return self._parse_result(response)
+
+        except httpx.HTTPError as e:
+            self._raise_request_error(e)
+
+    async def chat_message(
+        self,
+        query: str,
+        user: str,
+        response_mode: str,
+        inputs: Dict[str, Any] = None,
+        conversation_id: Optional[str] = None,
+        files: Optional[List[FileObject]] = None,
+        auto_generate_name: bool = True,
+    ) -> Union[ChatCompletionResponse, AsyncGenerator[ChatCompletionStreamResponse, None]]:
+        """
+        Send a chat message to the AI application. See ``AIApplication.chat_message``.
+
+        Returns:
+            - If response_mode="blocking": ChatCompletionResponse
+            - If response_mode="streaming": async generator of ChatCompletionStreamResponse
+        """
+        data = self._chat_message_data(query, user, response_mode, inputs, conversation_id, files, auto_generate_name)
+
+        if response_mode == "streaming":
+            span = self.tracer.start_span("aistudio.chat_message", data)
+            timer = StreamTimer("aistudio.chat_message")
+            try:
+                response_generator = await self._send_request(
+                    method="POST",
+                    endpoint="/chat-messages",
+                    json_data=data,
+                    stream=True
+                )
+            except Exception as e:
+                finish_stream(span, timer, self.on_stream_stats, completed=False)
+                span.end(error=e)
+                raise
+
+            async def stream_mode():
+                completed = False
+                error = None
+                try:
+                    async for line in response_generator:
+                        timer.tick()
+                        if line.get("event") == "message_end":
+                            self._record_message_usage(span, line)
+                        yield ChatCompletionStreamResponse.from_dict(line)
+                    completed = True
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    # Also runs when the caller stops early (break, aclose(), cancellation).
+                    await response_generator.aclose()
+                    finish_stream(span, timer, self.on_stream_stats, completed)
+                    span.end(error=error)
+            return stream_mode()
+
+        span = self.tracer.start_span("aistudio.chat_message", data)
+        try:
+            response = await self._send_request(
+                method="POST",
+                endpoint="/chat-messages",
+                json_data=data,
+                stream=False
+            )
+            self._record_message_usage(span, response["result"])
+            result = ChatCompletionResponse.from_dict(response["result"])
+        except Exception as e:
+            span.end(error=e)
+            raise
+        span.end()
+        return result
+
+    async def file_upload(self, file_path: str, user: str) -> FileUploadResponse:
+        """
+        Upload an image file for use in messages. See ``AIApplication.file_upload``.
+        """
+        file_name, mime_type = self._upload_file_info(file_path, user)
+        content = await asyncio.to_thread(_read_file, file_path)
+
+        response = await self._send_file_request(
+            method="POST",
+            endpoint="/files/upload",
+            files={'file': (file_name, content, mime_type)},
+            data={'user': user}
+        )
+        return FileUploadResponse.from_dict(response["result"])
+
+    async def get_conversation_messages(self, user: str, conversation_id: str,
+                                        first_id: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get messages from a conversation. See ``AIApplication.get_conversation_messages``.
+        """
+        params = self._conversation_messages_params(user, conversation_id, first_id, limit)
+        response = await self._send_request(method="GET", endpoint="/messages", params=params)
+        return self._parse_conversation_messages(response["result"])
+
+    async def get_conversations(self, user: str, last_id: Optional[str] = None,
+                                limit: Optional[int] = None, pinned: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Retrieve the conversation list for a user. See ``AIApplication.get_conversations``.
+        """
+        params = self._conversations_params(user, last_id, limit, pinned)
+        response = await self._send_request(method="GET", endpoint="/conversations", params=params)
+        return self._parse_conversations(response["result"])
+
+    async def send_message_feedback(self, message_id: str, user: str, rating: str) -> Dict[str, str]:
+        """
+        Send feedback for a message. See ``AIApplication.send_message_feedback``.
+        """
+        data = self._feedback_data(message_id, user, rating)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/messages/{message_id}/feedbacks",
+            json_data=data
+        )
+        return response["result"]
+
+    async def rename_conversation(self, conversation_id: str, user: str, name: Optional[str] = None,
+                                  auto_generate: bool = False) -> Conversation:
+        """
+        Rename a conversation. See ``AIApplication.rename_conversation``.
+        """
+        data = self._rename_conversation_data(conversation_id, user, name, auto_generate)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/conversations/{conversation_id}/name",
+            json_data=data
+        )
+        return Conversation(**response["result"])
+
+    async def stop_generate_message(self, task_id: str, user: str) -> Dict[str, str]:
+        """
+        Stop generating a streaming message. See ``AIApplication.stop_generate_message``.
+        """
+        data = self._stop_generate_data(task_id, user)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/chat-messages/{task_id}/stop",
+            json_data=data
+        )
+        return response["result"]
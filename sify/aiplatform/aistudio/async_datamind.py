@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
+
+from sify.aiplatform.aistudio.datamind import DataMind
+from sify.aiplatform.aistudio.types import ProcessRule, DocumentResponse, BatchStatus, ListDocumentsResponse, DatasetResponse, ListKnowledgeResponse, BatchStatusResponse
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, AsyncHTTPTransport, get_async_transport
+from sify.aiplatform.transport.concurrency import limited_request_async
+from sify.aiplatform.transport.async_transport import httpx
+
+
+def _read_file(file_path: str) -> bytes:
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+class AsyncDataMind(DataMind):
+    """
+    asyncio counterpart of ``DataMind``.
+
+    Methods take the same arguments and return the same types from
+    ``aistudio/types.py`` but are coroutines, so document ingestion and
+    status polling can be fanned out with ``asyncio.gather``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        transport: Optional[AsyncHTTPTransport] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
+        """
+        Initialize the AsyncDataMind client with the base URL and API key.
+
+        Args:
+            base_url (str): The base URL of the DataMind API (e.g., https://copilot-dev.sifymdp.digital/v1).
+            api_key (str): The API key for authentication.
+            transport (Optional[AsyncHTTPTransport]): Pooled async transport to use. Defaults to the shared one.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive cap on requests in flight.
+
+        Raises:
+            ValueError: If base_url or api_key is empty or invalid.
+        """
+        super().__init__(base_url, api_key, concurrency_limiter=concurrency_limiter)
+        self.transport = transport or get_async_transport()
+
+    async def _send_request(self, method: str, endpoint: str, json_data: Dict[str, Any] = None,
+                            params: Dict[str, Any] = None, files: Dict[str, Any] = None) -> Dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+        # httpx rejects None header values; it sets the multipart content type itself
+        headers = {key: value for key, value in self._headers(files).items() if value is not None}
+
+        try:
+            response = await limited_request_async(
+                self.concurrency_limiter,
+                self.transport.request,
+                method=method,
+                url=url,
+                endpoint=endpoint,
+                json=json_data,
+                params=params,
+                headers=headers,
+                files=files
+            )
+            self._raise_for_status(response)
+            return self._parse_result(response)
+
+        except httpx.HTTPError as e:
+            self._raise_request_error(e)
+
+    async def _send_file(self, endpoint: str, file_path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        content = await asyncio.to_thread(_read_file, file_path)
+        files = {
+            'data': (None, json.dumps(data), 'text/plain'),
+            'file': (os.path.basename(file_path), content)
+        }
+        return await self._send_request(method="POST", endpoint=endpoint, files=files)
+
+    async def create_document_from_text(self, dataset_id: str, name: str, text: str,
+                                        indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
+        """
+        Create a document in a dataset from text content. See ``DataMind.create_document_from_text``.
+        """
+        data = self._document_text_data(dataset_id, name, text, indexing_technique, process_rule)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/datasets/{dataset_id}/document/create_by_text",
+            json_data=data
+        )
+        return self._document_response(response["result"])
+
+    async def create_document_from_file(self, dataset_id: str, file_path: str,
+                                        indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
+        """
+        Create a document in a dataset from a file. See ``DataMind.create_document_from_file``.
+        """
+        data = self._document_file_data(dataset_id, file_path, indexing_technique, process_rule)
+        response = await self._send_file(f"/datasets/{dataset_id}/document/create_by_file", file_path, data)
+        return self._document_response(response["result"])
+
+    async def create_knowledge(self, name: str) -> DatasetResponse:
+        """
+        Create a new empty knowledge dataset. See ``DataMind.create_knowledge``.
+        """
+        self._validate_required_params({"name": name})
+        response = await self._send_request(method="POST", endpoint="/datasets", json_data={"name": name})
+        return DatasetResponse(**response["result"])
+
+    async def list_knowledge(self, page: int = 1, limit: int = 20) -> ListKnowledgeResponse:
+        """
+        List all knowledge datasets. See ``DataMind.list_knowledge``.
+        """
+        if page < 1 or limit < 1:
+            raise ValueError("Page and limit must be greater than 0")
+        params = {
+            "page": page,
+            "limit": limit
+        }
+        response = await self._send_request(method="GET", endpoint="/datasets", params=params)
+        return self._list_knowledge_response(response["result"])
+
+    async def delete_knowledge(self, dataset_id: str):
+        """
+        Delete a knowledge dataset. See ``DataMind.delete_knowledge``.
+        """
+        self._validate_required_params({"dataset_id": dataset_id})
+        response = await self._send_request(method="DELETE", endpoint=f"/datasets/{dataset_id}")
+        return self._delete_status(response)
+
+    async def update_document_text(self, dataset_id: str, document_id: str, name: str, text: str) -> DocumentResponse:
+        """
+        Update a document with new text content. See ``DataMind.update_document_text``.
+        """
+        self._validate_required_params({"dataset_id": dataset_id,
+                                       "document_id": document_id,
+                                       "name": name,
+                                       "text": text})
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_text",
+            json_data={"name": name, "text": text}
+        )
+        return self._document_response(response["result"])
+
+    async def update_document_file(self, dataset_id: str, document_id: str, file_path: str) -> DocumentResponse:
+        """
+        Update a document with a new file. See ``DataMind.update_document_file``.
+        """
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "document_id": document_id,
+            "file_path": file_path
+        })
+        data = {
+            "indexing_technique": "high_quality",
+            "process_rule": self._default_file_process_rule().to_dict()
+        }
+        response = await self._send_file(
+            f"/datasets/{dataset_id}/documents/{document_id}/update_by_file", file_path, data
+        )
+        return self._document_response(response["result"])
+
+    async def delete_document(self, dataset_id: str, document_id: str) -> str:
+        """
+        Delete a document from a dataset. See ``DataMind.delete_document``.
+        """
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "document_id": document_id
+        })
+        response = await self._send_request(
+            method="DELETE",
+            endpoint=f"/datasets/{dataset_id}/documents/{document_id}"
+        )
+        return response["result"]["result"]
+
+    async def get_embedding_status(self, dataset_id: str, batch: str) -> BatchStatusResponse:
+        """
+        Get the indexing status of a batch of documents. See ``DataMind.get_embedding_status``.
+        """
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "batch": batch
+        })
+        response = await self._send_request(
+            method="GET",
+            endpoint=f"/datasets/{dataset_id}/documents/{batch}/indexing-status"
+        )
+        return BatchStatusResponse(
+            data=[BatchStatus(**status) for status in response["result"]["data"]]
+        )
+
+    async def list_documents(self, dataset_id: str) -> ListDocumentsResponse:
+        """
+        List all documents in a dataset. See ``DataMind.list_documents``.
+        """
+        self._validate_required_params({"dataset_id": dataset_id})
+        response = await self._send_request(
+            method="GET",
+            endpoint=f"/datasets/{dataset_id}/documents"
+        )
+        return self._list_documents_response(response["result"])
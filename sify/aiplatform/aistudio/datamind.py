@@ -2,15 +2,33 @@ import requests
 import json
 from typing import Dict, Any, Optional
 from sify.aiplatform.aistudio.types import ProcessRule, DocumentResponse, Document, SegmentationRule, PreProcessingRule, Dataset, BatchStatus, ListDocumentsResponse, DatasetResponse, ListKnowledgeResponse, BatchStatusResponse
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, HTTPTransport, get_transport
+from sify.aiplatform.transport.concurrency import limited_request
+from sify.aiplatform.transport.errors import (
+    CONNECTION_ERRORS,
+    TIMEOUT_ERRORS,
+    APIConnectionError,
+    APIRequestError,
+    APITimeoutError,
+    error_for_status,
+)
 
 class DataMind:
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        transport: Optional[HTTPTransport] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
         """
         Initialize the DataMind client with the base URL and API key.
 
         Args:
             base_url (str): The base URL of the DataMind API (e.g., https://copilot-dev.sifymdp.digital/v1).
             api_key (str): The API key for authentication.
+            transport (Optional[HTTPTransport]): Pooled HTTP transport to use. Defaults to the shared transport.
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Adaptive cap on requests in flight.
 
         Raises:
             ValueError: If base_url or api_key is empty or invalid.
@@ -22,65 +40,167 @@ class DataMind:
         
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        self.transport = transport or get_transport()
+        self.concurrency_limiter = concurrency_limiter
 
-    def _send_request(self, method: str, endpoint: str, json_data: Dict[str, Any] = None, 
-                     params: Dict[str, Any] = None, files: Dict[str, Any] = None) -> Dict[str, Any]:
-        headers = {
+    def _headers(self, files: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json" if not files else None
         }
 
+    @staticmethod
+    def _raise_for_status(response) -> None:
+        if response.status_code >= 400:
+            reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+            error_msg = f"{response.status_code} {reason}"
+            try:
+                error_response = response.json()
+                if 'message' in error_response and isinstance(error_response['message'], str):
+                    error_msg = error_response['message']
+            except json.JSONDecodeError:
+                if response.status_code == 404:
+                    error_msg = reason
+                elif 'text/html' in response.headers.get('Content-Type', ''):
+                    error_msg = f"HTML Error: {response.text[:100]}"
+                else:
+                    error_msg = response.text if response.text else "Non-JSON Error"
+            raise error_for_status(response.status_code, error_msg, retries=getattr(response, "retries", 0))
+
+    @staticmethod
+    def _parse_result(response) -> Dict[str, Any]:
+        try:
+            result = response.json()
+        except json.JSONDecodeError:
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                result = f"HTML Response: {response.text[:100]}"
+            else:
+                result = response.text if response.text else "Non-JSON Response"
+        return {"status_code": response.status_code, "result": result}
+
+    @staticmethod
+    def _raise_request_error(e: Exception) -> None:
+        retries = getattr(e, "retries", 0)
+        if isinstance(e, TIMEOUT_ERRORS):
+            raise APITimeoutError("Request timeout", retries=retries) from e
+        elif isinstance(e, CONNECTION_ERRORS):
+            raise APIConnectionError("Connection error", retries=retries) from e
+        else:
+            raise APIRequestError("Something Went Wrong", retries=retries) from e
+
+    def _send_request(self, method: str, endpoint: str, json_data: Dict[str, Any] = None, 
+                     params: Dict[str, Any] = None, files: Dict[str, Any] = None) -> Dict[str, Any]:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = limited_request(
+                self.concurrency_limiter,
+                self.transport.request,
                 method=method,
                 url=url,
+                endpoint=endpoint,
                 json=json_data,
                 params=params,
-                headers=headers,
-                files=files,
-                timeout=300
+                headers=self._headers(files),
+                files=files
             )
-            if response.status_code >= 400:
-                error_msg = f"{response.status_code} {response.reason}"
-                try:
-                    error_response = response.json()
-                    if 'message' in error_response and isinstance(error_response['message'], str):
-                        error_msg = error_response['message']
-                except json.JSONDecodeError:
-                    if response.status_code == 404:
-                        error_msg = response.reason
-                    elif 'text/html' in response.headers.get('Content-Type', ''):
-                        error_msg = f"HTML Error: {response.text[:100]}"
-                    else:
-                        error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
-
-            try:
-                result = response.json()
-            except json.JSONDecodeError:
-                if 'text/html' in response.headers.get('Content-Type', ''):
-                    result = f"HTML Response: {response.text[:100]}"
-                else:
-                    result = response.text if response.text else "Non-JSON Response"
-            return {"status_code": response.status_code, "result": result}
+            self._raise_for_status(response)
+            return self._parse_result(response)
 
         except requests.RequestException as e:
-            error_msg = str(e).lower()
-            if "timeout" in error_msg:
-                error_msg = "Request timeout"
-            elif "connection" in error_msg:
-                error_msg = "Connection error"
-            else:
-                error_msg = "Something Went Wrong"
-            raise ValueError(error_msg)
+            self._raise_request_error(e)
         
     def _validate_required_params(self, params: Dict[str, Any]) -> None:
         for param_name, param_value in params.items():
             if not param_value:
                 raise ValueError(f"{param_name} must not be empty")
 
+    @staticmethod
+    def _default_file_process_rule() -> ProcessRule:
+        return ProcessRule(
+            mode="custom",
+            rules={
+                "pre_processing_rules": [
+                    PreProcessingRule(id="remove_extra_spaces", enabled=True),
+                    PreProcessingRule(id="remove_urls_emails", enabled=True)
+                ],
+                "segmentation": SegmentationRule(separator="###", max_tokens=500)
+            }
+        )
+
+    def _document_text_data(self, dataset_id: str, name: str, text: str,
+                            indexing_technique: str, process_rule: Optional[ProcessRule]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "name": name,
+            "text": text
+        })
+
+        if process_rule is None:
+            process_rule = ProcessRule(mode="automatic")
+
+        return {
+            "name": name,
+            "text": text,
+            "indexing_technique": indexing_technique,
+            "process_rule": process_rule.to_dict()
+        }
+
+    def _document_file_data(self, dataset_id: str, file_path: str,
+                            indexing_technique: str, process_rule: Optional[ProcessRule]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "file_path": file_path
+        })
+        if process_rule is None:
+            process_rule = self._default_file_process_rule()
+            
+        return {
+            "indexing_technique": indexing_technique,
+            "process_rule": process_rule.to_dict()
+        }
+
+    @staticmethod
+    def _document_response(result: Dict[str, Any]) -> DocumentResponse:
+        return DocumentResponse(
+            document=Document(**result["document"]),
+            batch=result["batch"]
+        )
+
+    @staticmethod
+    def _list_knowledge_response(result: Dict[str, Any]) -> ListKnowledgeResponse:
+        return ListKnowledgeResponse(
+            data=[Dataset(**dataset) for dataset in result["data"]],
+            has_more=result["has_more"],
+            limit=result["limit"],
+            total=result["total"],
+            page=result["page"]
+        )
+
+    @staticmethod
+    def _delete_status(response: Dict[str, Any]) -> str:
+        result = response["result"]
+        # Handle both string and dict responses, and 204 No Content
+        if response.get("status_code") == 204 or result == "No Content":
+            status = "success"   
+        else:
+            status = "Something Went Wrong while deleteing"
+        return status
+
+    @staticmethod
+    def _list_documents_response(result: Dict[str, Any]) -> ListDocumentsResponse:
+        required_fields = ["data", "has_more", "limit", "total", "page"]
+        for field in required_fields:
+            if field not in result:
+                raise ValueError(f"Missing required field '{field}' in API response: {result}")
+        return ListDocumentsResponse(
+            data=[Document(**doc) for doc in result["data"]],
+            has_more=result["has_more"],
+            limit=result["limit"],
+            total=result["total"],
+            page=result["page"]
+        )
+
     def create_document_from_text(self, dataset_id: str, name: str, text: str, 
                                  indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
         """
@@ -120,31 +240,14 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, name, or text is empty, or Output request fails.
         """
-        self._validate_required_params({
-            "dataset_id": dataset_id,
-            "name": name,
-            "text": text
-        })
-
-        if process_rule is None:
-            process_rule = ProcessRule(mode="automatic")
-
-        data = {
-            "name": name,
-            "text": text,
-            "indexing_technique": indexing_technique,
-            "process_rule": process_rule.to_dict()
-        }
+        data = self._document_text_data(dataset_id, name, text, indexing_technique, process_rule)
         
         response = self._send_request(
             method="POST", 
             endpoint=f"/datasets/{dataset_id}/document/create_by_text", 
             json_data=data
         )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._document_response(response["result"])
 
     def create_document_from_file(self, dataset_id: str, file_path: str,
                                  indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
@@ -185,26 +288,7 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, file_path, or name is empty, or Output request fails.
         """
-        self._validate_required_params({
-            "dataset_id": dataset_id,
-            "file_path": file_path
-        })
-        if process_rule is None:
-            process_rule = ProcessRule(
-                mode="custom",
-                rules={
-                    "pre_processing_rules": [
-                        PreProcessingRule(id="remove_extra_spaces", enabled=True),
-                        PreProcessingRule(id="remove_urls_emails", enabled=True)
-                    ],
-                    "segmentation": SegmentationRule(separator="###", max_tokens=500)
-                }
-            )
-            
-        data = {
-            "indexing_technique": indexing_technique,
-            "process_rule": process_rule.to_dict()
-        }
+        data = self._document_file_data(dataset_id, file_path, indexing_technique, process_rule)
         
         with open(file_path, 'rb') as file:
             files = {
@@ -216,10 +300,7 @@ class DataMind:
                 endpoint=f"/datasets/{dataset_id}/document/create_by_file",
                 files=files
             )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._document_response(response["result"])
 
     def create_knowledge(self, name: str) -> DatasetResponse:
         """
@@ -294,13 +375,7 @@ class DataMind:
             "limit": limit
         }
         response = self._send_request(method="GET", endpoint="/datasets", params=params)
-        return ListKnowledgeResponse(
-            data=[Dataset(**dataset) for dataset in response["result"]["data"]],
-            has_more=response["result"]["has_more"],
-            limit=response["result"]["limit"],
-            total=response["result"]["total"],
-            page=response["result"]["page"]
-        )
+        return self._list_knowledge_response(response["result"])
 
     def delete_knowledge(self, dataset_id: str):
         """
@@ -318,13 +393,7 @@ class DataMind:
         """
         self._validate_required_params({"dataset_id": dataset_id})
         response = self._send_request(method="DELETE", endpoint=f"/datasets/{dataset_id}")
-        result = response["result"]
-        # Handle both string and dict responses, and 204 No Content
-        if response.get("status_code") == 204 or result == "No Content":
-            status = "success"   
-        else:
-            status = "Something Went Wrong while deleteing"
-        return status
+        return self._delete_status(response)
 
     def update_document_text(self, dataset_id: str, document_id: str, name: str, text: str) -> DocumentResponse:
         """
@@ -377,10 +446,7 @@ class DataMind:
             endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_text",
             json_data=data
         )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._document_response(response["result"])
 
     def update_document_file(self, dataset_id: str, document_id: str, file_path: str) -> DocumentResponse:
         """
@@ -427,16 +493,7 @@ class DataMind:
 
         data = {
             "indexing_technique": "high_quality",
-            "process_rule": ProcessRule(
-                mode="custom",
-                rules={
-                    "pre_processing_rules": [
-                        PreProcessingRule(id="remove_extra_spaces", enabled=True),
-                        PreProcessingRule(id="remove_urls_emails", enabled=True)
-                    ],
-                    "segmentation": SegmentationRule(separator="###", max_tokens=500)
-                }
-            ).to_dict()
+            "process_rule": self._default_file_process_rule().to_dict()
         }
         
         with open(file_path, 'rb') as file:
@@ -449,10 +506,7 @@ class DataMind:
                 endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_file",
                 files=files
             )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._document_response(response["result"])
 
     def delete_document(self, dataset_id: str, document_id: str) -> str:
         """
@@ -566,15 +620,4 @@ class DataMind:
             method="GET",
             endpoint=f"/datasets/{dataset_id}/documents"
         )
-        result = response["result"]
-        required_fields = ["data", "has_more", "limit", "total", "page"]
-        for field in required_fields:
-            if field not in result:
-                raise ValueError(f"Missing required field '{field}' in API response: {result}")
-        return ListDocumentsResponse(
-            data=[Document(**doc) for doc in result["data"]],
-            has_more=result["has_more"],
-            limit=result["limit"],
-            total=result["total"],
-            page=result["page"]
-        )
+        return self._list_documents_response(response["result"])
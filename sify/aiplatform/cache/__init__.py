@@ -0,0 +1,11 @@
+from .lru import LRUCache
+from .sqlite_store import SQLiteStore
+from .embedding_cache import EmbeddingCache
+from .response_cache import ResponseCache
+
+__all__ = [
+    "LRUCache",
+    "SQLiteStore",
+    "EmbeddingCache",
+    "ResponseCache",
+]
@@ -0,0 +1,101 @@
+import array
+import base64
+import hashlib
+from typing import Dict, List, Optional
+
+from sify.aiplatform.cache.lru import LRUCache
+from sify.aiplatform.cache.sqlite_store import SQLiteStore
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache keyed by (model_id, dimensions, sha256(text)).
+
+    Vectors are stored as packed float32 bytes: an in-memory LRU tier in
+    front of an optional SQLite tier on disk, each bounded by size. Disk
+    hits are promoted into memory. ``stats()`` reports hit/miss counters.
+    """
+
+    def __init__(
+        self,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[str] = None,
+        disk_max_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.memory = LRUCache(memory_max_bytes)
+        self.disk = SQLiteStore(path, disk_max_bytes) if path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model_id: str, dimensions: Optional[int], text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model_id}:{dimensions or ''}:{digest}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.disk_hits += 1
+                self.memory.put(key, value)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def get_many(self, model_id: str, dimensions: Optional[int], texts: List[str]) -> Dict[str, bytes]:
+        """Return ``{text: packed_vector}`` for the texts that are cached."""
+        found = {}
+        for text in dict.fromkeys(texts):
+            value = self.get(self.key(model_id, dimensions, text))
+            if value is not None:
+                found[text] = value
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size_bytes,
+            "memory_evictions": self.memory.evictions,
+            "disk_bytes": self.disk.size_bytes if self.disk is not None else 0,
+            "disk_evictions": self.disk.evictions if self.disk is not None else 0,
+        }
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+def pack_vector(embedding) -> bytes:
+    """Pack a float list or a base64 float32 string into little-endian float32 bytes."""
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    packed = array.array("f", embedding)
+    if packed.itemsize != 4:
+        raise ValueError("float32 array support is required")
+    if array.array("H", [1]).tobytes()[0] != 1:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(value: bytes, encoding_format: Optional[str] = None):
+    """Inverse of ``pack_vector`` in the caller's requested encoding."""
+    if encoding_format == "base64":
+        return base64.b64encode(value).decode("ascii")
+    unpacked = array.array("f")
+    unpacked.frombytes(value)
+    if array.array("H", [1]).tobytes()[0] != 1:
+        unpacked.byteswap()
+    return unpacked.tolist()
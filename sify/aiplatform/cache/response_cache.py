@@ -0,0 +1,118 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from sify.aiplatform.cache.lru import LRUCache
+from sify.aiplatform.cache.sqlite_store import SQLiteStore
+
+# Request fields that change how a response is delivered but not its content.
+_TRANSPORT_FIELDS = ("stream", "stream_options")
+
+
+class ResponseCache:
+    """
+    Exact-match cache for chat_completion and completion responses.
+
+    Entries are keyed by a canonical hash of the endpoint and request body
+    (which includes the model id) and hold the full, non-streamed response.
+    The backing store is pluggable: an in-memory ``LRUCache`` by default, a
+    ``SQLiteStore`` when ``path`` is given, or any object passed as
+    ``store`` that implements ``get``/``put``/``delete``/``clear`` on bytes.
+
+    By default only deterministic requests (``temperature=0``) are cached.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[str] = None,
+        store: Any = None,
+        deterministic_only: bool = True,
+    ):
+        if store is None:
+            store = SQLiteStore(path, max_bytes) if path else LRUCache(max_bytes)
+        self.store = store
+        self.ttl = ttl
+        self.deterministic_only = deterministic_only
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def cacheable(self, data: Dict[str, Any]) -> bool:
+        if not self.deterministic_only:
+            return True
+        temperature = data.get("temperature")
+        return temperature is not None and float(temperature) == 0.0
+
+    @staticmethod
+    def key(endpoint: str, data: Dict[str, Any]) -> str:
+        body = {k: v for k, v in data.items() if k not in _TRANSPORT_FIELDS}
+        canonical = json.dumps(
+            [endpoint, body], sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.store.get(key)
+        if value is not None:
+            entry = json.loads(value)
+            expires_at = entry.get("expires_at")
+            if expires_at is None or expires_at > time.time():
+                self.hits += 1
+                return entry["result"]
+            self.store.delete(key)
+            self.expired += 1
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        entry = {"expires_at": expires_at, "result": result}
+        self.store.put(key, json.dumps(entry, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "bytes": self.store.size_bytes,
+        }
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+# ------------------------------------------------------------------
+# Replaying cached responses as streams
+# ------------------------------------------------------------------
+def response_to_chunks(result: Dict[str, Any], chat: bool = True) -> List[Dict[str, Any]]:
+    """Split a cached response into chunk dicts replaying it as a stream."""
+    header = {
+        "id": result.get("id", ""),
+        "object": "chat.completion.chunk" if chat else "text_completion",
+        "created": result.get("created", 0),
+        "model": result.get("model", ""),
+    }
+    chunks = []
+    for choice in result.get("choices", []):
+        if chat:
+            message = choice.get("message", {})
+            delta = {"role": message.get("role", "assistant"), "content": message.get("content")}
+            if message.get("tool_calls"):
+                delta["tool_calls"] = [
+                    {"index": i, **call} for i, call in enumerate(message["tool_calls"])
+                ]
+            body = {"index": choice["index"], "delta": delta, "finish_reason": None}
+        else:
+            body = {"index": choice["index"], "text": choice.get("text", ""), "finish_reason": None}
+        chunks.append({**header, "choices": [body]})
+        chunks.append({
+            **header,
+            "choices": [{"index": choice["index"], **({"delta": {}} if chat else {"text": ""}),
+                         "finish_reason": choice.get("finish_reason")}],
+        })
+    if result.get("usage"):
+        chunks.append({**header, "choices": [], "usage": result["usage"]})
+    return chunks
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# Least recently accessed entries deleted per statement while evicting.
+_EVICT_BATCH = 64
+
+
+class SQLiteStore:
+    """
+    On-disk key/value store in a single SQLite file, bounded by total value
+    size. Least recently accessed entries are evicted first. Safe to share
+    between threads of one process.
+
+    Reads do not write: access times are buffered and saved in one
+    transaction every ``touch_batch`` hits, before eviction and on
+    ``close()``. A crash loses only the buffered recency updates.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 1024 * 1024 * 1024, touch_batch: int = 64):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_batch = touch_batch
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._lock = threading.Lock()
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        # key -> access time not yet written to the database.
+        self._touched: Dict[str, float] = {}
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touches()
+            return bytes(row[0])
+
+    def _flush_touches(self) -> None:
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?", [(at, key) for key, at in touched.items()]
+            )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def put(self, key: str, value: bytes) -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), size, time.time()),
+            )
+            self._touched.pop(key, None)
+            self._bytes += size - (row[0] if row else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Trim to 90% so eviction doesn't run on every subsequent put.
+        target = int(self.max_bytes * 0.9)
+        self._flush_touches()
+        while self._bytes > target:
+            sizes = self._conn.execute(
+                "SELECT size FROM entries ORDER BY accessed LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not sizes:
+                break
+            count = 0
+            for (size,) in sizes:
+                if self._bytes <= target:
+                    break
+                self._bytes -= size
+                count += 1
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)", (count,)
+            )
+            self.evictions += count
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._bytes -= row[0]
+            self._touched.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._bytes = 0
+            self._touched.clear()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
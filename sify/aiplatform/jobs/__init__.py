@@ -0,0 +1,7 @@
+from .runner import ENDPOINTS, BatchJob, BatchJobSummary
+
+__all__ = [
+    "ENDPOINTS",
+    "BatchJob",
+    "BatchJobSummary",
+]
@@ -0,0 +1,94 @@
+"""
+Command line entry point for ``BatchJob``::
+
+    sify-batch requests.jsonl results.jsonl --model my-model --concurrency 16
+
+Rerunning the same command resumes from the checkpoint.
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from sify.aiplatform.jobs.runner import BatchJob, BatchJobSummary
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, RateLimiter
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sify-batch",
+        description="Run a JSONL file of MaaS requests concurrently, resuming from a checkpoint.",
+    )
+    parser.add_argument("input", help="JSONL file of requests ({custom_id, url, body} per line)")
+    parser.add_argument("output", help="JSONL file results are appended to")
+    parser.add_argument("--api-key", default=os.getenv("SIFY_API_KEY"), help="API key (default: $SIFY_API_KEY)")
+    parser.add_argument("--model", help="model used when a request body has none")
+    parser.add_argument("--base-url", help="override the MaaS base URL")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.ckpt)")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight (default: 8)")
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="start low and adapt concurrency to server latency and 429/503s, up to --concurrency",
+    )
+    parser.add_argument("--requests-per-second", type=float, help="client-side request rate limit")
+    parser.add_argument("--tokens-per-minute", type=float, help="client-side token rate limit")
+    parser.add_argument("--retry-errors", action="store_true", help="retry requests that failed in a previous run")
+    parser.add_argument("--input-price", type=float, help="cost per million prompt tokens")
+    parser.add_argument("--output-price", type=float, help="cost per million completion tokens")
+    parser.add_argument("--progress-interval", type=float, default=10.0, help="seconds between progress lines")
+    return parser
+
+
+def _print_progress(summary: BatchJobSummary) -> None:
+    cost = f", cost {summary.cost:.4f}" if summary.cost is not None else ""
+    print(
+        f"[progress] {summary.completed} done ({summary.failed} failed), "
+        f"{summary.requests_per_second:.2f} req/s, {summary.total_tokens} tokens{cost}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    if not args.api_key:
+        print("sify-batch: an API key is required (--api-key or $SIFY_API_KEY)", file=sys.stderr)
+        return 2
+
+    rate_limiter = None
+    if args.requests_per_second or args.tokens_per_minute:
+        rate_limiter = RateLimiter(args.requests_per_second, args.tokens_per_minute)
+    concurrency_limiter = None
+    if args.adaptive:
+        concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=min(4, args.concurrency), max_limit=args.concurrency, name="sify-batch"
+        )
+    client = ModelAsAService(
+        args.api_key, args.model, rate_limiter=rate_limiter, concurrency_limiter=concurrency_limiter
+    )
+    if args.base_url:
+        client.base_url = args.base_url.rstrip("/")
+
+    job = BatchJob(
+        client,
+        args.input,
+        args.output,
+        checkpoint_path=args.checkpoint,
+        max_concurrency=args.concurrency,
+        retry_errors=args.retry_errors,
+        input_cost_per_million=args.input_price,
+        output_cost_per_million=args.output_price,
+        progress=_print_progress,
+        progress_interval=args.progress_interval,
+    )
+    try:
+        summary = job.run()
+    except KeyboardInterrupt:
+        print("interrupted; rerun the same command to resume", file=sys.stderr)
+        return 130
+    print(summary)
+    return 1 if summary.failed else 0
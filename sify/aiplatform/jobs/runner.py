@@ -0,0 +1,291 @@
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from sify.aiplatform.models.batching import bounded_map
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+
+logger = logging.getLogger(__name__)
+
+# Request ``url`` -> client method taking the request body.
+ENDPOINTS: Dict[str, Callable[[ModelAsAService, Dict[str, Any]], Any]] = {
+    "/v1/chat/completions": lambda client, body: client.chat_completion(body.pop("messages"), **body),
+    "/v1/completions": lambda client, body: client.completion(body.pop("prompt"), **body),
+    "/v1/embeddings": lambda client, body: client.create_embeddings(body.pop("input"), **body),
+    "/v1/rerank": lambda client, body: client.rerank(body.pop("query"), body.pop("documents"), **body),
+}
+
+
+class BatchJobSummary:
+    """Throughput, error and cost totals for one ``BatchJob.run``."""
+
+    def __init__(self):
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.cost: Optional[float] = None
+        self.errors: Counter = Counter()
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.total_tokens / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed": self.elapsed,
+            "requests_per_second": self.requests_per_second,
+            "tokens_per_second": self.tokens_per_second,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost": self.cost,
+            "errors": dict(self.errors),
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            f"completed {self.completed} ({self.succeeded} ok, {self.failed} failed, "
+            f"{self.skipped} skipped from checkpoint) in {self.elapsed:.1f}s",
+            f"throughput {self.requests_per_second:.2f} req/s, {self.tokens_per_second:.0f} tokens/s",
+            f"tokens {self.total_tokens} (prompt {self.prompt_tokens}, completion {self.completion_tokens})",
+        ]
+        if self.cost is not None:
+            lines.append(f"cost {self.cost:.4f}")
+        for error, count in self.errors.most_common():
+            lines.append(f"error {error}: {count}")
+        return "\n".join(lines)
+
+
+def _truncate_partial_line(path: str) -> None:
+    """Drop a final line left unterminated by a crash mid-write."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        # Scan back in blocks for the last newline.
+        pos = size
+        while pos > 0:
+            start = max(0, pos - 65536)
+            f.seek(start)
+            block = f.read(pos - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                f.truncate(start + newline + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+class BatchJob:
+    """
+    Resumable runner for a JSONL file of MaaS requests.
+
+    Each input line is a request in the OpenAI batch format::
+
+        {"custom_id": "q-1", "url": "/v1/chat/completions",
+         "body": {"model": "...", "messages": [...], "temperature": 0}}
+
+    Supported urls are the keys of ``ENDPOINTS``. The body's ``model`` picks
+    the client; all clients share the transport (retries, connection pool),
+    rate limiter and concurrency limiter of ``client``. Requests run
+    ``max_concurrency`` at a time, fewer while an adaptive concurrency
+    limiter backs off, and each result is appended to ``output_path`` as::
+
+        {"custom_id": "q-1", "response": {...}, "error": null}
+
+    Every finished ``custom_id`` is also appended to a checkpoint file
+    (``output_path + ".ckpt"`` by default) after its output line is
+    written. A rerun skips ids already in the checkpoint, and with
+    ``retry_errors`` it retries ids that failed. A crash can repeat at most
+    the requests in flight at that moment, so key output by ``custom_id``.
+    """
+
+    def __init__(
+        self,
+        client: ModelAsAService,
+        input_path: str,
+        output_path: str,
+        checkpoint_path: Optional[str] = None,
+        max_concurrency: int = 8,
+        retry_errors: bool = False,
+        input_cost_per_million: Optional[float] = None,
+        output_cost_per_million: Optional[float] = None,
+        progress: Optional[Callable[[BatchJobSummary], None]] = None,
+        progress_interval: float = 10.0,
+    ):
+        self.client = client
+        self.input_path = input_path
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or output_path + ".ckpt"
+        self.max_concurrency = max_concurrency
+        self.retry_errors = retry_errors
+        self.input_cost_per_million = input_cost_per_million
+        self.output_cost_per_million = output_cost_per_million
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self._clients: Dict[Optional[str], ModelAsAService] = {client.model_id: client}
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+    def load_checkpoint(self) -> Tuple[Set[str], Set[str]]:
+        """Return the ids recorded as succeeded and as failed."""
+        succeeded: Set[str] = set()
+        failed: Set[str] = set()
+        if not os.path.exists(self.checkpoint_path):
+            return succeeded, failed
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            for line in f:
+                status, _, custom_id = line.rstrip("\n").partition("\t")
+                try:
+                    custom_id = json.loads(custom_id)
+                except ValueError:
+                    # Torn final line from a crash mid-write.
+                    continue
+                if status == "ok":
+                    succeeded.add(custom_id)
+                    failed.discard(custom_id)
+                else:
+                    failed.add(custom_id)
+        return succeeded, failed
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def _client_for(self, model: Optional[str]) -> ModelAsAService:
+        client = self._clients.get(model)
+        if client is None:
+            base = self.client
+            client = type(base)(
+                base.api_key,
+                model,
+                user_id=base.user_id,
+                session_id=base.session_id,
+                transport=base.transport,
+                rate_limiter=base.rate_limiter,
+                concurrency_limiter=base.concurrency_limiter,
+            )
+            client.base_url = base.base_url
+            self._clients[model] = client
+        return client
+
+    def _execute(self, request: Dict[str, Any]) -> Any:
+        if "error" in request:
+            raise ValueError(request["error"])
+        url = request.get("url", "/v1/chat/completions")
+        handler = ENDPOINTS.get(url)
+        if handler is None:
+            raise ValueError(f"Unsupported url: {url}")
+        body = dict(request.get("body") or {})
+        body.pop("stream", None)
+        return handler(self._client_for(body.pop("model", self.client.model_id)), body)
+
+    def _pending(self, skip: Set[str], summary: BatchJobSummary) -> Iterator[Dict[str, Any]]:
+        with open(self.input_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    custom_id = str(request.get("custom_id") or f"line-{line_no}")
+                except ValueError as e:
+                    request, custom_id = {"error": f"Invalid JSON on line {line_no}: {e}"}, f"line-{line_no}"
+                if custom_id in skip:
+                    summary.skipped += 1
+                    continue
+                request["custom_id"] = custom_id
+                yield request
+
+    def _record(self, summary: BatchJobSummary, response: Any) -> Dict[str, Any]:
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            prompt = getattr(usage, "prompt_tokens", 0) or 0
+            total = getattr(usage, "total_tokens", 0) or 0
+            completion = getattr(usage, "completion_tokens", None)
+            if completion is None:
+                completion = max(total - prompt, 0)
+            summary.prompt_tokens += prompt
+            summary.completion_tokens += completion
+            summary.total_tokens += total
+        return response.to_dict() if hasattr(response, "to_dict") else response
+
+    def _update_cost(self, summary: BatchJobSummary) -> None:
+        if self.input_cost_per_million is None and self.output_cost_per_million is None:
+            return
+        summary.cost = (
+            summary.prompt_tokens * (self.input_cost_per_million or 0.0)
+            + summary.completion_tokens * (self.output_cost_per_million or 0.0)
+        ) / 1_000_000
+
+    def run(self) -> BatchJobSummary:
+        summary = BatchJobSummary()
+        _truncate_partial_line(self.output_path)
+        _truncate_partial_line(self.checkpoint_path)
+        succeeded, failed = self.load_checkpoint()
+        skip = succeeded if self.retry_errors else succeeded | failed
+        next_progress = time.monotonic() + self.progress_interval
+
+        with open(self.output_path, "a", encoding="utf-8") as out, \
+                open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint:
+            results = bounded_map(self._execute, self._pending(skip, summary), self.max_concurrency, ordered=False)
+            for request, future in results:
+                custom_id = request["custom_id"]
+                error = future.exception()
+                if error is None:
+                    entry = {"custom_id": custom_id, "response": self._record(summary, future.result()), "error": None}
+                    summary.succeeded += 1
+                else:
+                    entry = {
+                        "custom_id": custom_id,
+                        "response": None,
+                        "error": {
+                            "type": type(error).__name__,
+                            "message": str(error),
+                            "status_code": getattr(error, "status_code", None),
+                        },
+                    }
+                    summary.failed += 1
+                    summary.errors[type(error).__name__] += 1
+
+                out.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+                checkpoint.write(f"{'ok' if error is None else 'err'}\t{json.dumps(custom_id)}\n")
+                checkpoint.flush()
+
+                if self.progress is not None and time.monotonic() >= next_progress:
+                    summary.elapsed = time.monotonic() - summary.started
+                    self._update_cost(summary)
+                    self.progress(summary)
+                    next_progress = time.monotonic() + self.progress_interval
+
+            os.fsync(out.fileno())
+            os.fsync(checkpoint.fileno())
+
+        summary.elapsed = time.monotonic() - summary.started
+        self._update_cost(summary)
+        return summary
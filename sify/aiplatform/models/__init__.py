@@ -1,4 +1,8 @@
 from .model_as_a_service import ModelAsAService
+from .async_model_as_a_service import AsyncModelAsAService
+from .streaming import StreamAccumulator, ResponseStream, AsyncResponseStream
+from .batching import BatchItem, BatchRun, AsyncBatchRun
+from .router import ModelRoute, ModelRouter, AsyncModelRouter
 from .api_types import (
     ModelInfo,
     ModelsListResponse,
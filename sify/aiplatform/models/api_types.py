@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Optional, Union
+import base64
 import json
 
 class ModelInfo:
@@ -58,12 +59,12 @@ class ModelsListResponse:
         return cls(models=models)
 
 class EmbeddingData:
-    """Individual embedding data."""
+    """Individual embedding data. ``embedding`` is a base64 string when requested with encoding_format="base64"."""
     object: str
-    embedding: List[float]
+    embedding: Union[List[float], str]
     index: int
 
-    def __init__(self, object: str, embedding: List[float], index: int):
+    def __init__(self, object: str, embedding: Union[List[float], str], index: int):
         self.object = object
         self.embedding = embedding
         self.index = index
@@ -126,6 +127,40 @@ class EmbeddingResponse:
             "usage": self.usage.to_dict()
         }
 
+    def as_array(self, dtype: str = "float32") -> "numpy.ndarray":
+        """
+        Return the embeddings as a contiguous (n, dim) numpy matrix ordered by index.
+
+        Base64 vectors (encoding_format="base64") are decoded straight into one
+        buffer and viewed with ``np.frombuffer``, so no per-float Python objects
+        are created. Float lists are converted with ``np.asarray``.
+        Requires numpy (``pip install sify-ai-platform[data]``).
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("as_array requires numpy. Install it with: pip install sify-ai-platform[data]")
+
+        items = sorted(self.data, key=lambda item: item.index)
+        if not items:
+            return np.empty((0, 0), dtype=dtype)
+        if not isinstance(items[0].embedding, str):
+            return np.asarray([item.embedding for item in items], dtype=dtype)
+
+        first = base64.b64decode(items[0].embedding)
+        row_bytes = len(first)
+        buffer = bytearray(row_bytes * len(items))
+        buffer[:row_bytes] = first
+        view = memoryview(buffer)
+        for row, item in enumerate(items[1:], start=1):
+            decoded = base64.b64decode(item.embedding)
+            if len(decoded) != row_bytes:
+                raise ValueError(f"Embedding {item.index} has {len(decoded)} bytes, expected {row_bytes}")
+            view[row * row_bytes:(row + 1) * row_bytes] = decoded
+        # base64 embeddings are little-endian float32 on the wire
+        matrix = np.frombuffer(buffer, dtype="<f4").reshape(len(items), row_bytes // 4)
+        return matrix if np.dtype(dtype) == matrix.dtype else matrix.astype(dtype)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingResponse":
         embedding_data = [EmbeddingData.from_dict(item) for item in data["data"]]
@@ -142,19 +177,23 @@ class ChatMessage:
     role: str
     content: str
 
-    def __init__(self, role: str, content: str):
+    def __init__(self, role: str, content: str, tool_calls: Optional[List[Dict[str, Any]]] = None):
         self.role = role
         self.content = content
+        self.tool_calls = tool_calls
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        result = {
             "role": self.role,
             "content": self.content
         }
+        if self.tool_calls:
+            result["tool_calls"] = self.tool_calls
+        return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChatMessage":
-        return cls(role=data["role"], content=data["content"])
+        return cls(role=data["role"], content=data.get("content"), tool_calls=data.get("tool_calls"))
 
 class ChatChoice:
     """Chat completion choice."""
@@ -216,10 +255,10 @@ class ChatCompletionResponse:
     created: int
     model: str
     choices: List[ChatChoice]
-    usage: ChatUsage
+    usage: Optional[ChatUsage]
 
     def __init__(self, id: str, object: str, created: int, model: str, 
-                 choices: List[ChatChoice], usage: ChatUsage):
+                 choices: List[ChatChoice], usage: Optional[ChatUsage]):
         self.id = id
         self.object = object
         self.created = created
@@ -234,13 +273,14 @@ class ChatCompletionResponse:
             "created": self.created,
             "model": self.model,
             "choices": [choice.to_dict() for choice in self.choices],
-            "usage": self.usage.to_dict()
+            "usage": self.usage.to_dict() if self.usage else None
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChatCompletionResponse":
         choices = [ChatChoice.from_dict(choice) for choice in data["choices"]]
-        usage = ChatUsage.from_dict(data["usage"])
+        # Streams only report usage when the server is asked to include it.
+        usage = ChatUsage.from_dict(data["usage"]) if data.get("usage") else None
         return cls(
             id=data["id"],
             object=data["object"],
@@ -506,10 +546,10 @@ class CompletionResponse:
     created: int
     model: str
     choices: List[CompletionChoice]
-    usage: CompletionUsage
+    usage: Optional[CompletionUsage]
 
     def __init__(self, id: str, object: str, created: int, model: str, 
-                 choices: List[CompletionChoice], usage: CompletionUsage):
+                 choices: List[CompletionChoice], usage: Optional[CompletionUsage]):
         self.id = id
         self.object = object
         self.created = created
@@ -524,13 +564,13 @@ class CompletionResponse:
             "created": self.created,
             "model": self.model,
             "choices": [choice.to_dict() for choice in self.choices],
-            "usage": self.usage.to_dict()
+            "usage": self.usage.to_dict() if self.usage else None
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CompletionResponse":
         choices = [CompletionChoice.from_dict(choice) for choice in data["choices"]]
-        usage = CompletionUsage.from_dict(data["usage"])
+        usage = CompletionUsage.from_dict(data["usage"]) if data.get("usage") else None
         return cls(
             id=data["id"],
             object=data["object"],
@@ -0,0 +1,538 @@
+from typing import Any, AsyncGenerator, BinaryIO, Dict, Iterable, List, Optional, Union
+
+from sify.aiplatform.models.api_types import (
+    ModelsListResponse,
+    EmbeddingResponse,
+    ChatCompletionResponse,
+    ChatCompletionChunk,
+    CompletionResponse,
+    CompletionChunk,
+    AudioTranscriptionResponse,
+    AudioTranslationResponse,
+    RerankResponse,
+)
+from sify.aiplatform.cache.embedding_cache import EmbeddingCache
+from sify.aiplatform.cache.response_cache import ResponseCache
+from sify.aiplatform.models.batching import AsyncBatchRun, abounded_map, iter_batches, merge_embedding_responses
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.models.streaming import AsyncResponseStream, StreamAccumulator
+from sify.aiplatform.observability.metrics import record_usage
+from sify.aiplatform.observability.stream_metrics import StreamStatsCallback, StreamTimer
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, AsyncHTTPTransport, RateLimiter, get_async_transport
+from sify.aiplatform.transport.concurrency import limited_request_async
+from sify.aiplatform.transport.ratelimit import estimate_tokens
+from sify.aiplatform.transport.singleflight import get_async_single_flight, request_key
+from sify.aiplatform.transport.sse import StreamDecodeError, aiter_sse_json
+from sify.aiplatform.transport.async_transport import httpx
+from sify.aiplatform.transport.errors import APIConnectionError, APITimeoutError
+
+
+class AsyncModelAsAService(ModelAsAService):
+    """
+    asyncio counterpart of ``ModelAsAService``.
+
+    Every public method has the same arguments and return types as the sync
+    client but is a coroutine. With ``stream=True``, ``chat_completion`` and
+    ``completion`` resolve to an async generator of chunks::
+
+        stream = await client.chat_completion(messages, stream=True)
+        async for chunk in stream:
+            ...
+
+    Validation, payload building and error mapping are inherited from
+    ``ModelAsAService``; only the I/O differs.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_id: str = None,
+        *,
+        user_id: str | None = None,
+        session_id: str | None = None,
+        transport: AsyncHTTPTransport | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        on_stream_stats: StreamStatsCallback | None = None,
+    ):
+        super().__init__(
+            api_key,
+            model_id,
+            user_id=user_id,
+            session_id=session_id,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            embedding_cache=embedding_cache,
+            response_cache=response_cache,
+            coalesce=coalesce,
+            on_stream_stats=on_stream_stats,
+        )
+        self.transport = transport or get_async_transport()
+        self.single_flight = get_async_single_flight() if coalesce else None
+
+    @staticmethod
+    async def _replay_stream(chunks: List[Any]) -> AsyncGenerator[Any, None]:
+        for chunk in chunks:
+            yield chunk
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        form_data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        return_binary: bool = False,
+        idempotent: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], AsyncGenerator[Dict[str, Any], None], bytes]:
+        request_kwargs = self._build_request(method, endpoint, json_data, params, files, form_data)
+
+        estimated = 0
+        if self.rate_limiter is not None:
+            estimated = estimate_tokens(json_data)
+            await self.rate_limiter.acquire_async(self._rate_limit_key(), estimated)
+
+        try:
+            response = await self._limited_request(
+                endpoint=endpoint, stream=stream, idempotent=idempotent, model=self.model_id, **request_kwargs
+            )
+            self._observe_rate_limits(response)
+            if stream:
+                if response.status_code >= 400:
+                    try:
+                        await response.aread()
+                    finally:
+                        await response.aclose()
+                    self._raise_for_status(response)
+                return self._handle_stream_response(response)
+
+            self._raise_for_status(response)
+            result = self._parse_response(response, return_binary)
+            self._settle_tokens(result, estimated)
+            record_usage(endpoint, self.model_id, self._usage_of(result))
+            return result
+
+        except httpx.TimeoutException as e:
+            raise APITimeoutError(
+                "Request timeout - the API took too long to respond", retries=getattr(e, "retries", 0)
+            ) from e
+        except httpx.TransportError as e:
+            raise APIConnectionError(
+                "Connection error - unable to reach the API", retries=getattr(e, "retries", 0)
+            ) from e
+        except httpx.HTTPError as e:
+            self._raise_request_error(e)
+
+    async def _limited_request(self, **kwargs) -> Any:
+        return await limited_request_async(self.concurrency_limiter, self.transport.request, **kwargs)
+
+    async def _coalesced_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if self.single_flight is None:
+            return await self._send_request(method, endpoint, json_data=json_data, **kwargs)
+        key = request_key(self.base_url, self.api_key, method, endpoint, json_data)
+        sent = []
+
+        async def send():
+            sent.append(True)
+            return await self._send_request(method, endpoint, json_data=json_data, **kwargs)
+
+        response = await self.single_flight.do(key, send)
+        return response if sent else {**response, "coalesced": True}
+
+    async def _handle_stream_response(self, response) -> AsyncGenerator[Dict[str, Any], None]:
+        try:
+            async for chunk_data in aiter_sse_json(response.aiter_bytes(), json_lines=True):
+                yield chunk_data
+        except StreamDecodeError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error processing stream: {str(e)}")
+        finally:
+            await response.aclose()
+
+    # ---------------------------------------------------------------------
+    # AUDIO
+    # ---------------------------------------------------------------------
+
+    async def speech_to_text(self, file: BinaryIO, **kwargs) -> AudioTranscriptionResponse:
+        """
+        Transcribe audio file to text. See ``ModelAsAService.speech_to_text``.
+        """
+        data = self._audio_form_data(file, kwargs)
+        span = self._start_span("maas.speech_to_text", {"model": self.model_id})
+
+        try:
+            span.start_generation(model=self.model_id, input="audio_file")
+            response = await self._send_request(
+                "POST",
+                "/v1/audio/transcriptions",
+                files={"file": file},
+                form_data=data,
+            )
+
+            result = response["result"]
+            span.end_generation(model=self.model_id, output=result.get("text"), usage=result.get("usage"))
+            span.end()
+            return AudioTranscriptionResponse.from_dict(result)
+        except Exception as e:
+            span.end(error=e)
+            raise
+
+    async def audio_translation(self, file: BinaryIO, **kwargs) -> AudioTranslationResponse:
+        """
+        Translate audio file to English text. See ``ModelAsAService.audio_translation``.
+        """
+        data = self._audio_form_data(file, kwargs)
+        span = self._start_span("maas.audio_translation", {"model": self.model_id})
+
+        try:
+            span.start_generation(model=self.model_id, input="audio_file")
+            response = await self._send_request(
+                "POST",
+                "/v1/audio/translations",
+                files={"file": file},
+                form_data=data,
+            )
+
+            result = response["result"]
+            span.end_generation(model=self.model_id, output=result.get("text"), usage=result.get("usage"))
+            span.end()
+            return AudioTranslationResponse.from_dict(result)
+        except Exception as e:
+            span.end(error=e)
+            raise
+
+    async def text_to_speech(self, input_text: str, voice: str, **kwargs) -> bytes:
+        """
+        Convert text to speech. See ``ModelAsAService.text_to_speech``.
+        """
+        data = self._text_to_speech_data(input_text, voice, kwargs)
+        span = self._start_span("maas.text_to_speech", data)
+
+        try:
+            span.start_generation(model=self.model_id, input=input_text)
+            audio = await self._send_request(
+                "POST",
+                "/v1/audio/speech",
+                json_data=data,
+                return_binary=True,
+            )
+            span.end_generation(model=self.model_id, output="binary_audio", usage=None)
+            span.end()
+            return audio
+        except Exception as e:
+            span.end(error=e)
+            raise
+
+    # ---------------------------------------------------------------------
+    # EMBEDDINGS
+    # ---------------------------------------------------------------------
+
+    async def create_embeddings(self, input_data: Union[str, List[str]], **kwargs) -> EmbeddingResponse:
+        """
+        Create embeddings for input text. See ``ModelAsAService.create_embeddings``.
+        """
+        data = self._embeddings_data(input_data, kwargs)
+
+        if self.embedding_cache is not None:
+            texts, cached, misses = self._embedding_cache_lookup(data)
+            result = await self._request_embeddings({**data, "input": misses}) if misses else None
+            return self._embedding_cache_merge(data, texts, cached, misses, result)
+
+        return EmbeddingResponse.from_dict(await self._request_embeddings(data))
+
+    async def _request_embeddings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        span = self._start_span("maas.embeddings", {"model": self.model_id})
+
+        try:
+            response = await self._coalesced_request("POST", "/v1/embeddings", json_data=data, idempotent=True)
+
+            result = response["result"]
+            span.end_generation(model=self.model_id, output="embedding_vectors", usage=self._span_usage(span, response))
+            span.end()
+            return result
+        except Exception as e:
+            span.end(error=e)
+            raise
+
+    async def create_embeddings_array(self, input_data: Union[str, List[str]], **kwargs) -> "numpy.ndarray":
+        """
+        Create embeddings as a float32 numpy matrix. See ``ModelAsAService.create_embeddings_array``.
+        """
+        kwargs.setdefault("encoding_format", "base64")
+        return (await self.create_embeddings(input_data, **kwargs)).as_array()
+
+    async def iter_embeddings(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 128,
+        max_concurrency: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        ordered: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[EmbeddingResponse, None]:
+        """
+        Embed a large corpus in concurrent batches, yielding each batch's
+        response as it arrives. See ``ModelAsAService.iter_embeddings``::
+
+            async for batch in client.iter_embeddings(texts):
+                ...
+        """
+
+        async def embed(batch):
+            return await self.create_embeddings(batch[1], **kwargs)
+
+        batches = iter_batches(texts, batch_size, max_batch_tokens)
+        workers = self._batch_concurrency(max_concurrency, 4)
+        async for (start, _), task in abounded_map(embed, batches, workers, ordered):
+            response = task.result()
+            for item in response.data:
+                item.index += start
+            yield response
+
+    async def embed_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 128,
+        max_concurrency: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> EmbeddingResponse:
+        """
+        Embed a large corpus in concurrent batches into one ordered response.
+        See ``ModelAsAService.embed_many``.
+        """
+        responses = [
+            response
+            async for response in self.iter_embeddings(
+                texts, batch_size, max_concurrency, max_batch_tokens, **kwargs
+            )
+        ]
+        return merge_embedding_responses(responses, model=self.model_id)
+
+    # ---------------------------------------------------------------------
+    # CHAT COMPLETION
+    # ---------------------------------------------------------------------
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        stream: bool = False,
+        **kwargs,
+    ) -> Union[
+        ChatCompletionResponse,
+        AsyncResponseStream,
+    ]:
+        """
+        Create a chat completion. See ``ModelAsAService.chat_completion``.
+
+        Returns:
+            Union[ChatCompletionResponse, AsyncGenerator]:
+                - If stream=False: ChatCompletionResponse
+                - If stream=True: AsyncResponseStream yielding ChatCompletionChunk objects
+        """
+        data = self._chat_completion_data(messages, stream, kwargs)
+        cache_key = self._response_cache_key("/v1/chat/completions", data)
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        span = self._start_span(
+            "maas.chat_completion", data if cached is None else {**data, "cached": True}
+        )
+
+        if cached is not None:
+            self._trace_cached(span, cached, messages, chat=True)
+            if not stream:
+                return ChatCompletionResponse.from_dict(cached)
+            chunks, accumulator = self._cached_chunks(cached, chat=True)
+            return AsyncResponseStream(self._replay_stream(chunks), accumulator)
+
+        if not stream:
+            try:
+                span.start_generation(model=self.model_id, input=messages)
+                response = await self._send_request("POST", "/v1/chat/completions", json_data=data)
+
+                result = response["result"]
+                output_text = result["choices"][0]["message"]["content"]
+                span.end_generation(model=self.model_id, output=output_text, usage=result.get("usage"))
+                span.end()
+                self._store_response(cache_key, result)
+                return ChatCompletionResponse.from_dict(result)
+            except Exception as e:
+                span.end(error=e)
+                raise
+
+        accumulator = StreamAccumulator(chat=True)
+        timer = StreamTimer("maas.chat_completion", self.model_id)
+
+        async def _stream_generator():
+            chunks = None
+            completed = False
+            error = None
+            try:
+                span.start_generation(model=self.model_id, input=messages)
+                timer.start()
+                chunks = await self._send_request(
+                    "POST",
+                    "/v1/chat/completions",
+                    json_data=data,
+                    stream=True,
+                )
+                async for chunk in chunks:
+                    timer.tick()
+                    accumulator.add(chunk)
+                    yield ChatCompletionChunk.from_dict(chunk)
+
+                span.end_generation(model=self.model_id, output=accumulator.text, usage=accumulator.usage)
+                record_usage("/v1/chat/completions", self.model_id, accumulator.usage)
+                completed = True
+                self._store_stream(cache_key, accumulator)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # Also runs when the caller stops early (break, aclose(), cancellation).
+                if chunks is not None:
+                    await chunks.aclose()
+                self._finish_stream(span, timer, completed)
+                span.end(error=error)
+
+        return AsyncResponseStream(_stream_generator(), accumulator, timer)
+
+    def chat_completion_batch(
+        self,
+        messages_list: Iterable[List[Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncBatchRun:
+        """
+        Run many chat completions concurrently. See ``ModelAsAService.chat_completion_batch``::
+
+            run = client.chat_completion_batch(prompts, max_concurrency=32)
+            async for item in run:
+                ...
+            run.usage
+        """
+        if kwargs.pop("stream", False):
+            raise ValueError("chat_completion_batch does not support streaming")
+
+        async def run(item):
+            return await self.chat_completion(item[1], **kwargs)
+
+        workers = self._batch_concurrency(max_concurrency, 8)
+        return AsyncBatchRun(abounded_map(run, enumerate(messages_list), workers, ordered))
+
+    # ---------------------------------------------------------------------
+    # COMPLETION
+    # ---------------------------------------------------------------------
+
+    async def completion(
+        self, prompt: str, stream: bool = False, **kwargs
+    ) -> Union[CompletionResponse, AsyncResponseStream]:
+        """
+        Create a text completion. See ``ModelAsAService.completion``.
+
+        Returns:
+            Union[CompletionResponse, AsyncGenerator]:
+                - If stream=False: CompletionResponse
+                - If stream=True: AsyncResponseStream yielding CompletionChunk objects
+        """
+        data = self._completion_data(prompt, stream, kwargs)
+        cache_key = self._response_cache_key("/v1/completions", data)
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        span = self._start_span(
+            "maas.completion", data if cached is None else {**data, "cached": True}
+        )
+
+        if cached is not None:
+            self._trace_cached(span, cached, prompt, chat=False)
+            if not stream:
+                return CompletionResponse.from_dict(cached)
+            chunks, accumulator = self._cached_chunks(cached, chat=False)
+            return AsyncResponseStream(self._replay_stream(chunks), accumulator)
+
+        if not stream:
+            try:
+                span.start_generation(model=self.model_id, input=prompt)
+                response = await self._send_request("POST", "/v1/completions", json_data=data)
+
+                result = response["result"]
+                output_text = result["choices"][0]["text"]
+                span.end_generation(model=self.model_id, output=output_text, usage=result.get("usage"))
+                span.end()
+                self._store_response(cache_key, result)
+                return CompletionResponse.from_dict(result)
+            except Exception as e:
+                span.end(error=e)
+                raise
+
+        accumulator = StreamAccumulator(chat=False)
+        timer = StreamTimer("maas.completion", self.model_id)
+
+        async def _stream_generator():
+            chunks = None
+            completed = False
+            error = None
+            try:
+                span.start_generation(model=self.model_id, input=prompt)
+                timer.start()
+                chunks = await self._send_request(
+                    "POST",
+                    "/v1/completions",
+                    json_data=data,
+                    stream=True,
+                )
+                async for chunk in chunks:
+                    timer.tick()
+                    accumulator.add(chunk)
+                    yield CompletionChunk.from_dict(chunk)
+
+                span.end_generation(model=self.model_id, output=accumulator.text, usage=accumulator.usage)
+                record_usage("/v1/completions", self.model_id, accumulator.usage)
+                completed = True
+                self._store_stream(cache_key, accumulator)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # Also runs when the caller stops early (break, aclose(), cancellation).
+                if chunks is not None:
+                    await chunks.aclose()
+                self._finish_stream(span, timer, completed)
+                span.end(error=error)
+
+        return AsyncResponseStream(_stream_generator(), accumulator, timer)
+
+    # ---------------------------------------------------------------------
+    # MODELS & RERANK
+    # ---------------------------------------------------------------------
+
+    async def list_models(self) -> ModelsListResponse:
+        """
+        List all available models on the server. See ``ModelAsAService.list_models``.
+        """
+        response = await self._coalesced_request("GET", "/v1/models")
+        return ModelsListResponse.from_dict(response["result"])
+
+    async def rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]],
+                     **kwargs) -> RerankResponse:
+        """
+        Rerank documents by relevance to a query. See ``ModelAsAService.rerank``.
+        """
+        response = await self._coalesced_request(
+            "POST",
+            "/v1/rerank",
+            json_data=self._rerank_data(query, documents, kwargs),
+            idempotent=True,
+        )
+        return RerankResponse.from_dict(response["result"])
@@ -0,0 +1,318 @@
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sify.aiplatform.transport.ratelimit import CHARS_PER_TOKEN
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_batches(
+    texts: Iterable[str],
+    batch_size: int,
+    max_batch_tokens: Optional[int] = None,
+) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Split ``texts`` into ``(start_index, batch)`` pairs of at most
+    ``batch_size`` items and, if given, roughly ``max_batch_tokens``
+    estimated tokens. Consumes the input lazily.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    batch: List[str] = []
+    batch_tokens = 0
+    start = 0
+    for index, text in enumerate(texts):
+        tokens = len(text) // CHARS_PER_TOKEN + 1
+        if batch and (
+            len(batch) >= batch_size
+            or (max_batch_tokens is not None and batch_tokens + tokens > max_batch_tokens)
+        ):
+            yield start, batch
+            batch, batch_tokens, start = [], 0, index
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        yield start, batch
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int,
+    ordered: bool = True,
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    """
+    Run ``fn`` over ``items`` on a thread pool with at most ``max_concurrency``
+    calls in flight, yielding ``(item, future)`` pairs in input order or as
+    completed. Input is consumed lazily, so memory stays bounded. Futures
+    are yielded done; call ``.result()`` to get the value or the exception.
+
+    Each call runs in a copy of the caller's ``contextvars`` context, so
+    trace identity set with ``langfuse_identity`` reaches the workers.
+    Raises ``ValueError`` at call time if ``max_concurrency`` is below 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return _bounded_map(fn, items, max_concurrency, ordered, contextvars.copy_context())
+
+
+def _bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int,
+    ordered: bool,
+    context: contextvars.Context,
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+    iterator = iter(items)
+    # ordered mode keeps a larger window so one slow head item doesn't idle the pool
+    window = max_concurrency * 2 if ordered else max_concurrency
+    pending: "deque[Tuple[T, Future[R]]]" = deque()
+
+    def fill() -> None:
+        while len(pending) < window:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            # A Context can only be entered by one thread at a time, so copy it per call.
+            pending.append((item, pool.submit(context.copy().run, fn, item)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                item, future = pending.popleft()
+                wait([future])
+                fill()
+                yield item, future
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                finished = [(i, f) for i, f in pending if f in done]
+                for entry in finished:
+                    pending.remove(entry)
+                fill()
+                for entry in finished:
+                    yield entry
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def abounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+    ordered: bool = True,
+) -> AsyncIterator[Tuple[T, "asyncio.Future[R]"]]:
+    """
+    asyncio counterpart of ``bounded_map``; ``fn`` is a coroutine function.
+    Tasks inherit the caller's context as usual.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return _abounded_map(fn, items, max_concurrency, ordered)
+
+
+async def _abounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[Tuple[T, "asyncio.Future[R]"]]:
+    iterator = iter(items)
+    window = max_concurrency * 2 if ordered else max_concurrency
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pending: "deque[Tuple[T, asyncio.Task[Any]]]" = deque()
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    def fill() -> None:
+        while len(pending) < window:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            pending.append((item, asyncio.ensure_future(run(item))))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                item, task = pending.popleft()
+                await asyncio.wait([task])
+                fill()
+                yield item, task
+            else:
+                done, _ = await asyncio.wait([t for _, t in pending], return_when=asyncio.FIRST_COMPLETED)
+                finished = [(i, t) for i, t in pending if t in done]
+                for entry in finished:
+                    pending.remove(entry)
+                fill()
+                for entry in finished:
+                    yield entry
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+# ------------------------------------------------------------------
+# Batch results
+# ------------------------------------------------------------------
+class BatchItem:
+    """
+    Outcome of one request in a batch: ``response`` on success, otherwise
+    ``error`` holds the exception. ``index`` is the position in the input.
+    """
+
+    __slots__ = ("index", "input", "response", "error")
+
+    def __init__(self, index: int, input: Any, response: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.input = input
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> Any:
+        """Return the response, re-raising the request's exception if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def __repr__(self) -> str:
+        status = "ok" if self.error is None else f"error={self.error!r}"
+        return f"BatchItem(index={self.index}, {status})"
+
+
+class _BatchTotals:
+    """Counts and aggregate ``ChatUsage`` shared by the sync and async batch runs."""
+
+    def __init__(self):
+        self.succeeded = 0
+        self.failed = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+
+    def _record(self, index: int, input: Any, future: Any) -> BatchItem:
+        error = future.exception()
+        if error is not None:
+            self.failed += 1
+            return BatchItem(index, input, error=error)
+        response = future.result()
+        self.succeeded += 1
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens
+            self.completion_tokens += usage.completion_tokens
+            self.total_tokens += usage.total_tokens
+        return BatchItem(index, input, response)
+
+    @property
+    def usage(self) -> Any:
+        """Token usage summed over the successful requests seen so far."""
+        from sify.aiplatform.models.api_types import ChatUsage
+
+        return ChatUsage(self.prompt_tokens, self.completion_tokens, self.total_tokens)
+
+
+class BatchRun(_BatchTotals):
+    """
+    Iterator of ``BatchItem`` results returned by ``chat_completion_batch``.
+    Failed requests are yielded with their exception instead of aborting the
+    batch; ``usage``, ``succeeded`` and ``failed`` are totals so far::
+
+        run = client.chat_completion_batch(prompts, max_concurrency=16)
+        for item in run:
+            ...
+        run.usage
+    """
+
+    def __init__(self, results: Iterator[Tuple[Tuple[int, Any], "Future[Any]"]]):
+        super().__init__()
+        self._results = results
+
+    def __iter__(self) -> "BatchRun":
+        return self
+
+    def __next__(self) -> BatchItem:
+        (index, input), future = next(self._results)
+        return self._record(index, input, future)
+
+    def close(self) -> None:
+        """Stop dispatching; requests not yet started are cancelled."""
+        close = getattr(self._results, "close", None)
+        if close is not None:
+            close()
+
+    def collect(self) -> List[BatchItem]:
+        """Run the rest of the batch and return the items sorted by input index."""
+        return sorted(self, key=lambda item: item.index)
+
+
+class AsyncBatchRun(_BatchTotals):
+    """asyncio counterpart of ``BatchRun``."""
+
+    def __init__(self, results: AsyncIterator[Tuple[Tuple[int, Any], "asyncio.Future[Any]"]]):
+        super().__init__()
+        self._results = results
+
+    def __aiter__(self) -> "AsyncBatchRun":
+        return self
+
+    async def __anext__(self) -> BatchItem:
+        (index, input), task = await self._results.__anext__()
+        return self._record(index, input, task)
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._results, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def collect(self) -> List[BatchItem]:
+        items = [item async for item in self]
+        items.sort(key=lambda item: item.index)
+        return items
+
+
+def merge_embedding_responses(responses: Iterable[Any], model: Optional[str] = None) -> Any:
+    """
+    Merge per-batch ``EmbeddingResponse`` objects (indices already global)
+    into one response ordered by ``EmbeddingData.index`` with summed usage.
+    """
+    from sify.aiplatform.models.api_types import EmbeddingResponse, EmbeddingUsage
+
+    data = []
+    prompt_tokens = total_tokens = 0
+    for response in responses:
+        data.extend(response.data)
+        prompt_tokens += response.usage.prompt_tokens
+        total_tokens += response.usage.total_tokens
+        model = model or response.model
+    data.sort(key=lambda item: item.index)
+    return EmbeddingResponse(
+        object="list",
+        data=data,
+        model=model,
+        usage=EmbeddingUsage(prompt_tokens=prompt_tokens, total_tokens=total_tokens),
+    )
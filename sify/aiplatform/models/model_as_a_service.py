@@ -1,6 +1,6 @@
 import json
 import requests
-from typing import Any, Dict, Generator, List, Optional, Union, BinaryIO
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union, BinaryIO
 
 from sify.aiplatform.models.api_types import (
     ModelsListResponse,
@@ -15,9 +15,31 @@ from sify.aiplatform.models.api_types import (
     APIError,
 )
 
-from sify.aiplatform.observability.langfuse import (
-    get_tracer,
-    set_langfuse_identity,
+from sify.aiplatform.cache.embedding_cache import EmbeddingCache, pack_vector, unpack_vector
+from sify.aiplatform.cache.response_cache import ResponseCache, response_to_chunks
+from sify.aiplatform.models.streaming import ResponseStream, StreamAccumulator
+from sify.aiplatform.models.batching import (
+    BatchRun,
+    bounded_map,
+    iter_batches,
+    merge_embedding_responses,
+)
+from sify.aiplatform.observability.metrics import record_usage
+from sify.aiplatform.observability.stream_metrics import StreamStatsCallback, StreamTimer, finish_stream
+from sify.aiplatform.observability.langfuse import get_tracer
+from sify.aiplatform.transport import AdaptiveConcurrencyLimiter, HTTPTransport, RateLimiter, get_transport
+from sify.aiplatform.transport.concurrency import limited_request
+from sify.aiplatform.transport.ratelimit import estimate_tokens
+from sify.aiplatform.transport.singleflight import get_single_flight, request_key
+from sify.aiplatform.transport.sse import StreamDecodeError, iter_sse_json
+from sify.aiplatform.transport.errors import (
+    CONNECTION_ERRORS,
+    SSL_ERRORS,
+    TIMEOUT_ERRORS,
+    APIConnectionError,
+    APIRequestError,
+    APITimeoutError,
+    error_for_status,
 )
 
 
@@ -30,6 +52,13 @@ class ModelAsAService:
         *,
         user_id: str | None = None,
         session_id: str | None = None,
+        transport: HTTPTransport | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        on_stream_stats: StreamStatsCallback | None = None,
     ):
         if not api_key or not api_key.strip():
             raise ValueError("API key must be provided and cannot be empty")
@@ -37,15 +66,22 @@ class ModelAsAService:
         self.base_url = "https://infinitai.sifymdp.digital/maas"
         self.api_key = api_key.strip()
         self.model_id = model_id.strip() if model_id else None
-
-        
-        set_langfuse_identity(user_id=user_id, session_id=session_id)
-       
-
+        self.transport = transport or get_transport()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.embedding_cache = embedding_cache
+        self.response_cache = response_cache
+        self.single_flight = get_single_flight() if coalesce else None
+        self.on_stream_stats = on_stream_stats
+
+        # Default trace identity for this client; langfuse_identity() or
+        # set_langfuse_identity() override it per call or per task.
+        self.user_id = user_id
+        self.session_id = session_id
         self.tracer = get_tracer()
 
 
-    def _send_request(
+    def _build_request(
         self,
         method: str,
         endpoint: str,
@@ -53,9 +89,7 @@ class ModelAsAService:
         params: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
-        stream: bool = False,
-        return_binary: bool = False
-    ) -> Union[Dict[str, Any], Generator[Dict[str, Any], None, None], bytes]:
+    ) -> Dict[str, Any]:
         url = f"{self.base_url}{endpoint}"
         
         headers = {
@@ -66,129 +100,229 @@ class ModelAsAService:
         if not files and not form_data:
             headers["Content-Type"] = "application/json"
 
-        try:
-            # Prepare request arguments
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "headers": headers,
-                "stream": stream,
-                "timeout": 300
-            }
-
-            # Add data based on request type
-            if files:
-                request_kwargs["files"] = files
-                if form_data:
-                    request_kwargs["data"] = form_data
-            elif form_data:
+        # Prepare request arguments
+        request_kwargs = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+        }
+
+        # Add data based on request type
+        if files:
+            request_kwargs["files"] = files
+            if form_data:
                 request_kwargs["data"] = form_data
-            elif json_data:
-                request_kwargs["json"] = json_data
+        elif form_data:
+            request_kwargs["data"] = form_data
+        elif json_data:
+            request_kwargs["json"] = json_data
 
-            if params:
-                request_kwargs["params"] = params
+        if params:
+            request_kwargs["params"] = params
 
-            response = requests.request(**request_kwargs)
+        return request_kwargs
 
-            # Handle error status codes
-            if response.status_code >= 400:
-                error_msg = "Request failed"
-                error_details = None
-                
-                try:
-                    error_response = response.json()
-                    if isinstance(error_response, dict):
-                        if 'error' in error_response:
-                            error_msg = error_response['error']
-                            error_details = error_response.get('details')
-                        elif 'message' in error_response:
-                            error_msg = error_response['message']
-                        elif 'detail' in error_response:
-                            error_msg = error_response['detail']
-                    else:
-                        error_msg = str(error_response)
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else f"HTTP {response.status_code} Error"
-                
-                # Handle specific error codes
-                if response.status_code == 403:
-                    error_msg = f"Forbidden: API key is not subscribed for model '{self.model_id}' or access denied"
-                elif response.status_code == 401:
-                    error_msg = "Unauthorized: Invalid API key"
-                elif response.status_code == 404:
-                    error_msg = f"Not Found: Model '{self.model_id}' not found or endpoint not available"
-                elif response.status_code == 429:
-                    error_msg = "Rate limit exceeded: Too many requests"
-                elif response.status_code >= 500:
-                    error_msg = f"Server error: HTTP {response.status_code}"
-  
-                api_error = APIError(
-                    error=error_msg,
-                    details=error_details,
-                    status_code=response.status_code
-                )
-                raise ValueError(str(api_error))
+    def _raise_for_status(self, response) -> None:
+        # Handle error status codes
+        if response.status_code < 400:
+            return
+
+        error_msg = "Request failed"
+        error_details = None
+        
+        try:
+            error_response = response.json()
+            if isinstance(error_response, dict):
+                if 'error' in error_response:
+                    error_msg = error_response['error']
+                    error_details = error_response.get('details')
+                elif 'message' in error_response:
+                    error_msg = error_response['message']
+                elif 'detail' in error_response:
+                    error_msg = error_response['detail']
+            else:
+                error_msg = str(error_response)
+        except json.JSONDecodeError:
+            error_msg = response.text if response.text else f"HTTP {response.status_code} Error"
+        
+        # Handle specific error codes
+        if response.status_code == 403:
+            error_msg = f"Forbidden: API key is not subscribed for model '{self.model_id}' or access denied"
+        elif response.status_code == 401:
+            error_msg = "Unauthorized: Invalid API key"
+        elif response.status_code == 404:
+            error_msg = f"Not Found: Model '{self.model_id}' not found or endpoint not available"
+        elif response.status_code == 429:
+            error_msg = "Rate limit exceeded: Too many requests"
+        elif response.status_code >= 500:
+            error_msg = f"Server error: HTTP {response.status_code}"
+
+        api_error = APIError(
+            error=error_msg,
+            details=error_details,
+            status_code=response.status_code
+        )
+        raise error_for_status(
+            response.status_code,
+            str(api_error),
+            details=error_details,
+            retries=getattr(response, "retries", 0),
+        )
+
+    def _parse_response(self, response, return_binary: bool = False) -> Union[Dict[str, Any], bytes]:
+        # Handle binary responses (e.g., audio files)
+        if return_binary or self._is_binary_response(response):
+            return response.content
+
+        # Handle JSON responses
+        if response.content:
+            try:
+                result = response.json()
+                return {"status_code": response.status_code, "result": result}
+            except json.JSONDecodeError:
+                # If we can't parse JSON but expected it, check if it's HTML or other format
+                content_type = response.headers.get('Content-Type', '')
+                if 'text/html' in content_type:
+                    raise ValueError(f"Received HTML response instead of JSON: {response.text[:200]}")
+                elif 'text/plain' in content_type:
+                    raise ValueError(f"Received plain text response: {response.text}")
+                else:
+                    raise ValueError(f"Failed to parse JSON response: {response.text[:200]}")
+        else:
+            return {"status_code": response.status_code, "result": {}}
+
+    def _raise_request_error(self, e: Exception) -> None:
+        retries = getattr(e, "retries", 0)
+        if isinstance(e, TIMEOUT_ERRORS):
+            raise APITimeoutError("Request timeout - the API took too long to respond", retries=retries) from e
+        elif isinstance(e, SSL_ERRORS):
+            raise APIConnectionError("SSL/TLS error - certificate verification failed", retries=retries) from e
+        elif isinstance(e, CONNECTION_ERRORS):
+            raise APIConnectionError("Connection error - unable to reach the API", retries=retries) from e
+        else:
+            raise APIRequestError(f"Request failed: {str(e)}", retries=retries) from e
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        form_data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        return_binary: bool = False,
+        idempotent: Optional[bool] = None,
+    ) -> Union[Dict[str, Any], Generator[Dict[str, Any], None, None], bytes]:
+        request_kwargs = self._build_request(method, endpoint, json_data, params, files, form_data)
+
+        estimated = 0
+        if self.rate_limiter is not None:
+            estimated = estimate_tokens(json_data)
+            self.rate_limiter.acquire(self._rate_limit_key(), estimated)
+
+        try:
+            response = self._limited_request(
+                endpoint=endpoint, stream=stream, idempotent=idempotent, model=self.model_id, **request_kwargs
+            )
+            self._observe_rate_limits(response)
 
             # Handle streaming responses
             if stream:
+                if response.status_code >= 400:
+                    try:
+                        self._raise_for_status(response)
+                    finally:
+                        response.close()
                 return self._handle_stream_response(response)
 
-            # Handle binary responses (e.g., audio files)
-            if return_binary or self._is_binary_response(response):
-                return response.content
-
-            # Handle JSON responses
-            if response.content:
-                try:
-                    result = response.json()
-                    return {"status_code": response.status_code, "result": result}
-                except json.JSONDecodeError:
-                    # If we can't parse JSON but expected it, check if it's HTML or other format
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'text/html' in content_type:
-                        raise ValueError(f"Received HTML response instead of JSON: {response.text[:200]}")
-                    elif 'text/plain' in content_type:
-                        raise ValueError(f"Received plain text response: {response.text}")
-                    else:
-                        raise ValueError(f"Failed to parse JSON response: {response.text[:200]}")
-            else:
-                return {"status_code": response.status_code, "result": {}}
+            self._raise_for_status(response)
+
+            result = self._parse_response(response, return_binary)
+            self._settle_tokens(result, estimated)
+            record_usage(endpoint, self.model_id, self._usage_of(result))
+            return result
 
         except requests.RequestException as e:
-            error_msg = str(e).lower()
-            if "timeout" in error_msg:
-                raise ValueError("Request timeout - the API took too long to respond")
-            elif "connection" in error_msg:
-                raise ValueError("Connection error - unable to reach the API")
-            elif "ssl" in error_msg:
-                raise ValueError("SSL/TLS error - certificate verification failed")
-            else:
-                raise ValueError(f"Request failed: {str(e)}")
+            self._raise_request_error(e)
+
+    def _coalesced_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        ``_send_request`` for read-only calls: concurrent identical requests
+        from any client in the process share one network round-trip.
+
+        Callers that received another caller's response get it with
+        ``"coalesced": True``; only the caller that sent the request should
+        report its usage.
+        """
+        if self.single_flight is None:
+            return self._send_request(method, endpoint, json_data=json_data, **kwargs)
+        key = request_key(self.base_url, self.api_key, method, endpoint, json_data)
+        sent = []
+
+        def send():
+            sent.append(True)
+            return self._send_request(method, endpoint, json_data=json_data, **kwargs)
+
+        response = self.single_flight.do(key, send)
+        return response if sent else {**response, "coalesced": True}
+
+    # ---------------------------------------------------------------------
+    # RATE LIMITING
+    # ---------------------------------------------------------------------
+
+    def _rate_limit_key(self):
+        return (self.api_key, self.model_id)
+
+    def _limited_request(self, **kwargs) -> Any:
+        """
+        ``transport.request`` holding a ``concurrency_limiter`` slot. For
+        streams the slot covers the time to response headers only.
+        """
+        return limited_request(self.concurrency_limiter, self.transport.request, **kwargs)
+
+    def _batch_concurrency(self, max_concurrency: Optional[int], default: int) -> int:
+        """Worker count for batch helpers; an adaptive limiter sets the pace beneath it."""
+        if max_concurrency is not None:
+            return max_concurrency
+        if self.concurrency_limiter is not None:
+            return self.concurrency_limiter.max_limit
+        return default
+
+    def _observe_rate_limits(self, response) -> None:
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.update_from_headers(self._rate_limit_key(), response.headers)
+
+    @staticmethod
+    def _usage_of(result: Any) -> Optional[Dict[str, Any]]:
+        body = result.get("result") if isinstance(result, dict) else None
+        usage = body.get("usage") if isinstance(body, dict) else None
+        return usage if isinstance(usage, dict) else None
+
+    def _settle_tokens(self, result: Any, estimated: int) -> None:
+        if self.rate_limiter is None:
+            return
+        usage = self._usage_of(result)
+        if usage is not None and usage.get("total_tokens") is not None:
+            self.rate_limiter.settle(self._rate_limit_key(), estimated, usage["total_tokens"])
 
     def _handle_stream_response(self, response) -> Generator[Dict[str, Any], None, None]:
         try:
-            for line in response.iter_lines(decode_unicode=True):
-                if line:
-                    # Handle server-sent events format
-                    if line.startswith("data: "):
-                        data_str = line[len("data: "):].strip()
-                        if data_str and data_str != "[DONE]":
-                            try:
-                                chunk_data = json.loads(data_str)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                # Skip malformed JSON chunks
-                                continue
-                    # Handle raw JSON lines
-                    elif line.strip():
-                        try:
-                            chunk_data = json.loads(line.strip())
-                            yield chunk_data
-                        except json.JSONDecodeError:
-                            continue
+            # Servers may also send bare newline-delimited JSON instead of SSE frames.
+            yield from iter_sse_json(response.iter_content(chunk_size=None), json_lines=True)
+        except StreamDecodeError:
+            raise
         except Exception as e:
             raise ValueError(f"Error processing stream: {str(e)}")
+        finally:
+            response.close()
 
     def _is_binary_response(self, response) -> bool:
         content_type = response.headers.get("Content-Type", "").lower()
@@ -241,6 +375,153 @@ class ModelAsAService:
                 if isinstance(param_value, (int, float)) and param_value < 0:
                     raise ValueError(f"{param_name} must not be negative")
 
+    def _require_model_id(self) -> str:
+        if self.model_id is None:
+            raise ValueError("Model ID must is not set for this instance")
+        return self.model_id
+
+    # ---------------------------------------------------------------------
+    # REQUEST PAYLOADS (shared with AsyncModelAsAService)
+    # ---------------------------------------------------------------------
+
+    def _response_cache_key(self, endpoint: str, data: Dict[str, Any]) -> Optional[str]:
+        if self.response_cache is None or not self.response_cache.cacheable(data):
+            return None
+        return ResponseCache.key(endpoint, data)
+
+    def _store_response(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        if cache_key is not None:
+            self.response_cache.put(cache_key, result)
+
+    def _store_stream(self, cache_key: Optional[str], accumulator: StreamAccumulator) -> None:
+        # Without a usage chunk the stream can't be rebuilt into a complete response.
+        if cache_key is not None and accumulator.usage is not None:
+            self.response_cache.put(cache_key, accumulator.to_dict())
+
+    def _start_span(self, name: str, input: Dict[str, Any]):
+        return self.tracer.start_span(name, input, user_id=self.user_id, session_id=self.session_id)
+
+    def _finish_stream(self, span, timer: StreamTimer, completed: bool = True) -> None:
+        finish_stream(span, timer, self.on_stream_stats, completed)
+
+    @staticmethod
+    def _span_usage(span, response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Usage to report on ``span``: none for a coalesced response, the sender reports it."""
+        if response.get("coalesced"):
+            span.set_metadata({"coalesced": True})
+            return None
+        return response["result"].get("usage")
+
+    def _trace_cached(self, span, result: Dict[str, Any], input: Any, chat: bool) -> None:
+        """Close ``span`` for a cache hit; no tokens were spent, so no usage is reported."""
+        choice = result["choices"][0]
+        span.start_generation(model=self.model_id, input=input)
+        span.end_generation(
+            model=self.model_id,
+            output=choice["message"]["content"] if chat else choice["text"],
+            usage=None,
+        )
+        span.end()
+
+    @staticmethod
+    def _cached_chunks(result: Dict[str, Any], chat: bool) -> Tuple[List[Any], StreamAccumulator]:
+        """Split a cached response into typed chunks, plus an accumulator holding the whole."""
+        chunk_type = ChatCompletionChunk if chat else CompletionChunk
+        accumulator = StreamAccumulator(chat)
+        chunks = []
+        for chunk in response_to_chunks(result, chat):
+            accumulator.add(chunk)
+            chunks.append(chunk_type.from_dict(chunk))
+        return chunks, accumulator
+
+    def _audio_form_data(self, file: BinaryIO, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if file is None:
+            raise ValueError("File must be provided")
+        self._validate_optional_params(kwargs)
+        return {
+            "model": self._require_model_id(),
+            **kwargs,
+        }
+
+    def _text_to_speech_data(self, input_text: str, voice: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"input_text": input_text, "voice": voice})
+        self._validate_optional_params(kwargs)
+        return {
+            "model": self._require_model_id(),
+            "input": input_text,
+            "voice": voice,
+            **kwargs,
+        }
+
+    def _embeddings_data(self, input_data: Union[str, List[str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"input": input_data})
+        self._validate_optional_params(kwargs)
+
+        # Validate input_data structure
+        if isinstance(input_data, list):
+            for i, item in enumerate(input_data):
+                if not isinstance(item, str) or not item.strip():
+                    raise ValueError(f"Input item {i} must be a non-empty string")
+        elif not isinstance(input_data, str) or not input_data.strip():
+            raise ValueError("Input data must be a non-empty string or list of non-empty strings")
+
+        return {
+             "model": self._require_model_id(),
+             "input": input_data,
+             **kwargs,
+        }
+
+    def _chat_completion_data(self, messages: List[Dict[str, Any]], stream: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"messages": messages})
+        self._validate_optional_params(kwargs)
+
+        # Validate messages structure
+        for i, message in enumerate(messages):
+            if not isinstance(message, dict):
+                raise ValueError(f"Message {i} must be a dictionary")
+            if "role" not in message or not message["role"]:
+                raise ValueError(f"Message {i} must have a valid 'role' field")
+            if "content" not in message or not message["content"]:
+                raise ValueError(f"Message {i} must have a valid 'content' field")
+
+        return {
+            "model": self._require_model_id(),
+            "messages": messages,
+            "stream": stream,
+            **kwargs,
+        }
+
+    def _completion_data(self, prompt: str, stream: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"prompt": prompt})
+        self._validate_optional_params(kwargs)
+        return {
+            "model": self._require_model_id(),
+            "prompt": prompt,
+            "stream": stream,
+            **kwargs,
+        }
+
+    def _rerank_data(self, query: str, documents: List[Union[str, Dict[str, Any]]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"query": query, "documents": documents})
+        self._validate_optional_params(kwargs)
+
+        # Validate documents structure
+        for i, doc in enumerate(documents):
+            if isinstance(doc, str) and not doc.strip():
+                raise ValueError(f"Document {i} must not be empty")
+            elif isinstance(doc, dict):
+                if "text" not in doc or not doc["text"]:
+                    raise ValueError(f"Document {i} must have a valid 'text' field")
+            elif not isinstance(doc, (str, dict)):
+                raise ValueError(f"Document {i} must be a string or dictionary")
+
+        return {
+            "model": self._require_model_id(),
+            "query": query,
+            "documents": documents,
+            **kwargs,
+        }
+
     # ---------------------------------------------------------------------
     # AUDIO
     # ---------------------------------------------------------------------
@@ -265,17 +546,9 @@ class ModelAsAService:
             ValueError: If file is missing, or if the API request fails
         """
 
-        if file is None:
-            raise ValueError("File must be provided")
-        self._validate_optional_params(kwargs)
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        data = {
-            "model": self.model_id,
-            **kwargs,
-        }    
+        data = self._audio_form_data(file, kwargs)
 
-        span = self.tracer.start_span("maas.speech_to_text", {"model": self.model_id})
+        span = self._start_span("maas.speech_to_text", {"model": self.model_id})
 
         try:
             span.start_generation(
@@ -300,7 +573,7 @@ class ModelAsAService:
             span.end()
             return AudioTranscriptionResponse.from_dict(result)
         except Exception as e:
-            span.end()
+            span.end(error=e)
             raise
 
     def audio_translation(self, file: BinaryIO, **kwargs) -> AudioTranslationResponse:
@@ -322,18 +595,8 @@ class ModelAsAService:
             ValueError: If file is missing, or if the API request fails
         """
 
-        if file is None:
-            raise ValueError("File must be provided")
-        self._validate_optional_params(kwargs)
-
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-
-        data = {
-            "model": self.model_id,
-            **kwargs,
-        }
-        span = self.tracer.start_span("maas.audio_translation", {"model": self.model_id})
+        data = self._audio_form_data(file, kwargs)
+        span = self._start_span("maas.audio_translation", {"model": self.model_id})
 
         try:
             span.start_generation(
@@ -358,7 +621,7 @@ class ModelAsAService:
             span.end()
             return AudioTranslationResponse.from_dict(result)
         except Exception as e:
-            span.end()
+            span.end(error=e)
             raise
 
     def text_to_speech(self, input_text: str, voice: str, **kwargs) -> bytes:
@@ -379,18 +642,8 @@ class ModelAsAService:
             ValueError: If required parameters are missing or if the API request fails
         """
 
-        self._validate_required_params({"input_text": input_text, "voice": voice})
-        self._validate_optional_params(kwargs)
-
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        data = {
-            "model": self.model_id,
-            "input": input_text,
-            "voice": voice,
-            **kwargs,
-        }
-        span = self.tracer.start_span("maas.text_to_speech",  data)
+        data = self._text_to_speech_data(input_text, voice, kwargs)
+        span = self._start_span("maas.text_to_speech",  data)
 
         try:
             span.start_generation(
@@ -413,7 +666,7 @@ class ModelAsAService:
             span.end()
             return audio
         except Exception as e:
-            span.end()
+            span.end(error=e)
             raise
 
     # ---------------------------------------------------------------------
@@ -436,7 +689,8 @@ class ModelAsAService:
                 - object (str): Type of object returned (always "list")
                 - data (List[EmbeddingData]): List of embedding objects with:
                     - object (str): Type of object (always "embedding")
-                    - embedding (List[float]): The embedding vector
+                    - embedding (List[float]): The embedding vector (a base64 string when
+                      encoding_format="base64"; use EmbeddingResponse.as_array() to decode)
                     - index (int): Index of the embedding in the input list
                 - model (str): The model used for embedding
                 - usage (EmbeddingUsage): Usage statistics with:
@@ -447,33 +701,24 @@ class ModelAsAService:
             ValueError: If required parameters are missing or if the API request fails
         """
 
+        data = self._embeddings_data(input_data, kwargs)
 
-        self._validate_required_params({"input": input_data})
-        self._validate_optional_params(kwargs)
+        if self.embedding_cache is not None:
+            texts, cached, misses = self._embedding_cache_lookup(data)
+            result = self._request_embeddings({**data, "input": misses}) if misses else None
+            return self._embedding_cache_merge(data, texts, cached, misses, result)
 
-        # Validate input_data structure
-        if isinstance(input_data, list):
-            for i, item in enumerate(input_data):
-                if not isinstance(item, str) or not item.strip():
-                    raise ValueError(f"Input item {i} must be a non-empty string")
-        elif not isinstance(input_data, str) or not input_data.strip():
-            raise ValueError("Input data must be a non-empty string or list of non-empty strings")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        data = {
-             "model": self.model_id,
-             "input": input_data,
-             **kwargs,
-        }   
+        return EmbeddingResponse.from_dict(self._request_embeddings(data))
 
-        span = self.tracer.start_span("maas.embeddings", {"model": self.model_id})
+    def _request_embeddings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        span = self._start_span("maas.embeddings", {"model": self.model_id})
 
         try:
-            response = self._send_request(
+            response = self._coalesced_request(
                 "POST",
                 "/v1/embeddings",
                 json_data=data,
+                idempotent=True,
             )
 
             result = response["result"]
@@ -481,15 +726,135 @@ class ModelAsAService:
             span.end_generation(
                 model=self.model_id,
                 output="embedding_vectors",
-                usage=result.get("usage"),
+                usage=self._span_usage(span, response),
             )
 
             span.end()
-            return EmbeddingResponse.from_dict(result)
+            return result
         except Exception as e:
-            span.end()
+            span.end(error=e)
             raise
 
+    def _embedding_cache_lookup(self, data: Dict[str, Any]) -> Tuple[List[str], Dict[str, bytes], List[str]]:
+        """Split the request into cached vectors and the unique texts that must be sent."""
+        texts = [data["input"]] if isinstance(data["input"], str) else list(data["input"])
+        cached = self.embedding_cache.get_many(self.model_id, data.get("dimensions"), texts)
+        misses = [text for text in dict.fromkeys(texts) if text not in cached]
+        return texts, cached, misses
+
+    def _embedding_cache_merge(
+        self,
+        data: Dict[str, Any],
+        texts: List[str],
+        cached: Dict[str, bytes],
+        misses: List[str],
+        result: Optional[Dict[str, Any]],
+    ) -> EmbeddingResponse:
+        """Store freshly fetched vectors and assemble the response in input order."""
+        usage = {"prompt_tokens": 0, "total_tokens": 0}
+        model = self.model_id
+        if result is not None:
+            for item in result["data"]:
+                text = misses[item["index"]]
+                vector = pack_vector(item["embedding"])
+                cached[text] = vector
+                self.embedding_cache.put(EmbeddingCache.key(self.model_id, data.get("dimensions"), text), vector)
+            usage = result.get("usage") or usage
+            model = result.get("model", model)
+
+        encoding_format = data.get("encoding_format")
+        return EmbeddingResponse.from_dict({
+            "object": "list",
+            "data": [
+                {"object": "embedding", "embedding": unpack_vector(cached[text], encoding_format), "index": index}
+                for index, text in enumerate(texts)
+            ],
+            "model": model,
+            "usage": usage,
+        })
+
+    def create_embeddings_array(self, input_data: Union[str, List[str]], **kwargs) -> "numpy.ndarray":
+        """
+        Create embeddings and return them as a contiguous float32 numpy matrix.
+
+        Requests ``encoding_format="base64"`` (unless overridden) so vectors are
+        decoded straight into the array without building Python float lists.
+
+        Args:
+            input_data (Union[str, List[str]]): Text string or list of text strings to embed
+            **kwargs: Additional parameters passed to create_embeddings
+
+        Returns:
+            numpy.ndarray: Matrix of shape (len(input_data), dimensions) in input order
+
+        Raises:
+            ValueError: If required parameters are missing or if the API request fails
+            ImportError: If numpy is not installed
+        """
+        kwargs.setdefault("encoding_format", "base64")
+        return self.create_embeddings(input_data, **kwargs).as_array()
+
+    def iter_embeddings(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 128,
+        max_concurrency: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        ordered: bool = False,
+        **kwargs,
+    ) -> Generator[EmbeddingResponse, None, None]:
+        """
+        Embed an arbitrarily large corpus in concurrent batches, yielding each
+        batch's EmbeddingResponse as soon as it arrives.
+
+        Args:
+            texts (Iterable[str]): Texts to embed. Consumed lazily, so a generator works.
+            batch_size (int): Maximum number of texts per request. Defaults to 128.
+            max_concurrency (Optional[int]): Maximum number of requests in flight. Defaults to 4,
+                or to ``concurrency_limiter.max_limit`` when the client has an adaptive limiter.
+            max_batch_tokens (Optional[int]): Also bound each request by estimated tokens.
+            ordered (bool): Yield batches in input order instead of as completed. Defaults to False.
+            **kwargs: Additional parameters passed to create_embeddings (e.g. dimensions).
+
+        Returns:
+            Generator[EmbeddingResponse]: One response per batch. ``data[i].index`` is the
+            position of the text in ``texts``, not in the batch.
+
+        Raises:
+            ValueError: If any text is empty or a batch request fails
+        """
+
+        def embed(batch):
+            return self.create_embeddings(batch[1], **kwargs)
+
+        batches = iter_batches(texts, batch_size, max_batch_tokens)
+        workers = self._batch_concurrency(max_concurrency, 4)
+        for (start, _), future in bounded_map(embed, batches, workers, ordered):
+            response = future.result()
+            for item in response.data:
+                item.index += start
+            yield response
+
+    def embed_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 128,
+        max_concurrency: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> EmbeddingResponse:
+        """
+        Embed an arbitrarily large corpus in concurrent batches and return a
+        single EmbeddingResponse in input order with aggregated usage.
+
+        See ``iter_embeddings`` for the arguments; use it instead to write
+        results out incrementally without holding them all in memory.
+        """
+        return merge_embedding_responses(
+            self.iter_embeddings(texts, batch_size, max_concurrency, max_batch_tokens, **kwargs),
+            model=self.model_id,
+        )
+
     # ---------------------------------------------------------------------
     # CHAT COMPLETION
     # ---------------------------------------------------------------------
@@ -503,7 +868,7 @@ class ModelAsAService:
         **kwargs,
     ) -> Union[
         ChatCompletionResponse,
-        Generator[ChatCompletionChunk, None, None],
+        ResponseStream,
     ]:
         """
         Create a chat completion using large language models.
@@ -530,38 +895,26 @@ class ModelAsAService:
                     - model (str): Model used for completion
                     - choices (List[ChatChoice]): List of completion choices
                     - usage (ChatUsage): Token usage statistics
-                - If stream=True: Generator yielding ChatCompletionChunk objects
+                - If stream=True: ResponseStream yielding ChatCompletionChunk objects; call
+                  ``get_final_response()`` on it for the assembled ChatCompletionResponse
 
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
+        data = self._chat_completion_data(messages, stream, kwargs)
+        cache_key = self._response_cache_key("/v1/chat/completions", data)
+        cached = self.response_cache.get(cache_key) if cache_key else None
 
+        span = self._start_span(
+            "maas.chat_completion", data if cached is None else {**data, "cached": True}
+        )
 
-       
-        self._validate_required_params({"messages": messages})
-        self._validate_optional_params(kwargs)
-
-        # Validate messages structure
-        for i, message in enumerate(messages):
-            if not isinstance(message, dict):
-                raise ValueError(f"Message {i} must be a dictionary")
-            if "role" not in message or not message["role"]:
-                raise ValueError(f"Message {i} must have a valid 'role' field")
-            if "content" not in message or not message["content"]:
-                raise ValueError(f"Message {i} must have a valid 'content' field")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-
-
-        data = {
-            "model": self.model_id,
-            "messages": messages,
-            "stream": stream,
-            **kwargs,
-        }
-
-        span = self.tracer.start_span("maas.chat_completion", data)
+        if cached is not None:
+            self._trace_cached(span, cached, messages, chat=True)
+            if not stream:
+                return ChatCompletionResponse.from_dict(cached)
+            chunks, accumulator = self._cached_chunks(cached, chat=True)
+            return ResponseStream(iter(chunks), accumulator)
 
         if not stream:
             try:
@@ -586,49 +939,96 @@ class ModelAsAService:
                 )
 
                 span.end()
+                self._store_response(cache_key, result)
                 return ChatCompletionResponse.from_dict(result)
             except Exception as e:
-                span.end()
+                span.end(error=e)
                 raise
 
+        accumulator = StreamAccumulator(chat=True)
+        timer = StreamTimer("maas.chat_completion", self.model_id)
+
         def _stream_generator():
-            collected = ""
+            chunks = None
+            completed = False
+            error = None
             try:
                 span.start_generation(
                     model=self.model_id,
                     input=messages,
                 )
-                for chunk in self._send_request(
+                timer.start()
+                chunks = self._send_request(
                     "POST",
                     "/v1/chat/completions",
                     json_data=data,
                     stream=True,
-                ):
-                    if "choices" in chunk:
-                        delta = chunk["choices"][0].get("delta", {})
-                        content = delta.get("content")
-                        if content:
-                            collected += content
+                )
+                for chunk in chunks:
+                    timer.tick()
+                    accumulator.add(chunk)
                     yield ChatCompletionChunk.from_dict(chunk)
 
                 span.end_generation(
                     model=self.model_id,
-                    output=collected,
-                    usage=None,
+                    output=accumulator.text,
+                    usage=accumulator.usage,
                 )
-
-                span.end()
+                record_usage("/v1/chat/completions", self.model_id, accumulator.usage)
+                completed = True
+                self._store_stream(cache_key, accumulator)
             except Exception as e:
-                span.end()
+                error = e
                 raise
+            finally:
+                # Also runs when the caller stops early (break, close()).
+                if chunks is not None:
+                    chunks.close()
+                self._finish_stream(span, timer, completed)
+                span.end(error=error)
+
+        return ResponseStream(_stream_generator(), accumulator, timer)
+
+    def chat_completion_batch(
+        self,
+        messages_list: Iterable[List[Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchRun:
+        """
+        Run many independent chat completions concurrently on the shared transport.
+
+        Args:
+            messages_list (Iterable[List[Dict[str, Any]]]): One conversation per request.
+                Consumed lazily, so a generator works.
+            max_concurrency (Optional[int]): Maximum number of requests in flight. Defaults to 8,
+                or to ``concurrency_limiter.max_limit`` when the client has an adaptive limiter.
+            ordered (bool): Yield results in input order instead of as completed. Defaults to True.
+            **kwargs: Parameters passed to every chat_completion call (streaming is not supported).
+
+        Returns:
+            BatchRun: Iterator of BatchItem objects with ``index``, ``response`` and ``error``.
+            A failed request is reported on its item and does not stop the batch. ``usage``
+            holds the aggregate ChatUsage once iteration has finished.
+
+        Raises:
+            ValueError: If stream=True is passed or max_concurrency is less than 1
+        """
+        if kwargs.pop("stream", False):
+            raise ValueError("chat_completion_batch does not support streaming")
 
-        return _stream_generator()
+        def run(item):
+            return self.chat_completion(item[1], **kwargs)
+
+        workers = self._batch_concurrency(max_concurrency, 8)
+        return BatchRun(bounded_map(run, enumerate(messages_list), workers, ordered))
 
     # ---------------------------------------------------------------------
     # COMPLETION
     # ---------------------------------------------------------------------
 
-    def completion(self, prompt: str, stream: bool = False, **kwargs) -> Union[CompletionResponse, Generator[CompletionChunk, None, None]]:
+    def completion(self, prompt: str, stream: bool = False, **kwargs) -> Union[CompletionResponse, ResponseStream]:
         """
         Create a text completion using large language models.
 
@@ -653,25 +1053,27 @@ class ModelAsAService:
                     - model (str): Model used for completion
                     - choices (List[CompletionChoice]): List of completion choices
                     - usage (CompletionUsage): Token usage statistics
-                - If stream=True: Generator yielding completion chunks
+                - If stream=True: ResponseStream yielding CompletionChunk objects; call
+                  ``get_final_response()`` on it for the assembled CompletionResponse
 
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
 
-        self._validate_required_params({"prompt": prompt})
-        self._validate_optional_params(kwargs)
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        data = {
-            "model": self.model_id,
-            "prompt": prompt,
-            "stream": stream,
-            **kwargs,
-        }
+        data = self._completion_data(prompt, stream, kwargs)
+        cache_key = self._response_cache_key("/v1/completions", data)
+        cached = self.response_cache.get(cache_key) if cache_key else None
+
+        span = self._start_span(
+            "maas.completion", data if cached is None else {**data, "cached": True}
+        )
 
-        span = self.tracer.start_span("maas.completion", data)
+        if cached is not None:
+            self._trace_cached(span, cached, prompt, chat=False)
+            if not stream:
+                return CompletionResponse.from_dict(cached)
+            chunks, accumulator = self._cached_chunks(cached, chat=False)
+            return ResponseStream(iter(chunks), accumulator)
 
         if not stream:
             try:
@@ -695,44 +1097,55 @@ class ModelAsAService:
                 )
 
                 span.end()
+                self._store_response(cache_key, result)
                 return CompletionResponse.from_dict(result)
             except Exception as e:
-                span.end()
+                span.end(error=e)
                 raise
 
+        accumulator = StreamAccumulator(chat=False)
+        timer = StreamTimer("maas.completion", self.model_id)
+
         def _stream_generator():
-            collected = ""
+            chunks = None
+            completed = False
+            error = None
             try:
                 span.start_generation(
                     model=self.model_id,
                     input=prompt,
                 )
-                
-                for chunk in self._send_request(
+                timer.start()
+                chunks = self._send_request(
                     "POST",
                     "/v1/completions",
                     json_data=data,
                     stream=True,
-                ):
-                    if "choices" in chunk:
-                        delta = chunk["choices"][0].get("delta", {})
-                        content = delta.get("content")
-                        if content:
-                            collected += content
+                )
+                for chunk in chunks:
+                    timer.tick()
+                    accumulator.add(chunk)
                     yield CompletionChunk.from_dict(chunk)
 
                 span.end_generation(
                     model=self.model_id,
-                    output=collected,
-                    usage=None,
+                    output=accumulator.text,
+                    usage=accumulator.usage,
                 )
-
-                span.end()
+                record_usage("/v1/completions", self.model_id, accumulator.usage)
+                completed = True
+                self._store_stream(cache_key, accumulator)
             except Exception as e:
-                span.end()
+                error = e
                 raise
+            finally:
+                # Also runs when the caller stops early (break, close()).
+                if chunks is not None:
+                    chunks.close()
+                self._finish_stream(span, timer, completed)
+                span.end(error=error)
 
-        return _stream_generator()
+        return ResponseStream(_stream_generator(), accumulator, timer)
 
     # ---------------------------------------------------------------------
     # MODELS & RERANK
@@ -755,7 +1168,7 @@ class ModelAsAService:
         Raises:
             ValueError: If the API request fails
         """
-        response = self._send_request("GET", "/v1/models")
+        response = self._coalesced_request("GET", "/v1/models")
         return ModelsListResponse.from_dict(response["result"])
 
     def rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]], 
@@ -787,31 +1200,10 @@ class ModelAsAService:
             ValueError: If required parameters are missing or if the API request fails
         """      
 
-        self._validate_required_params({"query": query, "documents": documents})
-        self._validate_optional_params(kwargs)
-
-        # Validate documents structure
-        for i, doc in enumerate(documents):
-            if isinstance(doc, str) and not doc.strip():
-                raise ValueError(f"Document {i} must not be empty")
-            elif isinstance(doc, dict):
-                if "text" not in doc or not doc["text"]:
-                    raise ValueError(f"Document {i} must have a valid 'text' field")
-            elif not isinstance(doc, (str, dict)):
-                raise ValueError(f"Document {i} must be a string or dictionary")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-
-        response = self._send_request(
+        response = self._coalesced_request(
             "POST",
             "/v1/rerank",
-            json_data={
-                "model": self.model_id,
-                "query": query,
-                "documents": documents,
-                **kwargs,
-            },
+            json_data=self._rerank_data(query, documents, kwargs),
+            idempotent=True,
         )
         return RerankResponse.from_dict(response["result"])
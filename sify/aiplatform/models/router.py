@@ -0,0 +1,305 @@
+import math
+import random
+import threading
+import weakref
+from dataclasses import dataclass, replace
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.models.batching import AsyncBatchRun, BatchRun, abounded_map, bounded_map
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.models.streaming import AsyncResponseStream, ResponseStream
+from sify.aiplatform.observability.metrics import get_metrics
+from sify.aiplatform.transport.circuit import CircuitBreaker
+from sify.aiplatform.transport.errors import (
+    APIConnectionError,
+    CircuitOpenError,
+    RateLimitError,
+    ServerError,
+)
+from sify.aiplatform.transport.async_transport import get_async_transport
+from sify.aiplatform.transport.http_transport import get_transport, rewind
+from sify.aiplatform.transport.retry import NO_RETRY, RetryPolicy
+
+# Errors that say the model, not the request, is the problem.
+FAILOVER_ERRORS = (RateLimitError, ServerError, APIConnectionError)
+
+# Copies of each shared transport with a router retry policy, so every
+# router on the same policy reuses one connection pool.
+_routed_transports: "weakref.WeakKeyDictionary[Any, List[Tuple[RetryPolicy, Any]]]" = weakref.WeakKeyDictionary()
+_routed_lock = threading.Lock()
+
+
+@dataclass
+class ModelRoute:
+    """One model behind a ``ModelRouter``, with an optional API key of its own."""
+
+    model_id: str
+    weight: float = 1.0
+    api_key: Optional[str] = None
+
+
+def _seekables(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Tuple[Any, int]]:
+    """Remember where uploaded file objects start so a failover can rewind them."""
+    values = (*args, *kwargs.values())
+    return [(value, value.tell()) for value in values if hasattr(value, "seek") and hasattr(value, "tell")]
+
+
+class ModelRouter:
+    """
+    Client that spreads requests over several models and fails over between them.
+
+    ``routes`` is a list of model ids or ``ModelRoute`` objects. With
+    ``strategy="ordered"`` every request goes to the first healthy route
+    and the others are fallbacks in list order. With
+    ``strategy="weighted"`` the first choice is drawn in proportion to
+    ``weight`` and the remaining routes are tried in a weighted random
+    order; a weight of 0 makes a route fallback-only.
+
+    A 429, a 5xx or a connection error moves the request on to the next
+    route. Other errors (bad request, authentication) are raised at once.
+    Each route has a ``CircuitBreaker``: after ``failure_threshold``
+    consecutive 5xx or connection failures it is skipped for ``recovery_time`` seconds and
+    then probed with a single request. When every route is open,
+    ``CircuitOpenError`` is raised without sending anything.
+
+    Responses carry ``served_by``, the model id that produced them.
+    Streams fail over only until the first chunk arrives.
+
+    Failing over between models is only transparent when they are
+    interchangeable for the call; in particular, embeddings from different
+    models are not comparable, so embedding routes should name the same
+    model under different API keys.
+
+    Routes are sent with ``retry`` (no retries by default) so a failing
+    model hands the request to the next route at once instead of first
+    backing off against itself. All routes share one transport, built once
+    per retry policy from the shared transport's configuration and sharing
+    its circuit breakers, so routers do not each open a connection pool;
+    pass ``transport=`` to use your own instead.
+
+    ``client_kwargs`` (``rate_limiter``, ``response_cache``, ...) are
+    passed to every per-route ``ModelAsAService``.
+    """
+
+    client_class = ModelAsAService
+    shared_transport = staticmethod(get_transport)
+
+    def __init__(
+        self,
+        api_key: str,
+        routes: Sequence[Union[str, ModelRoute]],
+        *,
+        strategy: str = "ordered",
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        base_url: Optional[str] = None,
+        retry: RetryPolicy = NO_RETRY,
+        **client_kwargs: Any,
+    ):
+        if strategy not in ("ordered", "weighted"):
+            raise ValueError("strategy must be 'ordered' or 'weighted'")
+        self.routes = [route if isinstance(route, ModelRoute) else ModelRoute(route) for route in routes]
+        if not self.routes:
+            raise ValueError("At least one route must be provided")
+        for route in self.routes:
+            if not (route.weight >= 0 and math.isfinite(route.weight)):
+                raise ValueError(f"Route weight must be a finite number >= 0, got {route.weight!r} for {route.model_id!r}")
+        self.strategy = strategy
+        if "transport" not in client_kwargs:
+            client_kwargs["transport"] = self._routed_transport(retry)
+        self.clients: List[ModelAsAService] = []
+        self.breakers: List[CircuitBreaker] = []
+        for route in self.routes:
+            client = self.client_class(route.api_key or api_key, route.model_id, **client_kwargs)
+            if base_url:
+                client.base_url = base_url.rstrip("/")
+            self.clients.append(client)
+            self.breakers.append(CircuitBreaker(failure_threshold, recovery_time, name=route.model_id))
+
+    def _routed_transport(self, retry: RetryPolicy):
+        shared = self.shared_transport()
+        with _routed_lock:
+            routed = _routed_transports.setdefault(shared, [])
+            for policy, transport in routed:
+                if policy == retry:
+                    return transport
+            transport = type(shared)(replace(shared.config, retry=retry))
+            # Same upstream health as every other client on the shared transport.
+            transport.circuits = shared.circuits
+            routed.append((replace(retry), transport))
+            return transport
+
+    # ---------------------------------------------------------------------
+    # ROUTING
+    # ---------------------------------------------------------------------
+
+    def _candidates(self) -> List[int]:
+        """Route indices in the order this request should try them."""
+        indices = range(len(self.routes))
+        if self.strategy == "ordered":
+            return list(indices)
+
+        # Weighted sampling without replacement: sort by u ** (1 / weight).
+        def key(index: int) -> float:
+            weight = self.routes[index].weight
+            return random.random() ** (1.0 / weight) if weight > 0 else -1.0
+
+        return sorted(indices, key=key, reverse=True)
+
+    def _failed(self, index: int, error: Exception) -> None:
+        if isinstance(error, (CircuitOpenError, RateLimitError)):
+            # Never sent, or throttled by a route that is up: not a failure.
+            self.breakers[index].release()
+        else:
+            self.breakers[index].record_failure()
+        metrics = get_metrics()
+        if hasattr(metrics, "counter"):
+            metrics.counter(
+                "router_failovers_total", "Requests moved off a model after a retryable error.", ("model", "error")
+            ).inc(model=self.routes[index].model_id, error=type(error).__name__)
+
+    def _served(self, index: int, result: Any) -> Any:
+        self.breakers[index].record_success()
+        if not isinstance(result, (bytes, bytearray)):
+            result.served_by = self.routes[index].model_id
+        return result
+
+    def _unavailable(self, last_error: Optional[Exception]) -> Exception:
+        if last_error is not None:
+            return last_error
+        return CircuitOpenError(
+            "All model routes are unavailable: circuits open for "
+            + ", ".join(route.model_id for route in self.routes),
+            retry_after=min(breaker.retry_after() for breaker in self.breakers),
+        )
+
+    def _route(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        positions = _seekables(args, kwargs)
+        last_error: Optional[Exception] = None
+        for index in self._candidates():
+            breaker = self.breakers[index]
+            if not breaker.allow():
+                continue
+            rewind(positions)
+            try:
+                result = getattr(self.clients[index], method)(*args, **kwargs)
+                if isinstance(result, ResponseStream):
+                    result.start()
+            except FAILOVER_ERRORS as e:
+                self._failed(index, e)
+                last_error = e
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            return self._served(index, result)
+        raise self._unavailable(last_error)
+
+    def health(self) -> List[Dict[str, Any]]:
+        """Circuit state of every route, in configuration order."""
+        return [{"model_id": route.model_id, **breaker.stats()} for route, breaker in zip(self.routes, self.breakers)]
+
+    # ---------------------------------------------------------------------
+    # API
+    # ---------------------------------------------------------------------
+
+    def chat_completion(self, messages: List[Dict[str, Any]], stream: bool = False, **kwargs):
+        """``ModelAsAService.chat_completion`` on the first route that can serve it."""
+        return self._route("chat_completion", messages, stream=stream, **kwargs)
+
+    def completion(self, prompt: str, stream: bool = False, **kwargs):
+        """``ModelAsAService.completion`` on the first route that can serve it."""
+        return self._route("completion", prompt, stream=stream, **kwargs)
+
+    def create_embeddings(self, input_data: Union[str, List[str]], **kwargs):
+        """``ModelAsAService.create_embeddings`` on the first route that can serve it."""
+        return self._route("create_embeddings", input_data, **kwargs)
+
+    def rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]], **kwargs):
+        """``ModelAsAService.rerank`` on the first route that can serve it."""
+        return self._route("rerank", query, documents, **kwargs)
+
+    def speech_to_text(self, file: BinaryIO, **kwargs):
+        """``ModelAsAService.speech_to_text``; ``file`` is rewound before each attempt."""
+        return self._route("speech_to_text", file, **kwargs)
+
+    def audio_translation(self, file: BinaryIO, **kwargs):
+        """``ModelAsAService.audio_translation``; ``file`` is rewound before each attempt."""
+        return self._route("audio_translation", file, **kwargs)
+
+    def text_to_speech(self, input_text: str, voice: str, **kwargs):
+        """``ModelAsAService.text_to_speech``; returns bytes, so ``served_by`` is not set."""
+        return self._route("text_to_speech", input_text, voice, **kwargs)
+
+    def list_models(self):
+        return self._route("list_models")
+
+    def chat_completion_batch(
+        self,
+        messages_list: Iterable[List[Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> BatchRun:
+        """``ModelAsAService.chat_completion_batch`` with each request routed separately."""
+        if kwargs.pop("stream", False):
+            raise ValueError("chat_completion_batch does not support streaming")
+
+        def run(item):
+            return self.chat_completion(item[1], **kwargs)
+
+        workers = self.clients[0]._batch_concurrency(max_concurrency, 8)
+        return BatchRun(bounded_map(run, enumerate(messages_list), workers, ordered))
+
+
+class AsyncModelRouter(ModelRouter):
+    """
+    asyncio counterpart of ``ModelRouter``; every API method is a coroutine::
+
+        router = AsyncModelRouter(api_key, ["model-a", "model-b"])
+        response = await router.chat_completion(messages)
+        response.served_by
+    """
+
+    client_class = AsyncModelAsAService
+    shared_transport = staticmethod(get_async_transport)
+
+    async def _route(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        positions = _seekables(args, kwargs)
+        last_error: Optional[Exception] = None
+        for index in self._candidates():
+            breaker = self.breakers[index]
+            if not breaker.allow():
+                continue
+            rewind(positions)
+            try:
+                result = await getattr(self.clients[index], method)(*args, **kwargs)
+                if isinstance(result, AsyncResponseStream):
+                    await result.start()
+            except FAILOVER_ERRORS as e:
+                self._failed(index, e)
+                last_error = e
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            return self._served(index, result)
+        raise self._unavailable(last_error)
+
+    def chat_completion_batch(
+        self,
+        messages_list: Iterable[List[Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncBatchRun:
+        """``AsyncModelAsAService.chat_completion_batch`` with each request routed separately."""
+        if kwargs.pop("stream", False):
+            raise ValueError("chat_completion_batch does not support streaming")
+
+        async def run(item):
+            return await self.chat_completion(item[1], **kwargs)
+
+        workers = self.clients[0]._batch_concurrency(max_concurrency, 8)
+        return AsyncBatchRun(abounded_map(run, enumerate(messages_list), workers, ordered))
@@ -0,0 +1,231 @@
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from sify.aiplatform.models.api_types import (
+    ChatCompletionChunk,
+    ChatCompletionResponse,
+    CompletionChunk,
+    CompletionResponse,
+)
+from sify.aiplatform.observability.stream_metrics import StreamStats, StreamTimer
+
+
+class _ChoiceState:
+    __slots__ = ("parts", "role", "finish_reason", "tool_calls")
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.role = "assistant"
+        self.finish_reason = None
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}
+
+
+class StreamAccumulator:
+    """
+    Reassembles streamed chunk dicts into the full response.
+
+    Text fragments are collected in lists and joined once, so accumulation
+    is linear in the length of the generation. Handles chat ``delta``
+    content, text-completion ``text``, ``tool_calls`` fragments (arguments
+    are concatenated per call index) and a trailing ``usage`` chunk.
+    """
+
+    def __init__(self, chat: bool = True):
+        self.chat = chat
+        self.id = ""
+        self.created = 0
+        self.model = ""
+        self.usage: Optional[Dict[str, Any]] = None
+        self._choices: Dict[int, _ChoiceState] = {}
+
+    def add(self, chunk: Dict[str, Any]) -> None:
+        if not self.id:
+            self.id = chunk.get("id") or ""
+            self.created = chunk.get("created") or 0
+            self.model = chunk.get("model") or ""
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+
+        for choice in chunk.get("choices") or ():
+            index = choice.get("index", 0)
+            state = self._choices.get(index)
+            if state is None:
+                state = self._choices[index] = _ChoiceState()
+
+            delta = choice.get("delta") or {}
+            text = choice.get("text") if not self.chat else None
+            if text is None:
+                text = delta.get("content")
+            if text:
+                state.parts.append(text)
+            if delta.get("role"):
+                state.role = delta["role"]
+            for fragment in delta.get("tool_calls") or ():
+                self._add_tool_call(state, fragment)
+            if choice.get("finish_reason") is not None:
+                state.finish_reason = choice["finish_reason"]
+
+    @staticmethod
+    def _add_tool_call(state: _ChoiceState, fragment: Dict[str, Any]) -> None:
+        index = fragment.get("index", len(state.tool_calls))
+        call = state.tool_calls.get(index)
+        if call is None:
+            call = state.tool_calls[index] = {"id": None, "type": "function", "name": "", "arguments": []}
+        if fragment.get("id"):
+            call["id"] = fragment["id"]
+        if fragment.get("type"):
+            call["type"] = fragment["type"]
+        function = fragment.get("function") or {}
+        if function.get("name"):
+            call["name"] += function["name"]
+        if function.get("arguments"):
+            call["arguments"].append(function["arguments"])
+
+    @property
+    def text(self) -> str:
+        """Text generated so far for the first choice."""
+        state = self._choices.get(0)
+        return "".join(state.parts) if state else ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        choices = []
+        for index in sorted(self._choices):
+            state = self._choices[index]
+            text = "".join(state.parts)
+            if self.chat:
+                message: Dict[str, Any] = {"role": state.role, "content": text}
+                if state.tool_calls:
+                    message["content"] = text or None
+                    message["tool_calls"] = [
+                        {
+                            "id": call["id"],
+                            "type": call["type"],
+                            "function": {"name": call["name"], "arguments": "".join(call["arguments"])},
+                        }
+                        for _, call in sorted(state.tool_calls.items())
+                    ]
+                choice = {"index": index, "message": message}
+            else:
+                choice = {"index": index, "text": text}
+            choice["finish_reason"] = state.finish_reason
+            choices.append(choice)
+
+        return {
+            "id": self.id,
+            "object": "chat.completion" if self.chat else "text_completion",
+            "created": self.created,
+            "model": self.model,
+            "choices": choices,
+            "usage": self.usage,
+        }
+
+    def response(self) -> Union[ChatCompletionResponse, CompletionResponse]:
+        data = self.to_dict()
+        return ChatCompletionResponse.from_dict(data) if self.chat else CompletionResponse.from_dict(data)
+
+
+# ------------------------------------------------------------------
+# Stream wrappers returned by chat_completion / completion(stream=True)
+# ------------------------------------------------------------------
+class ResponseStream:
+    """
+    Iterator of ``ChatCompletionChunk``/``CompletionChunk`` objects that
+    also builds the complete response as it goes::
+
+        stream = client.chat_completion(messages, stream=True)
+        for chunk in stream:
+            ...
+        response = stream.get_final_response()
+        stream.stats  # TTFT and inter-chunk gaps, once the stream has ended
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[Union[ChatCompletionChunk, CompletionChunk]],
+        accumulator: StreamAccumulator,
+        timer: Optional[StreamTimer] = None,
+    ):
+        self._chunks = chunks
+        self.accumulator = accumulator
+        self.timer = timer
+        self._first: List[Any] = []
+
+    @property
+    def stats(self) -> Optional[StreamStats]:
+        return self.timer.stats if self.timer is not None else None
+
+    def start(self) -> "ResponseStream":
+        """
+        Send the request and wait for the first chunk now, so connection
+        and HTTP status errors raise here instead of on first iteration.
+        """
+        if not self._first:
+            try:
+                self._first.append(next(self._chunks))
+            except StopIteration:
+                pass
+        return self
+
+    def __iter__(self) -> "ResponseStream":
+        return self
+
+    def __next__(self) -> Union[ChatCompletionChunk, CompletionChunk]:
+        if self._first:
+            return self._first.pop()
+        return next(self._chunks)
+
+    def close(self) -> None:
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def get_final_response(self) -> Union[ChatCompletionResponse, CompletionResponse]:
+        """Consume any remaining chunks and return the assembled response."""
+        for _ in self:
+            pass
+        return self.accumulator.response()
+
+
+class AsyncResponseStream:
+    """asyncio counterpart of ``ResponseStream``."""
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[Union[ChatCompletionChunk, CompletionChunk]],
+        accumulator: StreamAccumulator,
+        timer: Optional[StreamTimer] = None,
+    ):
+        self._chunks = chunks
+        self.accumulator = accumulator
+        self.timer = timer
+        self._first: List[Any] = []
+
+    @property
+    def stats(self) -> Optional[StreamStats]:
+        return self.timer.stats if self.timer is not None else None
+
+    async def start(self) -> "AsyncResponseStream":
+        """See ``ResponseStream.start``."""
+        if not self._first:
+            try:
+                self._first.append(await self._chunks.__anext__())
+            except StopAsyncIteration:
+                pass
+        return self
+
+    def __aiter__(self) -> "AsyncResponseStream":
+        return self
+
+    async def __anext__(self) -> Union[ChatCompletionChunk, CompletionChunk]:
+        if self._first:
+            return self._first.pop()
+        return await self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def get_final_response(self) -> Union[ChatCompletionResponse, CompletionResponse]:
+        async for _ in self:
+            pass
+        return self.accumulator.response()
@@ -1 +1,10 @@
-# observability package 
\ No newline at end of file
+# observability package
+from .metrics import CONTENT_TYPE, MetricsHook, MetricsRegistry, configure_metrics, get_metrics
+
+__all__ = [
+    "CONTENT_TYPE",
+    "MetricsHook",
+    "MetricsRegistry",
+    "configure_metrics",
+    "get_metrics",
+]
@@ -1,8 +1,11 @@
 from .config import configure_langfuse
-from .tracer import set_langfuse_identity, get_tracer
+from .exporter import BackgroundExporter
+from .tracer import langfuse_identity, set_langfuse_identity, get_tracer
 
 __all__ = [
+    "BackgroundExporter",
     "configure_langfuse",
+    "langfuse_identity",
     "set_langfuse_identity",
     "get_tracer",
 ]
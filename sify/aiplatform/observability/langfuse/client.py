@@ -1,14 +1,16 @@
 
-from typing import Optional
-from langfuse import Langfuse
+from typing import TYPE_CHECKING, Optional
 
 from sify.aiplatform.observability.langfuse.config import get_langfuse_config
 from sify.aiplatform.observability.langfuse.detect_app import detect_app_name  # ✅ REQUIRED
 
-_client: Optional[Langfuse] = None
+if TYPE_CHECKING:
+    from langfuse import Langfuse
 
+_client: Optional["Langfuse"] = None
 
-def get_langfuse_client() -> Optional[Langfuse]:
+
+def get_langfuse_client() -> Optional["Langfuse"]:
     global _client
 
     cfg = get_langfuse_config()
@@ -21,6 +23,9 @@ def get_langfuse_client() -> Optional[Langfuse]:
     # ✅ Now Python knows this name
     app_name = detect_app_name()
 
+    # Imported here so that importing the SDK costs nothing while tracing is off.
+    from langfuse import Langfuse
+
     _client = Langfuse(
         host=cfg.host,
         public_key=cfg.public_key,
@@ -49,31 +49,84 @@
 #     return _langfuse_config
 from dataclasses import dataclass
 from sify.aiplatform.observability.langfuse.detect_app import detect_app_name
+from sify.aiplatform.observability.langfuse.redaction import DEFAULT_REDACT_KEYS
 @dataclass
 class LangfuseConfig:
     enabled: bool = False
     host: str | None = None
     public_key: str | None = None
     secret_key: str | None = None
+    sample_rate: float = 1.0
+    keep_errors: bool = True
+    keep_slow: bool = True
+    slow_threshold: float | None = None
+    max_field_chars: int | None = 4096
+    max_items: int | None = 100
+    redact_keys: tuple = DEFAULT_REDACT_KEYS
+    redact_patterns: tuple = ()
+    spool_path: str | None = None
+    spool_max_bytes: int = 64 * 1024 * 1024
 
 
 _cfg = LangfuseConfig()
 
 
-def configure_langfuse(*, enabled: bool, host=None, public_key=None, secret_key=None):
+def configure_langfuse(
+    *,
+    enabled: bool,
+    host=None,
+    public_key=None,
+    secret_key=None,
+    sample_rate: float = 1.0,
+    keep_errors: bool = True,
+    keep_slow: bool = True,
+    slow_threshold: float | None = None,
+    max_field_chars: int | None = 4096,
+    max_items: int | None = 100,
+    redact_keys=DEFAULT_REDACT_KEYS,
+    redact_patterns=(),
+    spool_path: str | None = None,
+    spool_max_bytes: int = 64 * 1024 * 1024,
+):
+    """
+    Configure Langfuse tracing. Call once, before the first client is created.
+
+    ``sample_rate`` is the fraction of calls traced (head sampling). Calls
+    outside the sample are still exported when they raise (``keep_errors``)
+    or run slower than ``slow_threshold`` seconds, or than the rolling p99
+    of their span name when no threshold is given (``keep_slow``). With
+    both tail rules off, unsampled calls get a shared no-op span.
+
+    Before export, strings longer than ``max_field_chars`` are truncated
+    and tagged with a sha256 of the full text, lists keep ``max_items``
+    entries, values under ``redact_keys`` are replaced and every string
+    is scrubbed with ``redact_patterns`` (regexes or ``(regex,
+    replacement)`` pairs). ``None`` disables a limit.
+
+    With ``spool_path``, spans produced while the Langfuse host is
+    unreachable are journaled to that directory (at most
+    ``spool_max_bytes``) and replayed in order once it is back.
+    """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0 and 1")
     _cfg.enabled = enabled
     _cfg.host = host
     _cfg.public_key = public_key
     _cfg.secret_key = secret_key
+    _cfg.sample_rate = sample_rate
+    _cfg.keep_errors = keep_errors
+    _cfg.keep_slow = keep_slow
+    _cfg.slow_threshold = slow_threshold
+    _cfg.max_field_chars = max_field_chars
+    _cfg.max_items = max_items
+    _cfg.redact_keys = tuple(redact_keys)
+    _cfg.redact_patterns = tuple(redact_patterns)
+    _cfg.spool_path = spool_path
+    _cfg.spool_max_bytes = spool_max_bytes
 
 
 def get_langfuse_config() -> LangfuseConfig:
     return _cfg
 # config.py
-_app_name: str | None = None
-
 def get_app_name() -> str:
-    global _app_name
-    if not _app_name:
-        _app_name = _detect_app_name()
-    return _app_name
+    return detect_app_name()
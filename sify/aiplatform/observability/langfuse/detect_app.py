@@ -84,7 +84,18 @@ INVALID = {
     "__main__",
 }
 
+_app_name: str | None = None
+
+
 def detect_app_name() -> str:
+    """Name of the running application, detected on the first call and cached."""
+    global _app_name
+    if _app_name is None:
+        _app_name = _detect_app_name()
+    return _app_name
+
+
+def _detect_app_name() -> str:
     # 0️⃣ Explicit config always wins
     if os.getenv("SIFY_APP_NAME"):
         return os.getenv("SIFY_APP_NAME")
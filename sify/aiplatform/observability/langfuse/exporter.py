@@ -0,0 +1,372 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from sify.aiplatform.observability.langfuse.detect_app import detect_app_name
+from sify.aiplatform.observability.langfuse.redaction import PayloadLimiter
+from sify.aiplatform.observability.langfuse.spool import SpanSpool
+from sify.aiplatform.observability.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from langfuse import Langfuse
+
+logger = logging.getLogger(__name__)
+
+
+class SpanRecord:
+    """
+    Plain snapshot of one traced call, built on the request path.
+
+    ``input`` is kept by reference while the call runs; ``submit()``
+    replaces it (and the generation input and output) with a limited copy
+    on the caller's thread, so later mutation by the caller cannot race
+    with the export. Timestamps are wall-clock seconds (``time.time()``). ``generation`` is
+    ``None`` or a dict with ``model``, ``input``, ``output``, ``usage``,
+    ``cost_details``, ``start_time`` and ``end_time``; ``error`` describes
+    the exception the call raised, if any. ``trace_context`` attaches the
+    span to an existing trace.
+    """
+
+    __slots__ = ("name", "input", "metadata", "user_id", "session_id", "start_time", "end_time", "generation", "error",
+                 "trace_context")
+
+    def __init__(
+        self,
+        name: str,
+        input: Dict[str, Any],
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        trace_context: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.input = input
+        self.metadata: Dict[str, Any] = {}
+        self.user_id = user_id
+        self.session_id = session_id
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.generation: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.trace_context = trace_context
+
+
+def _timing(start: float, end: Optional[float]) -> Dict[str, Any]:
+    return {
+        "start_time": datetime.fromtimestamp(start, timezone.utc).isoformat(),
+        "duration": (end - start) if end is not None else None,
+    }
+
+
+# Exporters that have not been shut down; flushed once at interpreter exit.
+_live_exporters: "weakref.WeakSet[BackgroundExporter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _shutdown_exporters() -> None:
+    for exporter in list(_live_exporters):
+        exporter.shutdown()
+
+
+class BackgroundExporter:
+    """
+    Ships ``SpanRecord`` objects to Langfuse from a daemon thread.
+
+    ``submit()`` never blocks: records go into a bounded queue and are
+    dropped (and counted in ``dropped``) when it is full. The worker
+    replays records through the Langfuse SDK in batches of up to
+    ``batch_size``. ``flush()`` waits for the queue to drain; exporters
+    that were not shut down are flushed at interpreter exit so spans
+    queued then are delivered.
+
+    Inputs, outputs and metadata pass through ``limiter`` in ``submit()``,
+    on the caller's thread, which truncates, hashes and redacts them (see
+    ``PayloadLimiter``); ``limiter=None`` uses the default limits.
+
+    Observations are created on the worker, so the SDK stamps them with
+    the export time; the recorded start time and duration are kept in
+    their metadata under ``_timing``.
+
+    With a ``spool``, the worker checks that the Langfuse host is up
+    (``health_check``, at most every ``probe_interval`` seconds). While it
+    is down, or a send fails, prepared spans are appended to the spool
+    instead of being dropped, and the host is treated as down until the
+    next probe. Once it is back, spooled spans are replayed in order
+    before any newer ones; a span that fails again stays in the spool.
+    """
+
+    def __init__(
+        self,
+        client: "Langfuse",
+        max_queue_size: int = 2048,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        limiter: Optional[PayloadLimiter] = None,
+        spool: Optional[SpanSpool] = None,
+        health_check: Optional[Callable[[], bool]] = None,
+        probe_interval: float = 30.0,
+    ):
+        self.client = client
+        self.limiter = limiter if limiter is not None else PayloadLimiter()
+        self.spool = spool
+        self.health_check = health_check or self._default_health_check
+        self.probe_interval = probe_interval
+        self.spooled = 0
+        self.replayed = 0
+        self._online = True
+        self._probed_at = float("-inf")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.exported = 0
+        self._queue: "queue.Queue[SpanRecord]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        _live_exporters.add(self)
+
+    # ------------------------------------------------------------------
+    # Request path
+    # ------------------------------------------------------------------
+    def submit(self, record: SpanRecord) -> bool:
+        if self._closed:
+            return False
+        if self._thread is None:
+            self._start()
+        try:
+            self._snapshot(record)
+        except Exception:
+            logger.warning("Failed to snapshot span %r for export", record.name, exc_info=True)
+            self._record_drop()
+            return False
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self._record_drop()
+            return False
+
+    def _record_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+        metrics = get_metrics()
+        if hasattr(metrics, "counter"):
+            metrics.counter(
+                "langfuse_spans_dropped_total", "Spans dropped without being exported or spooled."
+            ).inc()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="langfuse-exporter", daemon=True)
+                self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._closed:
+                    return
+                if self.spool is not None and not self.spool.empty and self._reachable():
+                    self._replay_spool()
+                continue
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._export(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _export(self, batch: List[SpanRecord]) -> None:
+        entries = []
+        for record in batch:
+            try:
+                entries.append(self._prepare(record))
+            except Exception:
+                logger.warning("Failed to prepare span %r for export", record.name, exc_info=True)
+
+        # Older spans go first so ordering survives the outage.
+        if self.spool is not None and (not self._reachable() or not self._replay_spool()):
+            self._spool(entries)
+            return
+
+        for position, entry in enumerate(entries):
+            try:
+                self._deliver(entry)
+            except Exception:
+                logger.warning("Failed to export span %r to Langfuse", entry["name"], exc_info=True)
+                if self.spool is not None:
+                    self._mark_offline()
+                    self._spool(entries[position:])
+                    return
+
+    def _deliver(self, entry: Dict[str, Any]) -> None:
+        """Send one entry; raises if the SDK call fails."""
+        self._send(entry)
+        self.exported += 1
+
+    def _limit(self, value: Any) -> Any:
+        return self.limiter.apply(value)
+
+    def _snapshot(self, record: SpanRecord) -> None:
+        """Replace the caller's payloads with limited copies."""
+        record.input = self._limit(record.input)
+        record.metadata = self._limit(record.metadata)
+        generation = record.generation
+        if generation is not None:
+            generation["input"] = self._limit(generation["input"])
+            if "output" in generation:
+                generation["output"] = self._limit(generation["output"])
+
+    def _prepare(self, record: SpanRecord) -> Dict[str, Any]:
+        """Build the final payload for a snapshotted ``record``; JSON-serializable for the spool."""
+        entry: Dict[str, Any] = {
+            "name": record.name,
+            "user_id": record.user_id,
+            "session_id": record.session_id,
+            "trace_context": record.trace_context,
+            "input": {**record.input, "_observability": {"app_name": detect_app_name()}},
+            "metadata": {**record.metadata, "_timing": _timing(record.start_time, record.end_time)},
+            "error": record.error,
+            "generation": None,
+        }
+        generation = record.generation
+        if generation is not None:
+            entry["generation"] = {
+                "model": generation["model"],
+                "input": generation["input"],
+                "output": {"role": "assistant", "content": generation["output"]} if "output" in generation else None,
+                "usage": generation.get("usage"),
+                "cost_details": generation.get("cost_details"),
+                "metadata": {"_timing": _timing(generation["start_time"], generation.get("end_time"))},
+            }
+        return entry
+
+    def _send(self, entry: Dict[str, Any]) -> None:
+        from langfuse import propagate_attributes
+
+        with propagate_attributes(user_id=entry["user_id"], session_id=entry["session_id"]):
+            root = self.client.start_observation(
+                trace_context=entry["trace_context"],
+                as_type="span",
+                name=entry["name"],
+                input=entry["input"],
+                metadata=entry["metadata"],
+                level="ERROR" if entry["error"] else None,
+                status_message=entry["error"],
+            )
+            generation = entry["generation"]
+            if generation is not None:
+                child = root.start_observation(
+                    as_type="generation",
+                    name="model-generation",
+                    model=generation["model"],
+                    input=generation["input"],
+                    output=generation["output"],
+                    usage_details=generation["usage"],
+                    cost_details=generation["cost_details"],
+                    metadata=generation["metadata"],
+                )
+                child.end()
+            root.end()
+
+    # ------------------------------------------------------------------
+    # Offline spooling
+    # ------------------------------------------------------------------
+    def _reachable(self) -> bool:
+        """Cached result of ``health_check``, re-probed every ``probe_interval`` seconds."""
+        now = time.monotonic()
+        if now - self._probed_at >= self.probe_interval:
+            self._probed_at = now
+            try:
+                self._online = self.health_check() is not False
+            except Exception:
+                self._online = False
+        return self._online
+
+    def _default_health_check(self) -> bool:
+        self.client.api.health.health()
+        return True
+
+    def _mark_offline(self) -> None:
+        """Treat the host as down until the next probe."""
+        self._online = False
+        self._probed_at = time.monotonic()
+
+    def _spool(self, entries: List[Dict[str, Any]]) -> None:
+        try:
+            self.spool.append(entries)
+        except OSError:
+            logger.warning("Failed to spool %d Langfuse spans", len(entries), exc_info=True)
+            for _ in entries:
+                self._record_drop()
+            return
+        self.spooled += len(entries)
+
+    def _replay_spool(self) -> bool:
+        """Replay spooled spans oldest first; False if one failed and was kept."""
+        if self.spool.empty:
+            return True
+
+        def deliver(entry: Dict[str, Any]) -> None:
+            self._deliver(entry)
+            self.replayed += 1
+
+        try:
+            self.spool.replay(deliver, checkpoint_every=self.batch_size)
+        except Exception:
+            logger.warning("Failed to replay spooled Langfuse spans", exc_info=True)
+            self._mark_offline()
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Flush / shutdown
+    # ------------------------------------------------------------------
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued records are exported, then flush the SDK. Returns ``False`` on timeout."""
+        drained = self._wait_for_queue(timeout)
+        self.client.flush()
+        return drained
+
+    def _wait_for_queue(self, timeout: Optional[float]) -> bool:
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        _live_exporters.discard(self)
+        try:
+            self.flush(timeout)
+        except Exception:
+            logger.warning("Failed to flush Langfuse spans at shutdown", exc_info=True)
+        self._closed = True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "spooled": self.spooled,
+            "replayed": self.replayed,
+        }
@@ -0,0 +1,93 @@
+import hashlib
+import re
+from typing import Any, Iterable, Optional, Pattern, Sequence, Tuple, Union
+
+REDACTED = "[REDACTED]"
+
+# Characters past the truncation point still scanned by redaction patterns.
+REDACT_MARGIN = 256
+
+DEFAULT_REDACT_KEYS = ("api_key", "apikey", "authorization", "password", "secret", "secret_key", "token")
+
+RedactPattern = Union[str, Pattern[str], Tuple[Union[str, Pattern[str]], str]]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class PayloadLimiter:
+    """
+    Bounds and scrubs span payloads before they are exported.
+
+    - Strings longer than ``max_field_chars`` keep their first
+      ``max_field_chars`` characters, followed by a marker with the original
+      length and a sha256 of the full text, so identical prompts can still
+      be matched across traces.
+    - Lists and tuples keep their first ``max_items`` entries.
+    - Nesting below ``max_depth`` is replaced by a placeholder.
+    - Values under a key in ``redact_keys`` (case-insensitive) become
+      ``[REDACTED]``. Each ``redact_patterns`` entry is a regex, or a
+      ``(regex, replacement)`` pair, applied to the kept part of every
+      string, so the cost of redaction is bounded too.
+    - ``bytes`` are replaced by their size.
+
+    ``apply()`` returns a new structure and never mutates its input.
+    """
+
+    def __init__(
+        self,
+        max_field_chars: Optional[int] = 4096,
+        max_items: Optional[int] = 100,
+        max_depth: int = 12,
+        redact_keys: Iterable[str] = DEFAULT_REDACT_KEYS,
+        redact_patterns: Sequence[RedactPattern] = (),
+    ):
+        self.max_field_chars = max_field_chars
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.redact_keys = frozenset(key.lower() for key in redact_keys)
+        self._patterns = [self._compile(pattern) for pattern in redact_patterns]
+
+    @staticmethod
+    def _compile(pattern: RedactPattern) -> Tuple[Pattern[str], str]:
+        if isinstance(pattern, tuple):
+            regex, replacement = pattern
+        else:
+            regex, replacement = pattern, REDACTED
+        return re.compile(regex) if isinstance(regex, str) else regex, replacement
+
+    def apply(self, value: Any, depth: int = 0) -> Any:
+        if isinstance(value, str):
+            return self._string(value)
+        if isinstance(value, dict):
+            if depth >= self.max_depth:
+                return "[depth limit]"
+            return {
+                key: REDACTED if isinstance(key, str) and key.lower() in self.redact_keys
+                else self.apply(item, depth + 1)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            if depth >= self.max_depth:
+                return "[depth limit]"
+            items = value if self.max_items is None else value[:self.max_items]
+            limited = [self.apply(item, depth + 1) for item in items]
+            if len(value) > len(items):
+                limited.append(f"[{len(value) - len(items)} more items]")
+            return limited
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return f"[{len(value)} bytes]"
+        return value
+
+    def _string(self, text: str) -> str:
+        limit = self.max_field_chars
+        truncated = limit is not None and len(text) > limit
+        # Only the kept prefix is scanned, plus a margin so that a match
+        # straddling the cut is still redacted as a whole.
+        kept = text[:limit + REDACT_MARGIN] if truncated else text
+        for regex, replacement in self._patterns:
+            kept = regex.sub(replacement, kept)
+        if truncated:
+            kept = f"{kept[:limit]}... [truncated {len(text)} chars, sha256={content_hash(text)}]"
+        return kept
@@ -0,0 +1,83 @@
+import random
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class _LatencyWindow:
+    """Rolling window of recent durations with a periodically refreshed p99."""
+
+    __slots__ = ("samples", "threshold", "_since_refresh")
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.threshold: Optional[float] = None
+        self._since_refresh = 0
+
+    def observe(self, duration: float, min_samples: int, refresh_every: int) -> None:
+        self.samples.append(duration)
+        self._since_refresh += 1
+        if self._since_refresh >= refresh_every and len(self.samples) >= min_samples:
+            ordered = sorted(self.samples)
+            self.threshold = ordered[int(0.99 * (len(ordered) - 1))]
+            self._since_refresh = 0
+
+
+class Sampler:
+    """
+    Head and tail sampling decisions for traced calls.
+
+    ``head()`` is drawn when a span starts and keeps ``rate`` of calls.
+    Calls that lose the head draw are still kept at the end when tail rules
+    apply: ``keep_errors`` keeps calls that raised, ``keep_slow`` keeps
+    calls slower than ``slow_threshold`` seconds or, when that is ``None``,
+    slower than the rolling p99 of the same span name (estimated from the
+    last ``window`` calls, once ``min_samples`` have been seen).
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        keep_errors: bool = True,
+        keep_slow: bool = True,
+        slow_threshold: Optional[float] = None,
+        window: int = 1000,
+        min_samples: int = 100,
+    ):
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.rate = rate
+        self.keep_errors = keep_errors
+        self.keep_slow = keep_slow
+        self.slow_threshold = slow_threshold
+        self.window = window
+        self.min_samples = min_samples
+        self._windows: Dict[str, _LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tail_enabled(self) -> bool:
+        return self.keep_errors or self.keep_slow
+
+    def head(self) -> bool:
+        return self.rate >= 1.0 or (self.rate > 0.0 and random.random() < self.rate)
+
+    def finish(self, name: str, duration: float, error: Optional[BaseException], sampled: bool) -> bool:
+        """Record the call's duration and decide whether its span is exported."""
+        threshold = self.slow_threshold
+        if self.keep_slow and threshold is None:
+            with self._lock:
+                window = self._windows.get(name)
+                if window is None:
+                    window = self._windows[name] = _LatencyWindow(self.window)
+                threshold = window.threshold
+                window.observe(duration, self.min_samples, max(1, self.window // 10))
+        if sampled:
+            return True
+        if self.keep_errors and error is not None:
+            return True
+        return self.keep_slow and threshold is not None and duration > threshold
+
+    def p99(self, name: str) -> Optional[float]:
+        window = self._windows.get(name)
+        return window.threshold if window is not None else None
@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+_PREFIX = "spans-"
+_SUFFIX = ".jsonl"
+_CURSOR = "cursor.json"
+
+
+class SpanSpool:
+    """
+    Size-capped, rotating JSONL journal for spans that could not be sent.
+
+    ``append()`` writes one JSON object per line to the newest segment file
+    in ``path``, starting a new segment once it exceeds ``segment_bytes``.
+    When the journal grows past ``max_bytes`` the oldest segments are
+    deleted and their spans counted in ``dropped``.
+
+    ``replay()`` hands entries to a callback oldest first. Progress is
+    checkpointed to a cursor file every ``checkpoint_every`` entries and
+    fully delivered segments are deleted, so a crash during replay
+    re-delivers at most one checkpoint interval.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        segment_bytes: int = 4 * 1024 * 1024,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.segment_bytes = min(segment_bytes, max_bytes)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+    def _segments(self) -> List[str]:
+        names = [n for n in os.listdir(self.path) if n.startswith(_PREFIX) and n.endswith(_SUFFIX)]
+        return sorted(names)
+
+    def _segment_path(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _next_segment(self, segments: List[str]) -> str:
+        last = int(segments[-1][len(_PREFIX):-len(_SUFFIX)]) if segments else 0
+        return f"{_PREFIX}{last + 1:010d}{_SUFFIX}"
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(self._segment_path(n)) for n in self._segments())
+
+    @property
+    def empty(self) -> bool:
+        return not self._segments()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(self, entries: List[Dict[str, Any]]) -> None:
+        if not entries:
+            return
+        data = "".join(
+            json.dumps(entry, separators=(",", ":"), ensure_ascii=False, default=str) + "\n" for entry in entries
+        ).encode("utf-8")
+        with self._lock:
+            segments = self._segments()
+            if not segments or os.path.getsize(self._segment_path(segments[-1])) >= self.segment_bytes:
+                segments.append(self._next_segment(segments))
+            with open(self._segment_path(segments[-1]), "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._enforce_limit(segments)
+
+    def _enforce_limit(self, segments: List[str]) -> None:
+        sizes = {name: os.path.getsize(self._segment_path(name)) for name in segments}
+        total = sum(sizes.values())
+        while total > self.max_bytes and len(segments) > 1:
+            oldest = segments.pop(0)
+            with open(self._segment_path(oldest), "rb") as f:
+                lines = sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+            skipped = self._read_cursor(oldest)
+            os.remove(self._segment_path(oldest))
+            self.dropped += max(lines - skipped, 0)
+            total -= sizes[oldest]
+            if skipped:
+                self._clear_cursor()
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+    def _read_cursor(self, segment: str) -> int:
+        try:
+            with open(os.path.join(self.path, _CURSOR), "r", encoding="utf-8") as f:
+                cursor = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        return cursor.get("line", 0) if cursor.get("segment") == segment else 0
+
+    def _write_cursor(self, segment: str, line: int) -> None:
+        target = os.path.join(self.path, _CURSOR)
+        tmp = target + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"segment": segment, "line": line}, f)
+        os.replace(tmp, target)
+
+    def _clear_cursor(self) -> None:
+        try:
+            os.remove(os.path.join(self.path, _CURSOR))
+        except FileNotFoundError:
+            pass
+
+    def replay(
+        self,
+        deliver: Callable[[Dict[str, Any]], None],
+        checkpoint_every: int = 64,
+        limit: Optional[int] = None,
+    ) -> int:
+        """
+        Deliver spooled entries in order and return how many were delivered.
+
+        Stops early when ``deliver`` raises (the failed entry is kept) or
+        after ``limit`` entries.
+        """
+        delivered = 0
+        with self._lock:
+            for segment in self._segments():
+                path = self._segment_path(segment)
+                skip = self._read_cursor(segment)
+                line_no = 0
+                with open(path, "rb") as f:
+                    for line_no, line in enumerate(f, 1):
+                        if line_no <= skip or not line.strip():
+                            continue
+                        if limit is not None and delivered >= limit:
+                            self._write_cursor(segment, line_no - 1)
+                            return delivered
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # A torn final line from a crash mid-write.
+                            self.dropped += 1
+                            continue
+                        try:
+                            deliver(entry)
+                        except Exception:
+                            self._write_cursor(segment, line_no - 1)
+                            raise
+                        delivered += 1
+                        if delivered % checkpoint_every == 0:
+                            self._write_cursor(segment, line_no)
+                os.remove(path)
+                self._clear_cursor()
+        return delivered
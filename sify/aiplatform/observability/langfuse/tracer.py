@@ -1,25 +1,61 @@
 
 
-from typing import Dict, Any
-from langfuse import Langfuse, propagate_attributes
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
 
 from sify.aiplatform.observability.langfuse.client import get_langfuse_client
-from sify.aiplatform.observability.langfuse.detect_app import detect_app_name
+from sify.aiplatform.observability.langfuse.config import get_langfuse_config
+from sify.aiplatform.observability.langfuse.exporter import BackgroundExporter, SpanRecord
+from sify.aiplatform.observability.langfuse.redaction import PayloadLimiter
+from sify.aiplatform.observability.langfuse.sampling import Sampler
+from sify.aiplatform.observability.langfuse.spool import SpanSpool
+
+if TYPE_CHECKING:
+    from langfuse import Langfuse
 # --------------------------------------------------
 # Globals
 # --------------------------------------------------
 _tracer = None
-_user_id = None
-_session_id = None
+
+# Context-local, so concurrent threads and asyncio tasks sharing one
+# client each trace under their own identity.
+_user_id: ContextVar[Optional[str]] = ContextVar("langfuse_user_id", default=None)
+_session_id: ContextVar[Optional[str]] = ContextVar("langfuse_session_id", default=None)
+_trace_context: ContextVar[Optional[Dict[str, str]]] = ContextVar("langfuse_trace_context", default=None)
 
 
 # --------------------------------------------------
 # Identity
 # --------------------------------------------------
-def set_langfuse_identity(user_id=None, session_id=None):
-    global _user_id, _session_id
-    _user_id = user_id
-    _session_id = session_id
+def set_langfuse_identity(user_id=None, session_id=None, trace_context=None):
+    """
+    Set the identity for spans started in the current context (thread or
+    asyncio task, inherited by tasks it creates).
+
+    ``trace_context`` optionally attaches the spans to an existing trace:
+    ``{"trace_id": ..., "parent_span_id": ...}``.
+    """
+    _user_id.set(user_id)
+    _session_id.set(session_id)
+    _trace_context.set(trace_context)
+
+
+@contextmanager
+def langfuse_identity(user_id=None, session_id=None, trace_context=None) -> Iterator[None]:
+    """Like ``set_langfuse_identity`` but restores the previous identity on exit."""
+    tokens = (
+        _user_id.set(user_id),
+        _session_id.set(session_id),
+        _trace_context.set(trace_context),
+    )
+    try:
+        yield
+    finally:
+        _trace_context.reset(tokens[2])
+        _session_id.reset(tokens[1])
+        _user_id.reset(tokens[0])
 
 
 # --------------------------------------------------
@@ -27,59 +63,64 @@ def set_langfuse_identity(user_id=None, session_id=None):
 # --------------------------------------------------
 class NoOpSpan:
     def generation(self, **_): pass
-    def end(self): pass
+    def start_generation(self, **_): pass
+    def end_generation(self, **_): pass
+    def set_metadata(self, metadata): pass
+    def end(self, error=None): pass
+
+
+# Shared by every unsampled call, so skipping a span allocates nothing.
+_NOOP_SPAN = NoOpSpan()
 
 
 class NoOpTracer:
     def start_span(self, *_, **__):
-        return NoOpSpan()
+        return _NOOP_SPAN
 
-    def flush(self): pass
+    def flush(self, timeout=None): return True
 
 
 # --------------------------------------------------
 # Real span
 # --------------------------------------------------
-from typing import Dict, Any, Optional
-from langfuse import Langfuse, propagate_attributes
-
 class TracedSpan:
-    def __init__(self, client: Langfuse, name: str, input: Dict[str, Any]):
-        self.client = client
-
-        # ✅ Only supported attributes here
-        self._attr_ctx = propagate_attributes(
-            user_id=_user_id,
-            session_id=_session_id,
-        )
-        self._attr_ctx.__enter__()
-
-        # ✅ Custom metadata goes in span input
-        self._span_ctx = client.start_as_current_observation(
-            as_type="span",
-            name=name,
-            input={
-                **input,
-                "_observability": {
-                    "app_name": detect_app_name()
-                }
-            },
-        )
+    """
+    Captures one call into a ``SpanRecord``; nothing here touches the
+    network. ``end()`` asks the sampler whether to keep the span and hands
+    kept records to the background exporter.
+    """
 
-        self._root = self._span_ctx.__enter__()
-        self._generation_ctx = None
+    __slots__ = ("_exporter", "_sampler", "_sampled", "_record", "_ended")
 
-
-    def start_generation(self, *, model: str, input: Any):
-        self._generation_ctx = self._root.start_as_current_observation(
-            as_type="generation",
-            name="model-generation",
-            model=model,
-            input=input,
+    def __init__(
+        self,
+        exporter: BackgroundExporter,
+        name: str,
+        input: Dict[str, Any],
+        sampler: Optional[Sampler] = None,
+        sampled: bool = True,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ):
+        self._exporter = exporter
+        self._sampler = sampler
+        self._sampled = sampled
+        # The context identity wins over the client's defaults.
+        self._record = SpanRecord(
+            name,
+            input,
+            user_id=_user_id.get() or user_id,
+            session_id=_session_id.get() or session_id,
+            trace_context=_trace_context.get(),
         )
-        self._generation = self._generation_ctx.__enter__()
-        return self._generation
+        self._ended = False
 
+    def start_generation(self, *, model: str, input: Any):
+        self._record.generation = {
+            "model": model,
+            "input": input,
+            "start_time": time.time(),
+        }
 
     def end_generation(
         self,
@@ -89,51 +130,83 @@ class TracedSpan:
         usage: Optional[Dict[str, Any]] = None,
         cost_details: Optional[Dict[str, Any]] = None,
     ):
-        if not self._generation_ctx:
+        generation = self._record.generation
+        if generation is None or "end_time" in generation:
             return
 
-        with propagate_attributes(
-            user_id=_user_id,
-            session_id=_session_id,
-        ):
-            self.client.update_current_generation(
-                model=model,
-                output={
-                    "role": "assistant",
-                    "content": output,
-                },
-                usage_details=usage,
-                cost_details=cost_details,
-            )
+        generation.update(
+            model=model,
+            output=output,
+            usage=usage,
+            cost_details=cost_details,
+            end_time=time.time(),
+        )
 
-        self._generation_ctx.__exit__(None, None, None)
-        self._generation_ctx = None
+    def set_metadata(self, metadata: Dict[str, Any]):
+        self._record.metadata.update(metadata)
 
     # --------------------------------------------------
     # END SPAN
     # --------------------------------------------------
-    def end(self):
-        # Safety: close generation if still open
-        if self._generation_ctx:
-            self._generation_ctx.__exit__(None, None, None)
+    def end(self, error: Optional[BaseException] = None):
+        if self._ended:
+            return
+        self._ended = True
 
-        self._span_ctx.__exit__(None, None, None)
-        self._attr_ctx.__exit__(None, None, None)
+        record = self._record
+        record.end_time = time.time()
+        if self._sampler is not None and not self._sampler.finish(
+            record.name, record.end_time - record.start_time, error, self._sampled
+        ):
+            return
+
+        # Safety: close generation if still open
+        generation = record.generation
+        if generation is not None and "end_time" not in generation:
+            generation["end_time"] = record.end_time
 
+        if error is not None:
+            record.error = f"{type(error).__name__}: {error}"
+        self._exporter.submit(record)
 
 
 # --------------------------------------------------
 # Tracer wrapper
 # --------------------------------------------------
 class LangfuseTracer:
-    def __init__(self, client: Langfuse):
+    def __init__(
+        self,
+        client: "Langfuse",
+        exporter: Optional[BackgroundExporter] = None,
+        sampler: Optional[Sampler] = None,
+    ):
         self.client = client
+        self.exporter = exporter or BackgroundExporter(client)
+        self.sampler = sampler
 
-    def start_span(self, name: str, input: Dict[str, Any]):
-        return TracedSpan(self.client, name, input)
-
-    def flush(self):
-        self.client.flush()
+    def start_span(
+        self,
+        name: str,
+        input: Dict[str, Any],
+        *,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ):
+        """Start a span; ``user_id``/``session_id`` apply when the context sets none."""
+        sampler = self.sampler
+        if sampler is None:
+            sampled = True
+        elif sampler.head():
+            sampled = True
+        elif sampler.tail_enabled:
+            # Kept only if it fails or turns out slow.
+            sampled = False
+        else:
+            return _NOOP_SPAN
+        return TracedSpan(self.exporter, name, input, sampler, sampled, user_id, session_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self.exporter.flush(timeout)
 
 
 # --------------------------------------------------
@@ -148,7 +221,24 @@ def get_tracer():
     if not client:
         _tracer = NoOpTracer()
     else:
-        _tracer = LangfuseTracer(client)
+        cfg = get_langfuse_config()
+        sampler = None
+        if cfg.sample_rate < 1.0 or cfg.slow_threshold is not None:
+            sampler = Sampler(
+                rate=cfg.sample_rate,
+                keep_errors=cfg.keep_errors,
+                keep_slow=cfg.keep_slow,
+                slow_threshold=cfg.slow_threshold,
+            )
+        limiter = PayloadLimiter(
+            max_field_chars=cfg.max_field_chars,
+            max_items=cfg.max_items,
+            redact_keys=cfg.redact_keys,
+            redact_patterns=cfg.redact_patterns,
+        )
+        spool = SpanSpool(cfg.spool_path, cfg.spool_max_bytes) if cfg.spool_path else None
+        exporter = BackgroundExporter(client, limiter=limiter, spool=spool)
+        _tracer = LangfuseTracer(client, exporter, sampler)
 
     return _tracer
 
@@ -0,0 +1,271 @@
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Content type of the Prometheus text exposition format served by ``render()``.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27,}|[0-9a-fA-F]{16,})$")
+
+
+def normalize_endpoint(endpoint: Optional[str]) -> str:
+    """Replace id-like path segments with ``:id`` to keep label cardinality bounded."""
+    if not endpoint:
+        return ""
+    return "/".join(":id" if _ID_SEGMENT.match(part) else part for part in endpoint.split("/"))
+
+
+class MetricsHook:
+    """
+    Receives per-request measurements from the transports and clients.
+
+    Subclass and override what you need; every method is a no-op here.
+    Install an implementation with ``configure_metrics``.
+    """
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        model: Optional[str],
+        status: Union[int, str],
+        duration: float,
+        bytes_sent: int,
+        bytes_received: int,
+        retries: int,
+    ) -> None:
+        """One logical request (including retries). ``status`` is ``"error"`` if no response arrived."""
+
+    def record_tokens(
+        self,
+        endpoint: str,
+        model: Optional[str],
+        prompt_tokens: int,
+        completion_tokens: int,
+    ) -> None:
+        """Token usage reported by the server for one call."""
+
+
+# ------------------------------------------------------------------
+# In-process registry
+# ------------------------------------------------------------------
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # key -> [per-bucket counts..., sum, count]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels: Any) -> int:
+        series = self._values.get(self._key(labels))
+        return series[-1] if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+        lines = self._header()
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = 'le="%s"' % _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry(MetricsHook):
+    """
+    Thread-safe in-process metrics store implementing ``MetricsHook``.
+
+    Besides the built-in request metrics, other components register their
+    own counters, gauges and histograms here. ``render()`` returns the
+    Prometheus text exposition format, e.g. to serve from ``/metrics``::
+
+        registry = configure_metrics(MetricsRegistry())
+        body, content_type = registry.render(), CONTENT_TYPE
+    """
+
+    def __init__(self, namespace: str = "sify"):
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        labels = ("method", "endpoint", "model")
+        self.requests = self.counter("requests_total", "Requests sent, by response status.", labels + ("status",))
+        self.latency = self.histogram("request_duration_seconds", "Request latency including retries.", labels)
+        self.bytes_sent = self.counter("request_bytes_total", "Request body bytes sent.", labels)
+        self.bytes_received = self.counter("response_bytes_total", "Response body bytes received.", labels)
+        self.retries = self.counter("request_retries_total", "Retries made by the transport.", labels)
+        self.tokens = self.counter("tokens_total", "Tokens reported by the server.", ("endpoint", "model", "type"))
+
+    def _register(self, cls, name: str, *args: Any) -> Any:
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = cls(full_name, *args)
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {full_name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets)
+
+    # MetricsHook -----------------------------------------------------
+    def record_request(self, method, endpoint, model, status, duration, bytes_sent, bytes_received, retries):
+        labels = {"method": method, "endpoint": endpoint, "model": model or ""}
+        self.requests.inc(status=status, **labels)
+        self.latency.observe(duration, **labels)
+        if bytes_sent:
+            self.bytes_sent.inc(bytes_sent, **labels)
+        if bytes_received:
+            self.bytes_received.inc(bytes_received, **labels)
+        if retries:
+            self.retries.inc(retries, **labels)
+
+    def record_tokens(self, endpoint, model, prompt_tokens, completion_tokens):
+        if prompt_tokens:
+            self.tokens.inc(prompt_tokens, endpoint=endpoint, model=model or "", type="prompt")
+        if completion_tokens:
+            self.tokens.inc(completion_tokens, endpoint=endpoint, model=model or "", type="completion")
+
+    # Exposition ------------------------------------------------------
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def wsgi_app(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """Minimal WSGI app serving ``render()``; mount it at ``/metrics``."""
+        body = self.render().encode("utf-8")
+        start_response("200 OK", [("Content-Type", CONTENT_TYPE), ("Content-Length", str(len(body)))])
+        return [body]
+
+
+# ------------------------------------------------------------------
+# Global hook
+# ------------------------------------------------------------------
+_metrics: Optional[MetricsHook] = None
+
+
+def configure_metrics(hook: Optional[MetricsHook]) -> Optional[MetricsHook]:
+    """Install the process-wide metrics hook; ``None`` disables metrics (the default)."""
+    global _metrics
+    _metrics = hook
+    return hook
+
+
+def get_metrics() -> Optional[MetricsHook]:
+    return _metrics
+
+
+def record_usage(endpoint: str, model: Optional[str], usage: Optional[Dict[str, Any]]) -> None:
+    """Forward a response ``usage`` block to the metrics hook, if one is installed."""
+    if _metrics is None or not isinstance(usage, dict):
+        return
+    prompt = usage.get("prompt_tokens") or 0
+    completion = usage.get("completion_tokens")
+    if completion is None:
+        completion = max((usage.get("total_tokens") or 0) - prompt, 0)
+    _metrics.record_tokens(normalize_endpoint(endpoint), model, prompt, completion)
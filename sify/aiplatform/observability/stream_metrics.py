@@ -0,0 +1,121 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class StreamStats:
+    """Latency profile of one streamed response. All durations are in seconds."""
+
+    def __init__(
+        self,
+        name: str,
+        model: Optional[str],
+        ttft: Optional[float],
+        duration: float,
+        chunks: int,
+        p50_gap: Optional[float],
+        p99_gap: Optional[float],
+        max_gap: Optional[float],
+        completed: bool = True,
+    ):
+        self.name = name
+        self.model = model
+        self.ttft = ttft
+        self.duration = duration
+        self.chunks = chunks
+        self.p50_gap = p50_gap
+        self.p99_gap = p99_gap
+        self.max_gap = max_gap
+        self.completed = completed
+
+    @property
+    def chunks_per_second(self) -> Optional[float]:
+        """Chunk rate after the first chunk, i.e. excluding time to first token."""
+        if self.ttft is None or self.chunks < 2 or self.duration <= self.ttft:
+            return None
+        return (self.chunks - 1) / (self.duration - self.ttft)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "model": self.model,
+            "ttft": self.ttft,
+            "duration": self.duration,
+            "chunks": self.chunks,
+            "chunks_per_second": self.chunks_per_second,
+            "p50_gap": self.p50_gap,
+            "p99_gap": self.p99_gap,
+            "max_gap": self.max_gap,
+            "completed": self.completed,
+        }
+
+    def __repr__(self) -> str:
+        return f"StreamStats({self.to_dict()!r})"
+
+
+StreamStatsCallback = Callable[[StreamStats], None]
+
+
+def _percentile(ordered: List[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    # Nearest-rank on the sorted sample.
+    rank = max(0, min(len(ordered) - 1, int(round(q * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+class StreamTimer:
+    """
+    Timestamps a streamed response chunk by chunk.
+
+    Call ``start()`` when the request is sent (creation time is used
+    otherwise), ``tick()`` as each chunk arrives and ``finish()`` once the
+    stream ends. Only one float per chunk is kept and percentiles are
+    computed once at the end.
+    """
+
+    def __init__(self, name: str, model: Optional[str] = None):
+        self.name = name
+        self.model = model
+        self.started = time.perf_counter()
+        self.chunks = 0
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+        self._gaps: List[float] = []
+        self.stats: Optional[StreamStats] = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+
+    def tick(self) -> None:
+        now = time.perf_counter()
+        if self._last is None:
+            self._first = now
+        else:
+            self._gaps.append(now - self._last)
+        self._last = now
+        self.chunks += 1
+
+    def finish(self, completed: bool = True) -> StreamStats:
+        if self.stats is None:
+            gaps = sorted(self._gaps)
+            self.stats = StreamStats(
+                name=self.name,
+                model=self.model,
+                ttft=self._first - self.started if self._first is not None else None,
+                duration=time.perf_counter() - self.started,
+                chunks=self.chunks,
+                p50_gap=_percentile(gaps, 0.50),
+                p99_gap=_percentile(gaps, 0.99),
+                max_gap=gaps[-1] if gaps else None,
+                completed=completed,
+            )
+        return self.stats
+
+
+def finish_stream(span, timer: StreamTimer, callback: Optional[StreamStatsCallback], completed: bool = True) -> StreamStats:
+    """Attach the stream's latency profile to ``span`` and hand it to ``callback``."""
+    stats = timer.finish(completed)
+    span.set_metadata({"stream": stats.to_dict()})
+    if callback is not None:
+        callback(stats)
+    return stats
@@ -0,0 +1,63 @@
+from .http_transport import (
+    HTTPTransport,
+    TransportConfig,
+    configure_transport,
+    get_transport,
+)
+from .async_transport import AsyncHTTPTransport, get_async_transport
+from .retry import RetryPolicy, NO_RETRY
+from .circuit import CircuitBreaker, CircuitPolicy
+from .concurrency import AdaptiveConcurrencyLimiter, is_overloaded, is_overload_error
+from .ratelimit import RateLimiter, TokenBucket, estimate_tokens
+from .sse import SSEEvent, SSEParser, StreamDecodeError, iter_sse_json, aiter_sse_json
+from .singleflight import SingleFlight, AsyncSingleFlight, get_single_flight, get_async_single_flight
+from .errors import (
+    APIRequestError,
+    APIConnectionError,
+    APITimeoutError,
+    CircuitOpenError,
+    APIStatusError,
+    AuthenticationError,
+    PermissionDeniedError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+
+__all__ = [
+    "HTTPTransport",
+    "AsyncHTTPTransport",
+    "TransportConfig",
+    "configure_transport",
+    "get_transport",
+    "get_async_transport",
+    "RetryPolicy",
+    "NO_RETRY",
+    "RateLimiter",
+    "TokenBucket",
+    "estimate_tokens",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "CircuitPolicy",
+    "is_overloaded",
+    "is_overload_error",
+    "SSEEvent",
+    "SSEParser",
+    "StreamDecodeError",
+    "iter_sse_json",
+    "aiter_sse_json",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "get_single_flight",
+    "get_async_single_flight",
+    "APIRequestError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "CircuitOpenError",
+    "APIStatusError",
+    "AuthenticationError",
+    "PermissionDeniedError",
+    "NotFoundError",
+    "RateLimitError",
+    "ServerError",
+]
@@ -0,0 +1,196 @@
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+try:
+    import httpx
+except ImportError:  # optional dependency: pip install sify-ai-platform[async]
+    httpx = None
+
+from sify.aiplatform.observability.metrics import get_metrics
+from sify.aiplatform.transport.circuit import CircuitBreakers
+from sify.aiplatform.transport.http_transport import (
+    Timeout,
+    TransportConfig,
+    file_positions,
+    get_transport,
+    record_request,
+    resolve_timeout,
+    rewind,
+)
+
+
+class AsyncHTTPTransport:
+    """
+    Pooled, keep-alive asyncio transport backed by ``httpx.AsyncClient``.
+
+    httpx connections belong to the event loop that opened them, so one
+    client (and pool) is kept per running loop.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        if httpx is None:
+            raise ImportError(
+                "The async clients require httpx. Install it with: pip install sify-ai-platform[async]"
+            )
+        self.config = config or TransportConfig()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.circuits = CircuitBreakers(self.config.circuit) if self.config.circuit else None
+
+    def _client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            keepalive = self.config.pool_maxsize if self.config.keep_alive else 0
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_connections * self.config.pool_maxsize,
+                    max_keepalive_connections=keepalive,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    def timeout_for(self, endpoint: Optional[str]) -> "httpx.Timeout":
+        return _to_httpx_timeout(resolve_timeout(self.config, endpoint))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        endpoint: Optional[str] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+        idempotent: Optional[bool] = None,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """
+        Send a request, retrying transient failures per ``config.retry``.
+        With ``stream=True`` the body is not read and the caller must
+        ``await response.aclose()`` when done. See ``HTTPTransport.request``.
+        """
+        metrics = get_metrics()
+        if metrics is None and self.circuits is None:
+            return await self._request(method, url, endpoint, timeout, stream, idempotent, kwargs)
+
+        breaker = self.circuits.acquire(url, endpoint, model) if self.circuits is not None else None
+        started = time.perf_counter()
+        try:
+            response = await self._request(method, url, endpoint, timeout, stream, idempotent, kwargs)
+        except httpx.TransportError as e:
+            if breaker is not None:
+                breaker.record_failure(timed_out=isinstance(e, httpx.TimeoutException))
+            if metrics is not None:
+                record_request(metrics, method, endpoint, url, model, started, error=e)
+            raise
+        except BaseException as e:
+            if breaker is not None:
+                breaker.release()
+            if metrics is not None and isinstance(e, Exception):
+                record_request(metrics, method, endpoint, url, model, started, error=e)
+            raise
+        if breaker is not None:
+            self.circuits.record_response(breaker, response.status_code)
+        if metrics is not None:
+            record_request(metrics, method, endpoint, url, model, started, response, streamed=stream)
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str],
+        timeout: Optional[Timeout],
+        stream: bool,
+        idempotent: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> "httpx.Response":
+        client = self._client()
+        timeout = _to_httpx_timeout(timeout) if timeout is not None else self.timeout_for(endpoint)
+        policy = self.config.retry
+        safe = policy.allows(method, idempotent)
+        positions = file_positions(kwargs.get("files"))
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            try:
+                request = client.build_request(method, url, timeout=timeout, **kwargs)
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                delay = None
+                not_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if safe or (policy.max_retries > 0 and not_sent):
+                    delay = policy.next_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    e.retries = attempt
+                    raise
+            else:
+                delay = None
+                if policy.retries_status(response.status_code, safe):
+                    delay = policy.next_delay(attempt, time.monotonic() - started, response.headers)
+                if delay is None:
+                    response.retries = attempt
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            rewind(positions)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """
+        Close the clients of every loop without waiting. Each ``aclose`` is
+        scheduled on the loop that owns the client; clients of loops that are
+        no longer running are dropped. The transport stays usable and opens
+        new clients on demand.
+        """
+        clients, self._clients = list(self._clients.items()), weakref.WeakKeyDictionary()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, client in clients:
+            if loop.is_closed() or not loop.is_running():
+                continue
+            if loop is running:
+                loop.create_task(client.aclose())
+            else:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def _to_httpx_timeout(timeout: Timeout) -> "httpx.Timeout":
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+# --------------------------------------------------
+# Shared instance (follows configure_transport)
+# --------------------------------------------------
+_async_transport: Optional[AsyncHTTPTransport] = None
+
+
+def get_async_transport() -> AsyncHTTPTransport:
+    global _async_transport
+    transport = get_transport()
+    if _async_transport is None or _async_transport.config is not transport.config:
+        old = _async_transport
+        _async_transport = AsyncHTTPTransport(transport.config)
+        # Sync and async callers see the same upstream health.
+        _async_transport.circuits = transport.circuits
+        if old is not None:
+            old.close()
+    return _async_transport
@@ -0,0 +1,257 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Optional, Tuple
+
+from sify.aiplatform.observability.metrics import get_metrics, normalize_endpoint
+from sify.aiplatform.transport.errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Values of the ``circuit_state`` gauge.
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for one upstream.
+
+    While closed, the circuit opens when any of these trips:
+
+    - ``failure_threshold`` consecutive failures;
+    - with ``failure_rate_threshold``, that share of failures among the
+      last ``window`` calls, once at least ``min_calls`` were seen;
+    - with ``timeout_threshold``, that many timeouts among the last
+      ``window`` calls.
+
+    An open circuit makes ``allow()`` return False for ``recovery_time``
+    seconds. It then turns half-open and lets ``half_open_max_calls`` probe
+    requests through: when all of them succeed it closes, and any failure
+    re-opens it.
+
+    Every call that ``allow()`` let through must be reported with
+    ``record_success``, ``record_failure`` or, when it ended without a
+    verdict (cancelled, interrupted, a client error), ``release``.
+
+    When a ``MetricsRegistry`` is installed, state changes update the
+    ``circuit_state`` gauge and the ``circuit_transitions_total`` counter,
+    labelled with ``name``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        half_open_max_calls: int = 1,
+        name: str = "",
+        failure_rate_threshold: Optional[float] = None,
+        window: int = 20,
+        min_calls: int = 10,
+        timeout_threshold: Optional[int] = None,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_max_calls = half_open_max_calls
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.timeout_threshold = timeout_threshold
+        self._state = CLOSED
+        self._failures = 0
+        # (failed, timed_out) for the most recent calls while closed.
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 when not open)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_time - time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Transitions
+    # ------------------------------------------------------------------
+    def _transition(self, state: str) -> None:
+        previous, self._state = self._state, state
+        self._probes = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._failures = 0
+            self._outcomes.clear()
+        if previous != state:
+            self._export(previous, state)
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_time:
+            self._transition(HALF_OPEN)
+
+    def _tripped(self) -> bool:
+        if self._failures >= self.failure_threshold:
+            return True
+        if self.timeout_threshold is not None:
+            if sum(1 for _, timed_out in self._outcomes if timed_out) >= self.timeout_threshold:
+                return True
+        if self.failure_rate_threshold is not None and len(self._outcomes) >= self.min_calls:
+            failed = sum(1 for failure, _ in self._outcomes if failure)
+            if failed >= self.failure_rate_threshold * len(self._outcomes):
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+    def allow(self) -> bool:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == OPEN:
+                return
+            if self._state == HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition(CLOSED)
+                return
+            self._failures = 0
+            self._outcomes.append((False, False))
+
+    def record_failure(self, timed_out: bool = False) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._transition(OPEN)
+                return
+            if self._state == OPEN:
+                return
+            self._failures += 1
+            self._outcomes.append((True, timed_out))
+            if self._tripped():
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self._failures, "retry_after": self.retry_after()}
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def _export(self, previous: str, state: str) -> None:
+        metrics = get_metrics()
+        if not hasattr(metrics, "gauge"):
+            return
+        metrics.gauge("circuit_state", "Circuit state: 0 closed, 1 half-open, 2 open.", ("circuit",)).set(
+            STATE_VALUES[state], circuit=self.name
+        )
+        metrics.counter(
+            "circuit_transitions_total", "Circuit breaker state changes.", ("circuit", "from_state", "to_state")
+        ).inc(circuit=self.name, from_state=previous, to_state=state)
+
+
+@dataclass
+class CircuitPolicy:
+    """
+    Settings for the transport's per-upstream circuit breakers; see
+    ``CircuitBreaker``. Responses with a status in ``failure_statuses``
+    count as failures, as do connection errors and timeouts. Other
+    statuses, including 429, count as successes: the server is up.
+    """
+
+    failure_threshold: int = 5
+    failure_rate_threshold: Optional[float] = 0.5
+    window: int = 20
+    min_calls: int = 10
+    timeout_threshold: Optional[int] = 3
+    recovery_time: float = 30.0
+    half_open_max_calls: int = 2
+    failure_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({500, 502, 503, 504}))
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        return CircuitBreaker(
+            failure_threshold=self.failure_threshold,
+            recovery_time=self.recovery_time,
+            half_open_max_calls=self.half_open_max_calls,
+            name=name,
+            failure_rate_threshold=self.failure_rate_threshold,
+            window=self.window,
+            min_calls=self.min_calls,
+            timeout_threshold=self.timeout_threshold,
+        )
+
+
+def circuit_key(url: str, endpoint: Optional[str], model: Optional[str]) -> str:
+    """``base_url endpoint model``, with id-like path segments collapsed."""
+    base = url[: -len(endpoint)] if endpoint and url.endswith(endpoint) else url
+    return f"{base} {normalize_endpoint(endpoint)} {model or ''}".rstrip()
+
+
+class CircuitBreakers:
+    """Lazily created ``CircuitBreaker`` per base URL, endpoint and model, shared by one transport."""
+
+    def __init__(self, policy: CircuitPolicy):
+        self.policy = policy
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, endpoint: Optional[str], model: Optional[str]) -> CircuitBreaker:
+        key = circuit_key(url, endpoint, model)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = self.policy.breaker(key)
+        return breaker
+
+    def acquire(self, url: str, endpoint: Optional[str], model: Optional[str]) -> CircuitBreaker:
+        """Return the breaker for this upstream, or raise ``CircuitOpenError`` if it is open."""
+        breaker = self.get(url, endpoint, model)
+        if not breaker.allow():
+            metrics = get_metrics()
+            if hasattr(metrics, "counter"):
+                metrics.counter(
+                    "circuit_rejections_total", "Requests failed fast by an open circuit.", ("circuit",)
+                ).inc(circuit=breaker.name)
+            retry_after = breaker.retry_after()
+            raise CircuitOpenError(
+                f"Circuit open for {breaker.name}: failing fast, next probe in {retry_after:.1f}s",
+                retry_after=retry_after,
+            )
+        return breaker
+
+    def record_response(self, breaker: CircuitBreaker, status_code: int) -> None:
+        if status_code in self.policy.failure_statuses:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
@@ -0,0 +1,262 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from sify.aiplatform.observability.metrics import get_metrics
+from sify.aiplatform.transport.errors import TIMEOUT_ERRORS, APITimeoutError
+
+# Responses that mean the server is shedding load.
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+def is_overloaded(response: Any) -> bool:
+    """True for a 429/503 response, or one that only succeeded after retries."""
+    return response.status_code in OVERLOAD_STATUSES or getattr(response, "retries", 0) > 0
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    True for a timeout. Other errors - an open circuit, a refused
+    connection, cancellation - return fast and say nothing about how
+    loaded the server is.
+    """
+    return isinstance(error, TIMEOUT_ERRORS + (APITimeoutError,))
+
+
+def limited_request(limiter: Optional["AdaptiveConcurrencyLimiter"], request: Callable[..., Any], **kwargs) -> Any:
+    """
+    ``request(**kwargs)`` holding a slot of ``limiter`` (None: no limit).
+    For streams the slot covers the time to response headers only.
+    """
+    if limiter is None:
+        return request(**kwargs)
+    limiter.acquire()
+    start = time.monotonic()
+    try:
+        response = request(**kwargs)
+    except BaseException as e:
+        _release_failed(limiter, start, e)
+        raise
+    limiter.release(time.monotonic() - start, is_overloaded(response))
+    return response
+
+
+async def limited_request_async(
+    limiter: Optional["AdaptiveConcurrencyLimiter"], request: Callable[..., Any], **kwargs
+) -> Any:
+    """Coroutine version of ``limited_request`` for async transports."""
+    if limiter is None:
+        return await request(**kwargs)
+    await limiter.acquire_async()
+    start = time.monotonic()
+    try:
+        response = await request(**kwargs)
+    except BaseException as e:
+        _release_failed(limiter, start, e)
+        raise
+    limiter.release(time.monotonic() - start, is_overloaded(response))
+    return response
+
+
+def _release_failed(limiter: "AdaptiveConcurrencyLimiter", start: float, error: BaseException) -> None:
+    if is_overload_error(error):
+        limiter.release(time.monotonic() - start, overloaded=True)
+    else:
+        limiter.release()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of requests in flight.
+
+    After each request, ``release`` adjusts the limit:
+
+    - An overload signal cuts it to ``limit * backoff``, at most once per
+      smoothed latency so one burst of failures counts once. Signals are a
+      429/503, a request that needed retries, a timeout, or a
+      smoothed latency above ``latency_tolerance`` times the baseline.
+    - Otherwise, while callers are actually using the full limit, it grows
+      by ``increase`` per round trip, that is by ``increase / limit`` per
+      completed request.
+
+    Latency is smoothed twice: quickly (``smoothing``) for the current
+    value and slowly (``baseline_smoothing``) for the baseline, so a mix
+    of short and long requests does not read as a spike. Pass
+    ``latency_tolerance=None`` to react to errors only.
+
+    ``acquire`` blocks and ``acquire_async`` awaits a free slot; waiters
+    are served first come, first served. One limiter can be shared by
+    threads, event loops and many clients.
+
+    When a ``MetricsRegistry`` is installed, the limit, in-flight requests,
+    queue depth and decreases are exported, labelled with ``name``.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        smoothing: float = 0.2,
+        baseline_smoothing: float = 0.01,
+        name: str = "maas",
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_smoothing = baseline_smoothing
+        self.name = name
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.decreases = 0
+        self.baseline: Optional[float] = None
+        self.latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[Callable[[], None]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+    def acquire(self) -> None:
+        with self._lock:
+            if self._has_slot() and not self._waiters:
+                self.in_flight += 1
+                self._export()
+                return
+            event = threading.Event()
+            self._waiters.append(event.set)
+            self._export()
+        # The releasing thread hands the slot over before setting the event.
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._has_slot() and not self._waiters:
+                self.in_flight += 1
+                self._export()
+                return
+            future = loop.create_future()
+
+            def grant(future=future) -> None:
+                if future.done():
+                    # Cancelled while the slot was being handed over.
+                    self.release()
+                else:
+                    future.set_result(None)
+
+            def wake() -> None:
+                loop.call_soon_threadsafe(grant)
+
+            self._waiters.append(wake)
+            self._export()
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(wake)
+                    waiting = True
+                except ValueError:
+                    waiting = False
+            if not waiting and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Return a slot and adapt the limit to the request's outcome. Without
+        a ``latency`` the slot is returned and the limit left alone.
+        """
+        with self._lock:
+            if latency is not None:
+                self._adapt(latency, overloaded)
+            self.in_flight -= 1
+            self._dispatch()
+            self._export()
+
+    def _dispatch(self) -> None:
+        while self._waiters and self._has_slot():
+            self.in_flight += 1
+            self._waiters.popleft()()
+
+    # ------------------------------------------------------------------
+    # AIMD
+    # ------------------------------------------------------------------
+    def _adapt(self, latency: float, overloaded: bool) -> None:
+        if self.latency is None:
+            self.baseline = self.latency = latency
+        else:
+            self.baseline += (latency - self.baseline) * self.baseline_smoothing
+            self.latency += (latency - self.latency) * self.smoothing
+
+        if (
+            not overloaded
+            and self.latency_tolerance is not None
+            and self.latency > self.baseline * self.latency_tolerance
+        ):
+            overloaded = True
+
+        now = time.monotonic()
+        if overloaded:
+            if now - self._last_decrease >= self.latency:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = now
+                self.decreases += 1
+                self._count_decrease()
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(float(self.max_limit), self.limit + self.increase / self.limit)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    def _export(self) -> None:
+        metrics = get_metrics()
+        if not hasattr(metrics, "gauge"):
+            return
+        metrics.gauge("concurrency_limit", "Adaptive concurrency limit.", ("limiter",)).set(
+            int(self.limit), limiter=self.name
+        )
+        metrics.gauge("concurrency_in_flight", "Requests holding a concurrency slot.", ("limiter",)).set(
+            self.in_flight, limiter=self.name
+        )
+        metrics.gauge("concurrency_queue_depth", "Requests waiting for a concurrency slot.", ("limiter",)).set(
+            len(self._waiters), limiter=self.name
+        )
+
+    def _count_decrease(self) -> None:
+        metrics = get_metrics()
+        if hasattr(metrics, "counter"):
+            metrics.counter(
+                "concurrency_decreases_total", "Multiplicative decreases of the concurrency limit.", ("limiter",)
+            ).inc(limiter=self.name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "decreases": self.decreases,
+            "baseline_latency": self.baseline,
+            "latency": self.latency,
+        }
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Optional, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # optional dependency: pip install sify-ai-platform[async]
+    httpx = None
+
+
+class APIRequestError(ValueError):
+    """
+    Base class for request failures raised by the Sify clients.
+
+    Subclasses ``ValueError`` so existing ``except ValueError`` handlers keep
+    working. ``retries`` is the number of retries the transport made before
+    giving up.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: Optional[int] = None,
+        details: Optional[Union[str, Dict[str, Any]]] = None,
+        retries: int = 0,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.details = details
+        self.retries = retries
+
+
+class APIConnectionError(APIRequestError):
+    """The API could not be reached (DNS, refused, reset, TLS)."""
+
+
+class APITimeoutError(APIConnectionError):
+    """The API did not respond within the configured timeout."""
+
+
+class CircuitOpenError(APIConnectionError):
+    """
+    Not sent: the circuit for this upstream is open after repeated failures.
+    ``retry_after`` is the number of seconds until it will be probed again.
+    """
+
+    def __init__(self, message: str, *, retry_after: float = 0.0, **kwargs: Any):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class APIStatusError(APIRequestError):
+    """The API answered with an HTTP error status."""
+
+
+class AuthenticationError(APIStatusError):
+    """HTTP 401."""
+
+
+class PermissionDeniedError(APIStatusError):
+    """HTTP 403."""
+
+
+class NotFoundError(APIStatusError):
+    """HTTP 404."""
+
+
+class RateLimitError(APIStatusError):
+    """HTTP 429."""
+
+
+class ServerError(APIStatusError):
+    """HTTP 5xx."""
+
+
+# Transport exceptions that map to APITimeoutError / APIConnectionError, for
+# both the requests and the httpx transports. Check timeouts first: a
+# connect timeout is also a connection error.
+TIMEOUT_ERRORS = (requests.Timeout,) + ((httpx.TimeoutException,) if httpx is not None else ())
+SSL_ERRORS = (requests.exceptions.SSLError,)
+CONNECTION_ERRORS = (requests.ConnectionError,) + ((httpx.TransportError,) if httpx is not None else ())
+
+
+_STATUS_ERRORS = {
+    401: AuthenticationError,
+    403: PermissionDeniedError,
+    404: NotFoundError,
+    429: RateLimitError,
+}
+
+
+def error_for_status(
+    status_code: int,
+    message: str,
+    *,
+    details: Optional[Union[str, Dict[str, Any]]] = None,
+    retries: int = 0,
+) -> APIStatusError:
+    if status_code >= 500:
+        cls = ServerError
+    else:
+        cls = _STATUS_ERRORS.get(status_code, APIStatusError)
+    return cls(message, status_code=status_code, details=details, retries=retries)
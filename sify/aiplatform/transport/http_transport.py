@@ -0,0 +1,243 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from sify.aiplatform.observability.metrics import get_metrics, normalize_endpoint
+from sify.aiplatform.transport.circuit import CircuitBreakers, CircuitPolicy
+from sify.aiplatform.transport.retry import RetryPolicy
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+@dataclass
+class TransportConfig:
+    pool_connections: int = 10
+    pool_maxsize: int = 20
+    pool_block: bool = False
+    keep_alive: bool = True
+    connect_timeout: float = 10.0
+    read_timeout: float = 300.0
+    # endpoint path prefix -> timeout, e.g. {"/v1/audio": 600, "/v1/models": 10}
+    endpoint_timeouts: Dict[str, Timeout] = field(default_factory=dict)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    # Fail fast while an upstream (base URL + endpoint + model) is down; None disables.
+    circuit: Optional[CircuitPolicy] = None
+
+
+def resolve_timeout(config: TransportConfig, endpoint: Optional[str]) -> Timeout:
+    """
+    Resolve the timeout for an endpoint path. The longest matching prefix in
+    ``endpoint_timeouts`` wins, otherwise the (connect, read) defaults apply.
+    """
+    if endpoint:
+        best = None
+        for prefix in config.endpoint_timeouts:
+            if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        if best is not None:
+            return config.endpoint_timeouts[best]
+    return (config.connect_timeout, config.read_timeout)
+
+
+def file_positions(files: Optional[Dict[str, Any]]) -> List[Tuple[Any, int]]:
+    """Remember where each uploaded file object starts so a retry can rewind it."""
+    positions = []
+    for value in (files or {}).values():
+        obj = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+        if hasattr(obj, "seek") and hasattr(obj, "tell"):
+            positions.append((obj, obj.tell()))
+    return positions
+
+
+def rewind(positions: List[Tuple[Any, int]]) -> None:
+    for obj, position in positions:
+        obj.seek(position)
+
+
+def body_sizes(response: Any, streamed: bool) -> Tuple[int, int]:
+    """(bytes sent, bytes received) for metrics; streamed bodies count only a declared length."""
+    sent = response.request.headers.get("Content-Length") if response.request is not None else None
+    if streamed:
+        received = response.headers.get("Content-Length")
+    else:
+        received = len(response.content)
+    return int(sent or 0), int(received or 0)
+
+
+def record_request(metrics, method, endpoint, url, model, started, response=None, error=None, streamed=False):
+    duration = time.perf_counter() - started
+    endpoint = normalize_endpoint(endpoint or url)
+    if response is None:
+        metrics.record_request(method, endpoint, model, "error", duration, 0, 0, getattr(error, "retries", 0))
+        return
+    sent, received = body_sizes(response, streamed)
+    metrics.record_request(method, endpoint, model, response.status_code, duration, sent, received, response.retries)
+
+
+def _not_sent(exc: Exception) -> bool:
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class HTTPTransport:
+    """
+    Pooled, keep-alive HTTP transport shared by the Sify clients.
+
+    A single ``HTTPAdapter`` (and therefore a single urllib3 pool per host)
+    is mounted on one ``requests.Session`` per thread, so connections are
+    reused across threads while session state such as cookies never is.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        self._local = threading.local()
+        self.circuits = CircuitBreakers(self.config.circuit) if self.config.circuit else None
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            if not self.config.keep_alive:
+                session.headers["Connection"] = "close"
+            self._local.session = session
+        return session
+
+    def timeout_for(self, endpoint: Optional[str]) -> Timeout:
+        return resolve_timeout(self.config, endpoint)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        endpoint: Optional[str] = None,
+        timeout: Optional[Timeout] = None,
+        idempotent: Optional[bool] = None,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures per ``config.retry``.
+
+        ``idempotent`` overrides the method-based default for whether the
+        call is safe to resend. The number of retries made is stored on the
+        returned response (or raised exception) as ``retries``. ``model``
+        labels the request for the metrics hook and, with ``config.circuit``,
+        picks the circuit breaker; while it is open ``CircuitOpenError`` is
+        raised without sending anything.
+        """
+        metrics = get_metrics()
+        if metrics is None and self.circuits is None:
+            return self._request(method, url, endpoint, timeout, idempotent, kwargs)
+
+        breaker = self.circuits.acquire(url, endpoint, model) if self.circuits is not None else None
+        started = time.perf_counter()
+        try:
+            response = self._request(method, url, endpoint, timeout, idempotent, kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if breaker is not None:
+                breaker.record_failure(timed_out=isinstance(e, requests.Timeout))
+            if metrics is not None:
+                record_request(metrics, method, endpoint, url, model, started, error=e)
+            raise
+        except BaseException as e:
+            if breaker is not None:
+                breaker.release()
+            if metrics is not None and isinstance(e, Exception):
+                record_request(metrics, method, endpoint, url, model, started, error=e)
+            raise
+        if breaker is not None:
+            self.circuits.record_response(breaker, response.status_code)
+        if metrics is not None:
+            record_request(
+                metrics, method, endpoint, url, model, started, response, streamed=kwargs.get("stream", False)
+            )
+        return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str],
+        timeout: Optional[Timeout],
+        idempotent: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> requests.Response:
+        if timeout is None:
+            timeout = self.timeout_for(endpoint)
+        policy = self.config.retry
+        safe = policy.allows(method, idempotent)
+        positions = file_positions(kwargs.get("files"))
+        session = self._session()
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            try:
+                response = session.request(method=method, url=url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = None
+                if safe or (policy.max_retries > 0 and _not_sent(e)):
+                    delay = policy.next_delay(attempt, time.monotonic() - started)
+                if delay is None:
+                    e.retries = attempt
+                    raise
+            else:
+                delay = None
+                if policy.retries_status(response.status_code, safe):
+                    delay = policy.next_delay(attempt, time.monotonic() - started, response.headers)
+                if delay is None:
+                    response.retries = attempt
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            rewind(positions)
+            attempt += 1
+
+    def close(self) -> None:
+        self._adapter.close()
+
+
+# --------------------------------------------------
+# Shared instance
+# --------------------------------------------------
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def configure_transport(**kwargs: Any) -> HTTPTransport:
+    """
+    Replace the shared transport. Accepts any ``TransportConfig`` field.
+    Clients created afterwards use the new transport.
+    """
+    global _transport
+    with _transport_lock:
+        old = _transport
+        _transport = HTTPTransport(TransportConfig(**kwargs))
+    if old is not None:
+        old.close()
+    return _transport
+
+
+def get_transport() -> HTTPTransport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+# Rough chars-per-token ratio used to estimate prompt size before the call.
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at ``rate`` per second.
+
+    ``reserve`` deducts immediately (the level may go negative) and returns
+    how long the caller must wait, so concurrent callers queue up in order
+    without holding the lock while they sleep.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._level -= amount
+            if self._level >= 0 or self.rate <= 0:
+                return 0.0
+            return -self._level / self.rate
+
+    def refund(self, amount: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level = min(self.capacity, self._level + amount)
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+            self._level = min(self._level, self.capacity)
+
+    def cap_level(self, remaining: float) -> None:
+        """Never believe we have more capacity than the server says remains."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._level = min(self._level, float(remaining))
+
+
+class RateLimiter:
+    """
+    Client-side pacing for MaaS calls, keyed by ``(api_key, model_id)``.
+
+    Caps requests per second and estimated tokens per minute. ``acquire``
+    blocks and ``acquire_async`` awaits until both buckets have capacity.
+    Limits follow the server at runtime via ``update_from_headers``, which
+    understands the common ``x-ratelimit-limit-*`` / ``x-ratelimit-remaining-*``
+    headers (request and token limits per minute).
+
+    One limiter can be shared by many clients (and threads) so they pace
+    against the same quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst
+        self._buckets: Dict[Hashable, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            with self._lock:
+                buckets = self._get_locked(key)
+        return buckets
+
+    def _get_locked(self, key: Hashable) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            requests = (
+                TokenBucket(self.requests_per_second, self.burst)
+                if self.requests_per_second else None
+            )
+            tokens = (
+                TokenBucket(self.tokens_per_minute / 60.0, self.tokens_per_minute)
+                if self.tokens_per_minute else None
+            )
+            buckets = (requests, tokens)
+            self._buckets[key] = buckets
+        return buckets
+
+    def _reserve(self, key: Hashable, tokens: float) -> float:
+        requests, token_bucket = self._get(key)
+        wait = 0.0
+        if requests is not None:
+            wait = max(wait, requests.reserve(1))
+        if token_bucket is not None and tokens:
+            wait = max(wait, token_bucket.reserve(tokens))
+        return wait
+
+    def acquire(self, key: Hashable, tokens: float = 0) -> float:
+        """Block until the call may proceed. Returns the time waited."""
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, key: Hashable, tokens: float = 0) -> float:
+        """Await until the call may proceed. Returns the time waited."""
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, key: Hashable, estimated: float, actual: Optional[float]) -> None:
+        """Correct the token bucket once the real usage is known."""
+        _, token_bucket = self._get(key)
+        if token_bucket is None or actual is None:
+            return
+        diff = estimated - actual
+        if diff > 0:
+            token_bucket.refund(diff)
+        elif diff < 0:
+            token_bucket.reserve(-diff)
+
+    def update_from_headers(self, key: Hashable, headers: Mapping[str, str]) -> None:
+        request_limit = _header_float(headers, "x-ratelimit-limit-requests")
+        token_limit = _header_float(headers, "x-ratelimit-limit-tokens")
+
+        with self._lock:
+            requests, token_bucket = self._get_locked(key)
+            if request_limit:
+                rate = request_limit / 60.0
+                if requests is None:
+                    requests = TokenBucket(rate, self.burst)
+                elif abs(requests.rate - rate) > 1e-9:
+                    requests.set_rate(rate, self.burst)
+            if token_limit:
+                if token_bucket is None:
+                    token_bucket = TokenBucket(token_limit / 60.0, token_limit)
+                elif abs(token_bucket.capacity - token_limit) > 1e-9:
+                    token_bucket.set_rate(token_limit / 60.0, token_limit)
+            self._buckets[key] = (requests, token_bucket)
+
+        remaining = _header_float(headers, "x-ratelimit-remaining-requests")
+        if remaining is not None and requests is not None:
+            requests.cap_level(remaining)
+        remaining = _header_float(headers, "x-ratelimit-remaining-tokens")
+        if remaining is not None and token_bucket is not None:
+            token_bucket.cap_level(remaining)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def estimate_tokens(payload: Optional[Dict[str, Any]]) -> int:
+    """
+    Cheap pre-call token estimate for a MaaS request body: prompt text
+    length / CHARS_PER_TOKEN plus the requested ``max_tokens``.
+    """
+    if not payload:
+        return 0
+    chars = 0
+    for message in payload.get("messages") or ():
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            chars += sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+    for field in ("prompt", "input", "query"):
+        value = payload.get(field)
+        if isinstance(value, str):
+            chars += len(value)
+        elif isinstance(value, list):
+            chars += sum(len(item) for item in value if isinstance(item, str))
+    for document in payload.get("documents") or ():
+        if isinstance(document, str):
+            chars += len(document)
+        elif isinstance(document, dict):
+            chars += len(document.get("text", ""))
+    return chars // CHARS_PER_TOKEN + int(payload.get("max_tokens") or 0)
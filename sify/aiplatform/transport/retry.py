@@ -0,0 +1,85 @@
+import random
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import FrozenSet, Mapping, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# The server rejected these before doing any work, so they are safe to resend for any method.
+REJECTED_STATUSES = frozenset({429})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+
+    Only idempotent requests (by HTTP method, or flagged by the caller) are
+    retried, unless ``retry_non_idempotent`` is set. Requests that never
+    reached the server (connect failures) or were rejected with 429 are
+    retried for any method. ``Retry-After`` is honoured when present, and no
+    retry is scheduled that would end past ``deadline`` seconds after the
+    first attempt.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 20.0
+    jitter: bool = True
+    deadline: Optional[float] = 120.0
+    retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+    retry_non_idempotent: bool = False
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        if self.max_retries <= 0:
+            return False
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent or self.retry_non_idempotent
+
+    def retries_status(self, status_code: int, safe: bool) -> bool:
+        return status_code in self.retry_statuses and (safe or status_code in REJECTED_STATUSES)
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retry number ``attempt + 1``, or None when the
+        retry budget (count or deadline) is exhausted.
+        """
+        if attempt >= self.max_retries:
+            return None
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
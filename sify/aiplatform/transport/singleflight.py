@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def request_key(*parts: Any) -> str:
+    """Canonical hash of a request description (JSON-serialisable parts)."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "shared")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls across threads.
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight block and receive the same result or exception. Nothing is kept
+    once the call completes, so this is not a cache.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.shared += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _LeaderCancelled(Exception):
+    """Set on a call whose leading task was cancelled; its followers run it again."""
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of ``SingleFlight``.
+
+    In-flight calls are tracked per event loop. If the leading task is
+    cancelled, the cancellation stays with that task: the first waiting
+    caller to resume runs ``fn`` itself and the others wait on it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        counted = False
+        future = self._calls.get(loop_key)
+        while future is not None:
+            if not counted:
+                self.coalesced += 1
+                counted = True
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                future = self._calls.get(loop_key)
+
+        future = self._calls[loop_key] = loop.create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a call without followers doesn't log a warning.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(loop_key) is future:
+                del self._calls[loop_key]
+
+
+# ------------------------------------------------------------------
+# Process-wide defaults shared by all MaaS clients
+# ------------------------------------------------------------------
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
+
+
+def get_async_single_flight() -> AsyncSingleFlight:
+    return _async_single_flight
@@ -0,0 +1,170 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from .errors import APIRequestError
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+    _loads = json.loads
+
+_DONE = b"[DONE]"
+
+
+class StreamDecodeError(APIRequestError):
+    """A stream frame could not be decoded; ``frame`` holds the raw bytes."""
+
+    def __init__(self, message: str, frame: bytes = b"", **kwargs):
+        super().__init__(message, **kwargs)
+        self.frame = frame
+
+
+class SSEEvent:
+    """One dispatched server-sent event. ``data`` is the raw UTF-8 payload."""
+
+    __slots__ = ("data", "event", "id")
+
+    def __init__(self, data: bytes, event: Optional[str] = None, id: Optional[str] = None):
+        self.data = data
+        self.event = event
+        self.id = id
+
+    def json(self) -> Any:
+        try:
+            return _loads(self.data)
+        except ValueError as e:
+            raise StreamDecodeError(f"Malformed stream frame: {e}", frame=self.data) from e
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(event={self.event!r}, id={self.id!r}, data={self.data[:80]!r})"
+
+
+class SSEParser:
+    """
+    Incremental server-sent events parser working on raw bytes.
+
+    Feed it network chunks of any size; it returns the events completed by
+    each chunk. Follows the WHATWG event-stream rules: CR, LF and CRLF line
+    endings, multi-line ``data:`` fields joined with ``\\n``, ``event:`` and
+    ``id:`` fields, and ``:`` comment lines. Only complete lines are
+    decoded, so a frame split across chunks costs nothing extra.
+
+    With ``json_lines=True`` a line starting with ``{`` is also accepted
+    as a complete event on its own (newline-delimited JSON).
+    """
+
+    def __init__(self, json_lines: bool = False):
+        self.json_lines = json_lines
+        self.last_event_id: Optional[str] = None
+        self._buffer = bytearray()
+        self._data: List[bytes] = []
+        self._event: Optional[str] = None
+        self._pending_cr = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        if self._pending_cr:
+            self._pending_cr = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if b"\r" in chunk:
+            # A trailing CR may be the first half of a CRLF split across chunks.
+            self._pending_cr = chunk.endswith(b"\r")
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        buffer = self._buffer
+        buffer += chunk
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        lines = buffer[:end].split(b"\n")
+        del buffer[:end + 1]
+
+        # Inline the two hot cases (data lines and blank dispatch lines).
+        events: List[SSEEvent] = []
+        data = self._data
+        for line in lines:
+            if line.startswith(b"data:"):
+                data.append(bytes(line[6:] if line[5:6] == b" " else line[5:]))
+            elif not line and len(data) == 1 and self._event is None:
+                if data[0]:
+                    events.append(SSEEvent(data[0], None, self.last_event_id))
+                data.clear()
+            else:
+                self._process_line(bytes(line), events)
+                data = self._data
+        return events
+
+    def close(self) -> List[SSEEvent]:
+        """Flush a final frame the server did not terminate with a blank line."""
+        events: List[SSEEvent] = []
+        if self._buffer:
+            self._process_line(bytes(self._buffer), events)
+            self._buffer.clear()
+        self._process_line(b"", events)
+        return events
+
+    def _process_line(self, line: bytes, events: List[SSEEvent]) -> None:
+        if not line:
+            if self._data:
+                data = b"\n".join(self._data)
+                if data:
+                    events.append(SSEEvent(data, self._event, self.last_event_id))
+                self._data = []
+            self._event = None
+            return
+        if line[0] == 0x3A:  # ":" comment / keep-alive
+            return
+        if self.json_lines and line[0] == 0x7B:  # "{"
+            events.append(SSEEvent(line, None, self.last_event_id))
+            return
+
+        field, sep, value = line.partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8", "replace")
+        elif field == b"id":
+            if b"\0" not in value:
+                self.last_event_id = value.decode("utf-8", "replace")
+        # "retry" and unknown fields are ignored by clients that don't reconnect.
+
+
+# ------------------------------------------------------------------
+# JSON payload iteration
+# ------------------------------------------------------------------
+def iter_sse_json(chunks: Iterable[bytes], *, json_lines: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Decode the JSON payload of every event in a byte stream.
+
+    The ``[DONE]`` sentinel is skipped rather than ending iteration, so the
+    body is read to the end and the connection can return to the pool.
+    Raises ``StreamDecodeError`` for a frame that is not valid JSON instead
+    of dropping it.
+    """
+    parser = SSEParser(json_lines=json_lines)
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            if event.data != _DONE:
+                yield event.json()
+    for event in parser.close():
+        if event.data != _DONE:
+            yield event.json()
+
+
+async def aiter_sse_json(
+    chunks: AsyncIterable[bytes], *, json_lines: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """asyncio counterpart of ``iter_sse_json``."""
+    parser = SSEParser(json_lines=json_lines)
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            if event.data != _DONE:
+                yield event.json()
+    for event in parser.close():
+        if event.data != _DONE:
+            yield event.json()
@@ -0,0 +1,186 @@
+"""Fakes shared by the unit tests: transports, tracers and clients that answer locally."""
+import json
+
+import pytest
+
+from sify.aiplatform.models.api_types import ChatCompletionResponse
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.models.streaming import ResponseStream, StreamAccumulator
+from sify.aiplatform.observability.metrics import MetricsRegistry, configure_metrics, get_metrics
+
+USAGE = {"prompt_tokens": 2, "completion_tokens": 3, "total_tokens": 5}
+
+
+def sse(events):
+    """SSE frames for ``events``, ending with ``[DONE]``."""
+    return [f"data: {json.dumps(event)}\n\n".encode() for event in events] + [b"data: [DONE]\n\n"]
+
+
+class FakeResponse:
+    """
+    Enough of a requests / httpx response for the clients: a JSON ``body``,
+    or SSE ``frames`` for a stream. Records whether it was closed.
+    """
+
+    def __init__(self, body=None, *, frames=None, status_code=200, headers=None):
+        self.status_code = status_code
+        self.frames = frames or []
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.text = self.content.decode()
+        content_type = "text/event-stream" if frames is not None else "application/json"
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+        self.retries = 0
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=None):
+        yield from self.frames
+
+    async def aiter_bytes(self):
+        for frame in self.frames:
+            yield frame
+
+    async def aread(self):
+        return self.content
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeTransport:
+    """
+    Answers every request with the next of ``responses`` (the last one
+    repeats); exception instances are raised instead. ``requests`` records
+    the (method, url, kwargs) of each call.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def _respond(self, method, url, kwargs):
+        self.requests.append((method, url, kwargs))
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def request(self, method, url, **kwargs):
+        return self._respond(method, url, kwargs)
+
+
+class FakeAsyncTransport(FakeTransport):
+    async def request(self, method, url, **kwargs):
+        return self._respond(method, url, kwargs)
+
+
+# ---------------------------------------------------------------------
+# Tracing and metrics
+# ---------------------------------------------------------------------
+
+
+class FakeSpan:
+    def __init__(self, name, input):
+        self.name = name
+        self.input = input
+        self.generation = None
+        self.metadata = {}
+        self.ended = []
+
+    def start_generation(self, **kwargs):
+        self.generation = dict(kwargs)
+
+    def end_generation(self, **kwargs):
+        self.generation = {**(self.generation or {}), **kwargs}
+
+    def set_metadata(self, metadata):
+        self.metadata.update(metadata)
+
+    def end(self, error=None):
+        self.ended.append(error)
+
+
+class FakeTracer:
+    """Keeps every span it starts in ``spans``."""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, input, **kwargs):
+        self.spans.append(FakeSpan(name, input))
+        return self.spans[-1]
+
+
+@pytest.fixture
+def metrics():
+    """An installed MetricsRegistry, removed again after the test."""
+    previous = get_metrics()
+    registry = configure_metrics(MetricsRegistry())
+    yield registry
+    configure_metrics(previous)
+
+
+# ---------------------------------------------------------------------
+# Clients
+# ---------------------------------------------------------------------
+
+
+def chat_reply(content, model="m", usage=USAGE):
+    return {
+        "id": "r", "object": "chat.completion", "created": 0, "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": usage,
+    }
+
+
+def _answer(client, messages):
+    prompt = messages[0]["content"]
+    FakeChatClient.calls.append((client.model_id, prompt))
+    error = FakeChatClient.failures.get(client.model_id) or FakeChatClient.failures.get(prompt)
+    if error is not None:
+        raise error
+    return ChatCompletionResponse.from_dict(chat_reply(prompt.upper(), client.model_id))
+
+
+class FakeChatClient(ModelAsAService):
+    """
+    ModelAsAService whose chat_completion answers locally with the prompt
+    upper-cased. ``failures`` maps a model id or prompt to the exception to
+    raise instead; ``calls`` records (model_id, prompt). Use the
+    ``fake_chat`` fixture to reset both.
+    """
+
+    failures = {}
+    calls = []
+
+    def chat_completion(self, messages, stream=False, **kwargs):
+        if not stream:
+            return _answer(self, messages)
+
+        def chunks():
+            content = _answer(self, messages).choices[0].message.content
+            yield {"choices": [{"index": 0, "delta": {"content": content}}]}
+
+        return ResponseStream(chunks(), StreamAccumulator(chat=True))
+
+
+class AsyncFakeChatClient(AsyncModelAsAService):
+    """asyncio ``FakeChatClient``; shares its ``failures`` and ``calls``."""
+
+    async def chat_completion(self, messages, stream=False, **kwargs):
+        return _answer(self, messages)
+
+
+@pytest.fixture
+def fake_chat():
+    FakeChatClient.failures.clear()
+    FakeChatClient.calls.clear()
+    yield FakeChatClient
+    FakeChatClient.failures.clear()
+    FakeChatClient.calls.clear()
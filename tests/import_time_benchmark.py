@@ -0,0 +1,49 @@
+"""
+Startup guard: time ``import sify.aiplatform.models`` in fresh interpreters.
+
+Each run happens in a new process so nothing is cached in ``sys.modules``.
+Reports the median and best import time, checks that ``langfuse`` is not
+imported while tracing is disabled, and exits non-zero if the median
+exceeds the budget.
+
+    python tests/import_time_benchmark.py [budget_ms] [runs]
+"""
+import statistics
+import subprocess
+import sys
+
+MODULE = "sify.aiplatform.models"
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import {MODULE}
+elapsed = time.perf_counter() - start
+print(elapsed, "langfuse" in sys.modules)
+"""
+
+
+def measure() -> tuple:
+    out = subprocess.run([sys.executable, "-c", PROBE], check=True, capture_output=True, text=True).stdout
+    elapsed, langfuse_loaded = out.split()
+    return float(elapsed), langfuse_loaded == "True"
+
+
+if __name__ == "__main__":
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 400.0
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    samples = []
+    for _ in range(runs):
+        elapsed, langfuse_loaded = measure()
+        samples.append(elapsed * 1000)
+        if langfuse_loaded:
+            print(f"FAIL: importing {MODULE} imported langfuse with tracing disabled")
+            sys.exit(1)
+
+    median = statistics.median(samples)
+    print(f"import {MODULE}: median {median:.1f} ms, best {min(samples):.1f} ms over {runs} runs")
+    if median > budget_ms:
+        print(f"FAIL: over the {budget_ms:.0f} ms budget")
+        sys.exit(1)
+    print(f"OK: within the {budget_ms:.0f} ms budget")
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark: byte-level SSE parser vs. the previous line-based parser.
+
+Replays a synthetic chat completion stream (one token per frame, delivered
+in network-sized chunks) through both parsers and reports frames/second.
+
+    python tests/sse_parser_benchmark.py [frames] [chunk_size]
+"""
+import codecs
+import json
+import sys
+import time
+
+from sify.aiplatform.transport.sse import iter_sse_json, orjson
+
+
+def build_stream(frames: int) -> bytes:
+    parts = []
+    for i in range(frames):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-model",
+            "choices": [{"index": 0, "delta": {"content": f" tok{i}"}, "finish_reason": None}],
+        }
+        parts.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def split(payload: bytes, chunk_size: int):
+    return [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+
+
+def legacy_iter_lines(chunks):
+    # Equivalent of requests' iter_lines(decode_unicode=True).
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = None
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if pending is not None:
+            text = pending + text
+        lines = text.splitlines()
+        pending = lines.pop() if lines and text and lines[-1] and lines[-1][-1] == text[-1] else None
+        yield from lines
+    if pending is not None:
+        yield pending
+
+
+def legacy_parse(chunks):
+    # The per-line parser previously used by ModelAsAService.
+    for line in legacy_iter_lines(chunks):
+        if not line:
+            continue
+        if line.startswith("data: "):
+            data_str = line[len("data: "):].strip()
+            if data_str and data_str != "[DONE]":
+                try:
+                    yield json.loads(data_str)
+                except json.JSONDecodeError:
+                    continue
+        elif line.strip():
+            try:
+                yield json.loads(line.strip())
+            except json.JSONDecodeError:
+                continue
+
+
+def bench(name, parse, chunks, frames, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in parse(chunks))
+        best = min(best, time.perf_counter() - start)
+    assert count == frames, (name, count)
+    print(f"{name:<28} {best * 1000:8.1f} ms   {frames / best:12,.0f} frames/s")
+    return best
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    chunks = split(build_stream(frames), chunk_size)
+
+    print(f"{frames} frames, {chunk_size}-byte chunks, orjson={'yes' if orjson else 'no'}")
+    legacy = bench("line-based (previous)", legacy_parse, chunks, frames)
+    current = bench("byte-level SSEParser", lambda c: iter_sse_json(c, json_lines=True), chunks, frames)
+    print(f"speed-up: {legacy / current:.2f}x")
@@ -0,0 +1,39 @@
+import pytest
+from conftest import FakeResponse, FakeTracer, FakeTransport
+
+from sify.aiplatform.aistudio.app import AIApplication
+
+USAGE = {"prompt_tokens": 7, "completion_tokens": 5, "total_tokens": 12}
+REPLY = {
+    "event": "message", "message_id": "m", "conversation_id": "c", "mode": "chat",
+    "answer": "hi", "created_at": 0, "metadata": {"usage": USAGE},
+}
+
+
+def app_with(transport):
+    app = AIApplication("https://example.invalid/v1", "key", transport=transport)
+    app.tracer = FakeTracer()
+    return app
+
+
+def test_blocking_chat_message_is_traced_and_reports_usage(metrics):
+    app = app_with(FakeTransport(FakeResponse(REPLY)))
+
+    response = app.chat_message("hello", "user", "blocking")
+
+    assert response.answer == "hi"
+    [span] = app.tracer.spans
+    assert span.name == "aistudio.chat_message"
+    assert span.ended == [None]
+    assert span.metadata["usage"] == USAGE
+    assert 'sify_tokens_total{endpoint="/chat-messages",model="",type="prompt"} 7' in metrics.render()
+
+
+def test_blocking_chat_message_failure_ends_span_with_error():
+    app = app_with(FakeTransport(ValueError("boom")))
+
+    with pytest.raises(ValueError):
+        app.chat_message("hello", "user", "blocking")
+
+    [span] = app.tracer.spans
+    assert isinstance(span.ended[0], ValueError)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from conftest import FakeAsyncTransport, FakeResponse, FakeTracer, sse
+
+from sify.aiplatform.aistudio.async_app import AsyncAIApplication
+from sify.aiplatform.aistudio.async_datamind import AsyncDataMind
+from sify.aiplatform.transport.errors import (
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+)
+
+BASE_URL = "https://example.invalid/v1"
+USAGE = {"prompt_tokens": 7, "completion_tokens": 5, "total_tokens": 12}
+REPLY = {
+    "event": "message", "message_id": "m", "conversation_id": "c", "mode": "chat",
+    "answer": "hi", "created_at": 0, "metadata": {"usage": USAGE},
+}
+DOCUMENT = {
+    "id": "d", "position": 1, "data_source_type": "upload_file", "data_source_info": {},
+    "dataset_process_rule_id": "r", "name": "notes.txt", "created_from": "api", "created_by": "u",
+    "created_at": 0, "tokens": 0, "indexing_status": "waiting", "error": None, "enabled": True,
+    "disabled_at": None, "disabled_by": None, "archived": False, "display_status": "queuing",
+    "word_count": 0, "hit_count": 0, "doc_form": "text_model",
+}
+
+ERRORS = [
+    (FakeResponse({"message": "bad key"}, status_code=401), AuthenticationError),
+    (FakeResponse({"message": "missing"}, status_code=404), NotFoundError),
+    (FakeResponse({"message": "slow down"}, status_code=429), RateLimitError),
+    (httpx.ReadTimeout("slow"), APITimeoutError),
+    (httpx.ConnectError("refused"), APIConnectionError),
+]
+
+
+def app_with(*responses):
+    app = AsyncAIApplication(BASE_URL, "key", transport=FakeAsyncTransport(*responses))
+    app.tracer = FakeTracer()
+    return app
+
+
+def datamind_with(*responses):
+    return AsyncDataMind(BASE_URL, "key", transport=FakeAsyncTransport(*responses))
+
+
+# ---------------------------------------------------------------------
+# AsyncAIApplication
+# ---------------------------------------------------------------------
+
+
+def test_app_blocking_chat_message(metrics):
+    app = app_with(FakeResponse(REPLY))
+
+    response = asyncio.run(app.chat_message("hello", "user", "blocking"))
+
+    assert response.answer == "hi"
+    [(method, url, kwargs)] = app.transport.requests
+    assert (method, url) == ("POST", f"{BASE_URL}/chat-messages")
+    assert kwargs["json"]["query"] == "hello" and kwargs["json"]["response_mode"] == "blocking"
+    [span] = app.tracer.spans
+    assert span.ended == [None] and span.metadata["usage"] == USAGE
+    assert 'sify_tokens_total{endpoint="/chat-messages",model="",type="prompt"} 7' in metrics.render()
+
+
+def test_app_streaming_chat_message():
+    events = [
+        {"event": "message", "message_id": "m", "conversation_id": "c", "answer": "he"},
+        {"event": "message", "message_id": "m", "conversation_id": "c", "answer": "llo"},
+        {"event": "message_end", "message_id": "m", "conversation_id": "c", "metadata": {"usage": USAGE}},
+    ]
+    response = FakeResponse(frames=sse(events))
+    app = app_with(response)
+
+    async def main():
+        stream = await app.chat_message("hello", "user", "streaming")
+        return [event async for event in stream]
+
+    received = asyncio.run(main())
+
+    assert "".join(event.answer or "" for event in received) == "hello"
+    assert received[-1].event == "message_end"
+    assert app.transport.requests[0][2]["stream"] is True
+    assert response.closed
+    [span] = app.tracer.spans
+    assert span.ended == [None] and span.metadata["usage"] == USAGE
+
+
+@pytest.mark.parametrize("raised, error", ERRORS)
+def test_app_maps_errors(raised, error):
+    app = app_with(raised)
+    with pytest.raises(error):
+        asyncio.run(app.chat_message("hello", "user", "blocking"))
+    assert isinstance(app.tracer.spans[0].ended[0], error)
+
+
+def test_app_streaming_error_status_closes_the_response():
+    response = FakeResponse({"message": "slow down"}, status_code=429)
+    app = app_with(response)
+    with pytest.raises(RateLimitError):
+        asyncio.run(app.chat_message("hello", "user", "streaming"))
+    assert response.closed
+
+
+# ---------------------------------------------------------------------
+# AsyncDataMind
+# ---------------------------------------------------------------------
+
+
+def test_datamind_blocking_request():
+    datamind = datamind_with(FakeResponse({"data": [], "has_more": False, "limit": 5, "total": 0, "page": 2}))
+
+    response = asyncio.run(datamind.list_knowledge(page=2, limit=5))
+
+    assert (response.page, response.limit, response.data) == (2, 5, [])
+    [(method, url, kwargs)] = datamind.transport.requests
+    assert (method, url) == ("GET", f"{BASE_URL}/datasets")
+    assert kwargs["params"] == {"page": 2, "limit": 5}
+    assert kwargs["headers"] == {"Authorization": "Bearer key", "Content-Type": "application/json"}
+
+
+def test_datamind_file_upload(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("some notes")
+    datamind = datamind_with(FakeResponse({"document": DOCUMENT, "batch": "b"}))
+
+    response = asyncio.run(datamind.create_document_from_file("ds", str(path)))
+
+    assert response.batch == "b" and response.document.name == "notes.txt"
+    [(method, url, kwargs)] = datamind.transport.requests
+    assert (method, url) == ("POST", f"{BASE_URL}/datasets/ds/document/create_by_file")
+    assert kwargs["files"]["file"] == ("notes.txt", b"some notes")
+    assert json.loads(kwargs["files"]["data"][1])["indexing_technique"] == "high_quality"
+    # httpx sets the multipart content type itself.
+    assert kwargs["headers"] == {"Authorization": "Bearer key"}
+
+
+@pytest.mark.parametrize("raised, error", ERRORS)
+def test_datamind_maps_errors(raised, error):
+    with pytest.raises(error):
+        asyncio.run(datamind_with(raised).list_knowledge())
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import USAGE, FakeAsyncTransport, FakeResponse, FakeTracer, chat_reply, sse
+
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.transport.errors import (
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def client_with(*responses):
+    client = AsyncModelAsAService("key", "m", transport=FakeAsyncTransport(*responses), coalesce=False)
+    client.tracer = FakeTracer()
+    return client
+
+
+def test_blocking_chat_completion(metrics):
+    client = client_with(FakeResponse(chat_reply("hello")))
+
+    response = asyncio.run(client.chat_completion(MESSAGES, temperature=0))
+
+    assert response.choices[0].message.content == "hello"
+    [(method, url, kwargs)] = client.transport.requests
+    assert (method, url) == ("POST", f"{client.base_url}/v1/chat/completions")
+    assert kwargs["json"] == {"model": "m", "messages": MESSAGES, "stream": False, "temperature": 0}
+    assert kwargs["headers"]["Authorization"] == "Bearer key"
+    [span] = client.tracer.spans
+    assert span.ended == [None] and span.generation["usage"] == USAGE
+    assert 'sify_tokens_total{endpoint="/v1/chat/completions",model="m",type="prompt"} 2' in metrics.render()
+
+
+def test_streaming_chat_completion():
+    chunks = [
+        {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "m",
+         "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]}
+        for word in ("one", "two")
+    ]
+    response = FakeResponse(frames=sse(chunks))
+    client = client_with(response)
+
+    async def main():
+        stream = await client.chat_completion(MESSAGES, stream=True)
+        return [chunk.choices[0]["delta"]["content"] async for chunk in stream]
+
+    assert asyncio.run(main()) == ["one", "two"]
+    assert client.transport.requests[0][2]["stream"] is True
+    assert response.closed
+    assert client.tracer.spans[0].ended == [None]
+
+
+@pytest.mark.parametrize(
+    "status, error",
+    [(401, AuthenticationError), (404, NotFoundError), (429, RateLimitError), (503, ServerError)],
+)
+def test_status_codes_map_to_typed_errors(status, error):
+    client = client_with(FakeResponse({"error": {"message": "nope"}}, status_code=status))
+    with pytest.raises(error) as info:
+        asyncio.run(client.chat_completion(MESSAGES))
+    assert info.value.status_code == status
+    assert isinstance(client.tracer.spans[0].ended[0], error)
+
+
+def test_streaming_error_status_is_raised_on_first_read():
+    response = FakeResponse({"error": {"message": "slow down"}}, status_code=429)
+    client = client_with(response)
+
+    async def main():
+        stream = await client.chat_completion(MESSAGES, stream=True)
+        return [chunk async for chunk in stream]
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(main())
+    assert response.closed
+    assert isinstance(client.tracer.spans[0].ended[0], RateLimitError)
+
+
+@pytest.mark.parametrize(
+    "raised, error",
+    [(httpx.ReadTimeout("slow"), APITimeoutError), (httpx.ConnectError("refused"), APIConnectionError)],
+)
+def test_transport_errors_map_to_typed_errors(raised, error):
+    client = client_with(raised)
+    with pytest.raises(error) as info:
+        asyncio.run(client.chat_completion(MESSAGES))
+    assert info.value.__cause__ is raised
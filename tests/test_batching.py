@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from sify.aiplatform.models.batching import abounded_map, bounded_map
+from sify.aiplatform.observability.langfuse import tracer
+from sify.aiplatform.observability.langfuse import langfuse_identity
+
+
+def test_bounded_map_propagates_context_to_workers():
+    with langfuse_identity(user_id="alice", session_id="s-1"):
+        results = bounded_map(lambda _: (tracer._user_id.get(), tracer._session_id.get()), range(5), 3)
+        values = [future.result() for _, future in results]
+    assert values == [("alice", "s-1")] * 5
+
+
+def test_bounded_map_workers_do_not_leak_context():
+    def set_and_read(i):
+        tracer._user_id.set(f"user-{i}")
+        return tracer._user_id.get()
+
+    with langfuse_identity(user_id="alice"):
+        values = [future.result() for _, future in bounded_map(set_and_read, range(4), 2)]
+        assert tracer._user_id.get() == "alice"
+    assert values == [f"user-{i}" for i in range(4)]
+
+
+def test_bounded_map_validates_at_call_time():
+    with pytest.raises(ValueError):
+        bounded_map(lambda x: x, [1], 0)
+    with pytest.raises(ValueError):
+        abounded_map(lambda x: x, [1], 0)
+
+
+def test_bounded_map_ordered_and_errors():
+    def fn(x):
+        if x == 2:
+            raise RuntimeError("boom")
+        return x * 10
+
+    pairs = list(bounded_map(fn, range(5), 2))
+    assert [item for item, _ in pairs] == [0, 1, 2, 3, 4]
+    assert isinstance(pairs[2][1].exception(), RuntimeError)
+    assert [f.result() for i, f in pairs if i != 2] == [0, 10, 30, 40]
+
+
+def test_abounded_map_propagates_context():
+    async def read(_):
+        await asyncio.sleep(0)
+        return tracer._user_id.get()
+
+    async def main():
+        with langfuse_identity(user_id="bob"):
+            return [task.result() async for _, task in abounded_map(read, range(6), 2, ordered=False)]
+
+    assert asyncio.run(main()) == ["bob"] * 6
@@ -0,0 +1,119 @@
+import pytest
+
+from sify.aiplatform.transport import circuit
+from sify.aiplatform.transport.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, CircuitPolicy
+from sify.aiplatform.transport.errors import CircuitOpenError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit, "time", clock)
+    return clock
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=10)
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()  # resets the streak
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    clock.now += 4
+    assert breaker.retry_after() == pytest.approx(6)
+
+
+def test_half_open_probes_then_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, half_open_max_calls=2)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() and breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == pytest.approx(10)
+
+
+def test_released_probe_frees_its_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow() and not breaker.allow()
+
+    breaker.release()
+
+    assert breaker.allow()
+
+
+def test_failure_rate_trips_only_after_min_calls(clock):
+    breaker = CircuitBreaker(failure_threshold=100, failure_rate_threshold=0.5, window=10, min_calls=6)
+    for _ in range(2):
+        breaker.record_success()
+        breaker.record_failure()
+    assert breaker.state == CLOSED  # 4 calls < min_calls
+
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+
+
+def test_timeouts_trip_within_window(clock):
+    breaker = CircuitBreaker(failure_threshold=100, timeout_threshold=2, window=5)
+    breaker.record_failure(timed_out=True)
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure(timed_out=True)
+
+    assert breaker.state == OPEN
+
+
+def test_registry_fails_fast_and_exports_transitions(clock, metrics):
+    breakers = CircuitBreakers(CircuitPolicy(failure_threshold=2, failure_rate_threshold=None, recovery_time=5))
+    url = "https://api.example/maas/v1/chat/completions"
+    for status in (503, 500):
+        breaker = breakers.acquire(url, "/v1/chat/completions", "m")
+        breakers.record_response(breaker, status)
+
+    with pytest.raises(CircuitOpenError) as info:
+        breakers.acquire(url, "/v1/chat/completions", "m")
+
+    assert info.value.retry_after == pytest.approx(5)
+    breakers.record_response(breakers.acquire(url, "/v1/chat/completions", "other"), 429)
+    assert breakers.states() == {
+        "https://api.example/maas /v1/chat/completions m": OPEN,
+        "https://api.example/maas /v1/chat/completions other": CLOSED,
+    }
+    rendered = metrics.render()
+    assert 'from_state="closed",to_state="open"} 1' in rendered
+    assert "sify_circuit_rejections_total" in rendered
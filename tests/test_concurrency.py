@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from conftest import FakeAsyncTransport, FakeResponse
+
+from sify.aiplatform.aistudio.async_datamind import AsyncDataMind
+from sify.aiplatform.transport.concurrency import AdaptiveConcurrencyLimiter, limited_request
+from sify.aiplatform.transport.errors import CircuitOpenError, ServerError
+
+
+def fill(limiter, n):
+    for _ in range(n):
+        limiter.acquire()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_additive_increase_only_while_the_limit_is_used():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=None)
+    fill(limiter, 2)
+    limiter.release(0.01)
+    assert limiter.limit == pytest.approx(2.5)
+
+    # One request in flight does not use a limit of 2.
+    limiter.release(0.01)
+    assert limiter.limit == pytest.approx(2.5)
+
+    # A round trip at the limit adds about ``increase`` in total.
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_tolerance=None)
+    fill(limiter, 4)
+    for _ in range(4):
+        limiter.release(0.01)
+        limiter.acquire()
+    assert limiter.limit == pytest.approx(5, abs=0.1)
+    assert limiter.decreases == 0
+
+
+def test_multiplicative_decrease_once_per_burst():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3, latency_tolerance=None)
+    fill(limiter, 8)
+    limiter.release(0.05, overloaded=True)
+    assert limiter.limit == 4
+
+    # The rest of the burst lands within one smoothed latency.
+    for _ in range(7):
+        limiter.release(0.05, overloaded=True)
+    assert limiter.limit == 4
+    assert limiter.decreases == 1
+
+    time.sleep(0.06)
+    limiter.acquire()
+    limiter.release(0.05, overloaded=True)
+    assert limiter.limit == 3
+
+
+def test_latency_spike_counts_as_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2.0, smoothing=1.0)
+    fill(limiter, 2)
+    limiter.release(0.001)
+    limiter.release(0.01)
+    assert limiter.limit == 4
+
+
+def test_exports_limit_in_flight_and_queue_depth(metrics):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, name="test")
+    limiter.acquire()
+    waiter = threading.Thread(target=limiter.acquire)
+    waiter.start()
+    wait_for(lambda: limiter.queue_depth == 1)
+
+    gauge = lambda name: metrics.gauge(name, "").value(limiter="test")
+    assert gauge("concurrency_limit") == 1
+    assert gauge("concurrency_in_flight") == 1
+    assert gauge("concurrency_queue_depth") == 1
+
+    limiter.release(0.01, overloaded=True)
+    waiter.join(timeout=2)
+    assert gauge("concurrency_in_flight") == 1
+    assert gauge("concurrency_queue_depth") == 0
+    limiter.release()
+    assert gauge("concurrency_in_flight") == 0
+    assert 'sify_concurrency_limit{limiter="test"} 1' in metrics.render()
+
+
+@pytest.mark.parametrize(
+    "error, overloaded",
+    [
+        (requests.Timeout("slow"), True),
+        (requests.ConnectionError("refused"), False),
+        (CircuitOpenError("open", retry_after=1.0), False),
+    ],
+)
+def test_only_timeouts_count_as_overload(error, overloaded):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=None)
+
+    def request():
+        raise error
+
+    with pytest.raises(type(error)):
+        limited_request(limiter, request)
+    assert limiter.in_flight == 0
+    assert limiter.limit == (4 if overloaded else 8)
+    # A request that never reached the server leaves no latency sample.
+    assert (limiter.latency is None) is (not overloaded)
+
+
+def test_async_datamind_holds_a_slot_and_backs_off_on_503():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=None)
+    client = AsyncDataMind(
+        "https://api.example", "key",
+        transport=FakeAsyncTransport(FakeResponse({"error": "busy"}, status_code=503)),
+        concurrency_limiter=limiter,
+    )
+    with pytest.raises(ServerError):
+        asyncio.run(client.list_knowledge())
+    assert limiter.in_flight == 0
+    assert limiter.limit == 4
@@ -0,0 +1,164 @@
+import asyncio
+import base64
+import threading
+import time
+
+import pytest
+from conftest import FakeResponse, FakeTransport
+
+from sify.aiplatform.models.api_types import EmbeddingResponse
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.transport.errors import ServerError
+
+
+def embedding_reply(texts):
+    # Each vector encodes the text's number, so order is checkable after merging.
+    return {
+        "object": "list",
+        "model": "embed",
+        "data": [
+            {"object": "embedding", "embedding": [float(text[1:]), 0.5], "index": i} for i, text in enumerate(texts)
+        ],
+        "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)},
+    }
+
+
+class EmbeddingTransport:
+    """
+    Embeds every batch it is sent. The batch holding ``slow`` answers
+    last, and a batch holding any of ``fail`` gets a 500.
+    """
+
+    def __init__(self, slow="t0", fail=()):
+        self.slow = slow
+        self.fail = set(fail)
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def _respond(self, kwargs):
+        texts = kwargs["json"]["input"]
+        with self.lock:
+            self.batches.append(list(texts))
+        if self.fail.intersection(texts):
+            return FakeResponse({"error": "boom"}, status_code=500)
+        return FakeResponse(embedding_reply(texts))
+
+    def request(self, method, url, **kwargs):
+        if self.slow in kwargs["json"]["input"]:
+            time.sleep(0.05)
+        return self._respond(kwargs)
+
+
+class AsyncEmbeddingTransport(EmbeddingTransport):
+    async def request(self, method, url, **kwargs):
+        if self.slow in kwargs["json"]["input"]:
+            await asyncio.sleep(0.05)
+        return self._respond(kwargs)
+
+
+TEXTS = [f"t{i}" for i in range(10)]
+
+
+def client(transport, cls=ModelAsAService):
+    return cls("key", "embed", transport=transport, coalesce=False)
+
+
+def test_embed_many_keeps_input_order_across_out_of_order_batches():
+    transport = EmbeddingTransport()
+    response = client(transport).embed_many(iter(TEXTS), batch_size=3, max_concurrency=4)
+
+    assert sorted(map(len, transport.batches)) == [1, 3, 3, 3]
+    assert [item.index for item in response.data] == list(range(10))
+    assert [item.embedding[0] for item in response.data] == list(range(10))
+    assert response.usage.prompt_tokens == response.usage.total_tokens == 10
+
+
+def test_iter_embeddings_yields_global_indices_as_completed():
+    transport = EmbeddingTransport()
+    batches = list(client(transport).iter_embeddings(TEXTS, batch_size=5, max_concurrency=2))
+
+    # The slow first batch arrives last.
+    assert [[item.index for item in batch.data] for batch in batches] == [[5, 6, 7, 8, 9], [0, 1, 2, 3, 4]]
+
+
+def test_ordered_iteration_yields_batches_before_a_failure():
+    transport = EmbeddingTransport(fail={"t4"})
+    yielded = []
+    with pytest.raises(ServerError):
+        for batch in client(transport).iter_embeddings(TEXTS, batch_size=2, max_concurrency=2, ordered=True):
+            yielded.append([item.index for item in batch.data])
+    assert yielded == [[0, 1], [2, 3]]
+
+
+def test_embed_many_raises_when_a_batch_fails():
+    with pytest.raises(ServerError):
+        client(EmbeddingTransport(fail={"t7"})).embed_many(TEXTS, batch_size=3, max_concurrency=2)
+
+
+def test_max_batch_tokens_splits_batches():
+    transport = EmbeddingTransport()
+    long = "t1" + " " * 40  # about 11 tokens
+    client(transport).embed_many(["t0", long, "t2", "t3"], batch_size=10, max_batch_tokens=10, max_concurrency=1)
+    assert transport.batches == [["t0"], [long], ["t2", "t3"]]
+
+
+def test_async_embed_many_keeps_input_order():
+    transport = AsyncEmbeddingTransport()
+    response = asyncio.run(
+        client(transport, AsyncModelAsAService).embed_many(TEXTS, batch_size=4, max_concurrency=3)
+    )
+    assert [item.embedding[0] for item in response.data] == list(range(10))
+    assert response.usage.total_tokens == 10
+
+
+def test_async_embed_many_raises_when_a_batch_fails():
+    transport = AsyncEmbeddingTransport(fail={"t9"})
+    with pytest.raises(ServerError):
+        asyncio.run(client(transport, AsyncModelAsAService).embed_many(TEXTS, batch_size=4, max_concurrency=3))
+
+
+# ---------------------------------------------------------------------
+# as_array
+# ---------------------------------------------------------------------
+
+
+def base64_response(rows):
+    np = pytest.importorskip("numpy")
+    # Listed out of order: as_array sorts by index.
+    encoded = [base64.b64encode(np.asarray(row, dtype="<f4").tobytes()).decode() for row in rows]
+    data = [{"object": "embedding", "embedding": vector, "index": i} for i, vector in enumerate(encoded)][::-1]
+    return EmbeddingResponse.from_dict(
+        {"object": "list", "model": "embed", "data": data, "usage": {"prompt_tokens": 1, "total_tokens": 1}}
+    )
+
+
+def test_as_array_round_trips_base64():
+    np = pytest.importorskip("numpy")
+    rows = [[0.25, -1.5, 3.0], [1e-7, 2.0, -0.0], [7.0, 8.0, 9.0]]
+    matrix = base64_response(rows).as_array()
+    assert matrix.dtype == np.float32 and matrix.shape == (3, 3)
+    assert matrix.flags.c_contiguous
+    np.testing.assert_array_equal(matrix, np.asarray(rows, dtype=np.float32))
+    assert base64_response(rows).as_array(dtype="float64").dtype == np.float64
+
+
+def test_as_array_matches_float_lists():
+    np = pytest.importorskip("numpy")
+    response = EmbeddingResponse.from_dict(embedding_reply(["t2", "t0"]))
+    np.testing.assert_array_equal(response.as_array(), [[2.0, 0.5], [0.0, 0.5]])
+
+
+def test_as_array_rejects_mismatched_rows():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Embedding 1 has 8 bytes, expected 12"):
+        base64_response([[1.0, 2.0, 3.0], [1.0, 2.0]]).as_array()
+
+
+def test_create_embeddings_array_requests_base64():
+    np = pytest.importorskip("numpy")
+    rows = [[1.0, 2.0], [3.0, 4.0]]
+    transport = FakeTransport(FakeResponse(base64_response(rows).to_dict()))
+    matrix = client(transport).create_embeddings_array(["a", "b"])
+    assert transport.requests[0][2]["json"]["encoding_format"] == "base64"
+    np.testing.assert_array_equal(matrix, rows)
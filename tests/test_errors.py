@@ -0,0 +1,45 @@
+import httpx
+import pytest
+import requests
+
+from sify.aiplatform.aistudio.app import AIApplication
+from sify.aiplatform.aistudio.datamind import DataMind
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.transport.errors import APIConnectionError, APIRequestError, APITimeoutError
+
+
+def raised(raise_request_error, error):
+    with pytest.raises(APIRequestError) as info:
+        raise_request_error(error)
+    return info.value
+
+
+@pytest.fixture
+def client():
+    return ModelAsAService("key", "model")
+
+
+def test_maps_by_exception_type_not_message(client):
+    # Messages that would have fooled substring matching.
+    assert type(raised(client._raise_request_error, requests.Timeout("connection pool busy"))) is APITimeoutError
+    assert type(raised(client._raise_request_error, requests.ConnectionError("timeout"))) is APIConnectionError
+    assert type(raised(client._raise_request_error, ValueError("connection timeout"))) is APIRequestError
+
+
+def test_connect_timeout_is_a_timeout(client):
+    assert type(raised(client._raise_request_error, requests.ConnectTimeout())) is APITimeoutError
+
+
+def test_ssl_error_gets_its_own_message(client):
+    error = raised(client._raise_request_error, requests.exceptions.SSLError("handshake"))
+    assert type(error) is APIConnectionError
+    assert "SSL" in str(error)
+
+
+@pytest.mark.parametrize("raise_request_error", [AIApplication._raise_request_error, DataMind._raise_request_error])
+def test_aistudio_maps_requests_and_httpx_errors(raise_request_error):
+    assert type(raised(raise_request_error, requests.ReadTimeout())) is APITimeoutError
+    assert type(raised(raise_request_error, httpx.ReadTimeout("slow"))) is APITimeoutError
+    assert type(raised(raise_request_error, requests.ConnectionError())) is APIConnectionError
+    assert type(raised(raise_request_error, httpx.ConnectError("refused"))) is APIConnectionError
+    assert type(raised(raise_request_error, requests.HTTPError("connection"))) is APIRequestError
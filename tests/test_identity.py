@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+from conftest import FakeAsyncTransport, FakeResponse, chat_reply
+
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.observability.langfuse import langfuse_identity, set_langfuse_identity
+from sify.aiplatform.observability.langfuse.tracer import LangfuseTracer
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def submit(self, record):
+        with self.lock:
+            self.records.append(record)
+        return True
+
+
+def identities(exporter):
+    return sorted((r.name, r.user_id, r.session_id) for r in exporter.records)
+
+
+def test_concurrent_tasks_trace_under_their_own_identity():
+    exporter = RecordingExporter()
+    tracer = LangfuseTracer(None, exporter)
+
+    async def handle(user):
+        with langfuse_identity(user_id=user, session_id=f"s-{user}"):
+            span = tracer.start_span(f"call-{user}", {})
+            # Let every other task set its identity before this span ends.
+            await asyncio.sleep(0.01)
+            span.end()
+            return tracer.start_span(f"late-{user}", {})
+
+    async def main():
+        late = await asyncio.gather(*(handle(user) for user in ("a", "b", "c")))
+        for span in late:
+            span.end()
+
+    asyncio.run(main())
+    assert identities(exporter) == [
+        ("call-a", "a", "s-a"), ("call-b", "b", "s-b"), ("call-c", "c", "s-c"),
+        ("late-a", "a", "s-a"), ("late-b", "b", "s-b"), ("late-c", "c", "s-c"),
+    ]
+
+
+def test_threads_do_not_see_each_others_identity():
+    exporter = RecordingExporter()
+    tracer = LangfuseTracer(None, exporter)
+    barrier = threading.Barrier(4)
+
+    def worker(user):
+        set_langfuse_identity(user_id=user, trace_context={"trace_id": f"t-{user}"})
+        barrier.wait()
+        tracer.start_span(user, {}).end()
+
+    threads = [threading.Thread(target=worker, args=(user,)) for user in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted((r.name, r.user_id, r.trace_context["trace_id"]) for r in exporter.records) == [
+        (user, user, f"t-{user}") for user in "abcd"
+    ]
+    # Nothing leaked into this thread.
+    tracer.start_span("main", {}).end()
+    assert exporter.records[-1].user_id is None and exporter.records[-1].trace_context is None
+
+
+def test_identity_is_restored_on_exit():
+    exporter = RecordingExporter()
+    tracer = LangfuseTracer(None, exporter)
+    with langfuse_identity(user_id="outer"):
+        with langfuse_identity(user_id="inner", session_id="s"):
+            tracer.start_span("inner", {}).end()
+        tracer.start_span("outer", {}).end()
+    tracer.start_span("none", {}).end()
+    assert identities(exporter) == [("inner", "inner", "s"), ("none", None, None), ("outer", "outer", None)]
+
+
+def test_shared_client_uses_context_identity_over_its_defaults():
+    exporter = RecordingExporter()
+    transport = FakeAsyncTransport(FakeResponse(chat_reply("hi")))
+    client = AsyncModelAsAService("key", "m", transport=transport, user_id="default", coalesce=False)
+    client.tracer = LangfuseTracer(None, exporter)
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def call(user):
+        if user is None:
+            return await client.chat_completion(messages)
+        with langfuse_identity(user_id=user):
+            return await client.chat_completion(messages)
+
+    async def main():
+        await asyncio.gather(call("alice"), call("bob"), call(None))
+
+    asyncio.run(main())
+    assert sorted(r.user_id for r in exporter.records) == ["alice", "bob", "default"]
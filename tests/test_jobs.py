@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from conftest import FakeChatClient
+
+from sify.aiplatform.jobs.runner import BatchJob
+from sify.aiplatform.transport.errors import ServerError
+
+
+@pytest.fixture
+def paths(tmp_path, fake_chat):
+    input_path = tmp_path / "requests.jsonl"
+    lines = [
+        json.dumps({"custom_id": f"q-{i}", "body": {"messages": [{"role": "user", "content": f"p{i}"}]}})
+        for i in range(5)
+    ]
+    input_path.write_text("\n".join(lines + ["{not json"]) + "\n")
+    fake_chat.failures["p3"] = ServerError("upstream down", status_code=500)
+    return str(input_path), str(tmp_path / "out.jsonl")
+
+
+def job(paths, **kwargs):
+    return BatchJob(FakeChatClient("key", "m", coalesce=False), *paths, max_concurrency=2, **kwargs)
+
+
+def outputs(path):
+    with open(path) as f:
+        return {entry["custom_id"]: entry for entry in map(json.loads, f)}
+
+
+def test_run_writes_results_errors_and_totals(paths):
+    summary = job(paths, input_cost_per_million=1.0, output_cost_per_million=2.0).run()
+
+    assert (summary.succeeded, summary.failed, summary.skipped) == (4, 2, 0)
+    assert summary.errors == {"ServerError": 1, "ValueError": 1}
+    assert summary.total_tokens == 20 and summary.cost == pytest.approx((8 + 2 * 12) / 1e6)
+    entries = outputs(paths[1])
+    assert entries["q-0"]["response"]["choices"][0]["message"]["content"] == "P0"
+    assert entries["q-3"]["error"]["status_code"] == 500
+    assert entries["line-6"]["error"]["type"] == "ValueError"
+
+
+def test_rerun_skips_everything_already_recorded(paths):
+    job(paths).run()
+    FakeChatClient.calls.clear()
+
+    summary = job(paths).run()
+
+    assert FakeChatClient.calls == []
+    assert (summary.succeeded, summary.failed, summary.skipped) == (0, 0, 6)
+
+
+def test_retry_errors_reruns_only_failed_ids(paths):
+    job(paths).run()
+    FakeChatClient.failures.clear()
+    FakeChatClient.calls.clear()
+
+    summary = job(paths, retry_errors=True).run()
+
+    assert FakeChatClient.calls == [("m", "p3")]
+    assert (summary.succeeded, summary.failed, summary.skipped) == (1, 1, 4)
+    succeeded, failed = job(paths).load_checkpoint()
+    assert "q-3" in succeeded and failed == {"line-6"}
+
+
+def test_resume_after_crash_drops_partial_lines(paths):
+    job(paths).run()
+    checkpoint = paths[1] + ".ckpt"
+    with open(checkpoint) as f:
+        lines = f.readlines()
+    # Crash: the last id never reached the checkpoint and its output line is torn.
+    lost = json.loads(lines[-1].split("\t")[1])
+    with open(checkpoint, "w") as f:
+        f.writelines(lines[:-1])
+        f.write("ok\t\"q-")
+    with open(paths[1], "a") as f:
+        f.write('{"custom_id": "q-')
+    FakeChatClient.calls.clear()
+
+    summary = job(paths).run()
+
+    assert summary.completed == 1 and summary.skipped == 5
+    assert lost in outputs(paths[1])
+    assert sum(1 for _ in open(checkpoint)) == 6
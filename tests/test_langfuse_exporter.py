@@ -0,0 +1,138 @@
+import gc
+import time
+import weakref
+
+from sify.aiplatform.observability.langfuse import exporter as exporter_module
+from sify.aiplatform.observability.langfuse.exporter import BackgroundExporter
+from sify.aiplatform.observability.langfuse.redaction import PayloadLimiter
+from sify.aiplatform.observability.langfuse.tracer import LangfuseTracer
+
+
+class FakeObservation:
+    def __init__(self, client, kwargs):
+        self.client = client
+        self.kwargs = kwargs
+        self.ended = False
+        client.observations.append(self)
+
+    def start_observation(self, **kwargs):
+        return FakeObservation(self.client, kwargs)
+
+    def end(self):
+        self.ended = True
+
+
+class FakeClient:
+    def __init__(self, fail=0):
+        self.observations = []
+        self.fail = fail
+
+    def start_observation(self, **kwargs):
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("langfuse down")
+        return FakeObservation(self, kwargs)
+
+    def flush(self):
+        pass
+
+
+def make_tracer(client, **kwargs):
+    return LangfuseTracer(client, BackgroundExporter(client, flush_interval=0.05, **kwargs))
+
+
+def test_payload_is_snapshotted_when_span_ends():
+    client = FakeClient()
+    tracer = make_tracer(client)
+    messages = [{"role": "user", "content": "hi"}]
+    span = tracer.start_span("maas.chat", {"messages": messages})
+    span.start_generation(model="m", input=messages)
+    span.end_generation(model="m", output="hello")
+    span.end()
+    # The caller reuses its list right away.
+    messages.append({"role": "assistant", "content": "hello"})
+    messages[0]["content"] = "changed"
+    assert tracer.flush(5)
+
+    root, generation = client.observations
+    assert root.kwargs["input"]["messages"] == [{"role": "user", "content": "hi"}]
+    assert generation.kwargs["input"] == [{"role": "user", "content": "hi"}]
+
+
+def test_observations_carry_recorded_times():
+    client = FakeClient()
+    tracer = make_tracer(client)
+    span = tracer.start_span("maas.chat", {})
+    span.start_generation(model="m", input="x")
+    time.sleep(0.05)
+    span.end_generation(model="m", output="y")
+    span.end()
+    time.sleep(0.1)
+    assert tracer.flush(5)
+
+    for observation in client.observations:
+        assert observation.ended
+        # Exported ~0.1 s after the span ended; the metadata keeps the real duration.
+        assert 0.04 <= observation.kwargs["metadata"]["_timing"]["duration"] < 0.1
+
+
+def test_each_exporter_gets_its_own_default_limiter():
+    first, second = BackgroundExporter(FakeClient()), BackgroundExporter(FakeClient())
+    assert isinstance(first.limiter, PayloadLimiter)
+    assert first.limiter is not second.limiter
+    custom = PayloadLimiter(max_field_chars=8)
+    assert BackgroundExporter(FakeClient(), limiter=custom).limiter is custom
+
+
+def test_exit_hook_tracks_only_live_exporters():
+    exporter = BackgroundExporter(FakeClient())
+    assert exporter in exporter_module._live_exporters
+    exporter.shutdown()
+    assert exporter not in exporter_module._live_exporters
+
+    # A dropped exporter is not kept alive by the exit hook.
+    dropped = weakref.ref(BackgroundExporter(FakeClient()))
+    gc.collect()
+    assert dropped() is None
+
+
+def test_failed_send_is_spooled_and_replayed(tmp_path):
+    from sify.aiplatform.observability.langfuse.spool import SpanSpool
+
+    client = FakeClient(fail=1)
+    spool = SpanSpool(str(tmp_path))
+    exporter = BackgroundExporter(
+        client, flush_interval=0.05, spool=spool, health_check=lambda: True, probe_interval=0.1
+    )
+    tracer = LangfuseTracer(client, exporter)
+    for name in ("a", "b"):
+        tracer.start_span(name, {}).end()
+        assert tracer.flush(5)
+    # The failed "a" went to the spool, and "b" queued behind it while offline.
+    assert client.observations == []
+    assert exporter.stats()["spooled"] == 2
+
+    time.sleep(0.3)
+    tracer.start_span("c", {}).end()
+    assert tracer.flush(5)
+    assert [o.kwargs["name"] for o in client.observations] == ["a", "b", "c"]
+    assert exporter.stats()["replayed"] == 2
+    assert spool.empty
+
+
+def test_failed_replay_keeps_spooled_spans(tmp_path):
+    from sify.aiplatform.observability.langfuse.spool import SpanSpool
+
+    client = FakeClient()
+    spool = SpanSpool(str(tmp_path))
+    exporter = BackgroundExporter(client, spool=spool)
+    spool.append([{"name": "old", "user_id": None, "session_id": None, "trace_context": None,
+                   "input": {}, "metadata": {}, "error": None, "generation": None}])
+    client.fail = 1
+    assert exporter._replay_spool() is False
+    assert not spool.empty
+    assert exporter.stats()["replayed"] == 0
+
+    assert exporter._replay_spool() is True
+    assert [o.kwargs["name"] for o in client.observations] == ["old"]
+    assert spool.empty
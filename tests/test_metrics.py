@@ -0,0 +1,98 @@
+import pytest
+
+from sify.aiplatform.observability.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    normalize_endpoint,
+    record_usage,
+)
+
+
+def test_counter_and_gauge_exposition():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs run.", ("queue",))
+    counter.inc(queue="b")
+    counter.inc(2, queue="a")
+    registry.gauge("depth", "Queue depth.").set(1.5)
+
+    text = registry.render()
+
+    assert text.endswith("\n")
+    assert (
+        "# HELP sify_jobs_total Jobs run.\n"
+        "# TYPE sify_jobs_total counter\n"
+        'sify_jobs_total{queue="a"} 2\n'
+        'sify_jobs_total{queue="b"} 1\n'
+    ) in text
+    assert "# TYPE sify_depth gauge\nsify_depth 1.5\n" in text
+
+
+def test_histogram_buckets_are_cumulative_and_end_at_inf():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("wait_seconds", "Wait.", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 7.0):
+        histogram.observe(value, op="get")
+
+    text = registry.render()
+
+    assert (
+        "# TYPE sify_wait_seconds histogram\n"
+        'sify_wait_seconds_bucket{op="get",le="0.1"} 1\n'
+        'sify_wait_seconds_bucket{op="get",le="1"} 3\n'
+        'sify_wait_seconds_bucket{op="get",le="+Inf"} 4\n'
+        'sify_wait_seconds_sum{op="get"} 8.05\n'
+        'sify_wait_seconds_count{op="get"} 4\n'
+    ) in text
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("odd_total", "Odd labels.", ("value",)).inc(value='a"b\\c\nd')
+    assert 'sify_odd_total{value="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_metrics_render_in_name_order_and_without_namespace():
+    registry = MetricsRegistry(namespace="")
+    registry.counter("b_total", "B.").inc()
+    registry.counter("a_total", "A.").inc()
+    names = [line.split()[2] for line in registry.render().splitlines() if line.startswith("# TYPE")]
+    assert names == sorted(names)
+    assert "a_total" in names and "requests_total" in names
+
+
+def test_registering_a_name_twice_returns_the_same_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("x_total", "X.") is registry.counter("x_total", "X.")
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X.")
+
+
+def test_request_and_token_metrics(metrics):
+    metrics.record_request("POST", "/v1/chat/completions", "m", 200, 0.2, 10, 20, 1)
+    record_usage("/v1/chat/completions", "m", {"prompt_tokens": 3, "total_tokens": 8})
+
+    text = metrics.render()
+    labels = 'endpoint="/v1/chat/completions",model="m"'
+    assert f'sify_requests_total{{method="POST",{labels},status="200"}} 1' in text
+    assert f'sify_request_retries_total{{method="POST",{labels}}} 1' in text
+    assert f'sify_request_duration_seconds_count{{method="POST",{labels}}} 1' in text
+    assert f'sify_tokens_total{{{labels},type="completion"}} 5' in text
+    assert f'sify_tokens_total{{{labels},type="prompt"}} 3' in text
+
+
+def test_wsgi_app_serves_the_exposition():
+    registry = MetricsRegistry()
+    seen = {}
+
+    def start_response(status, headers):
+        seen.update(status=status, headers=dict(headers))
+
+    body = b"".join(registry.wsgi_app({}, start_response))
+    assert seen["status"] == "200 OK"
+    assert seen["headers"]["Content-Type"] == CONTENT_TYPE
+    assert body.decode() == registry.render()
+
+
+def test_endpoint_ids_are_normalized():
+    assert normalize_endpoint("/datasets/123/documents/0a1b2c3d4e5f6a7b8c9d") == "/datasets/:id/documents/:id"
+    assert normalize_endpoint("/v1/chat/completions") == "/v1/chat/completions"
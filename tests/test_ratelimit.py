@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from conftest import FakeResponse, FakeTransport, chat_reply
+
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.transport import ratelimit
+from sify.aiplatform.transport.ratelimit import RateLimiter, TokenBucket, estimate_tokens
+
+
+class Clock:
+    """Fake ``time``: ``sleep`` advances ``monotonic`` and records the wait."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    return clock
+
+
+KEY = ("key", "model")
+
+
+def test_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    # Callers queue up behind each other at 1 / rate.
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_refills_up_to_capacity_only(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+    for _ in range(5):
+        bucket.reserve()
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(5)] == [0] * 5
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_acquire_paces_requests_per_second(clock):
+    limiter = RateLimiter(requests_per_second=4, burst=1)
+    for _ in range(5):
+        limiter.acquire(KEY)
+    assert clock.sleeps == pytest.approx([0.25] * 4)
+
+
+def test_keys_have_separate_buckets(clock):
+    limiter = RateLimiter(requests_per_second=1, burst=1)
+    assert limiter.acquire(("key", "a")) == 0
+    assert limiter.acquire(("key", "b")) == 0
+    assert limiter.acquire(("key", "a")) == pytest.approx(1.0)
+
+
+def test_token_budget_and_settle(clock):
+    limiter = RateLimiter(tokens_per_minute=600)
+    assert limiter.acquire(KEY, tokens=600) == 0
+    # 600 per minute refills 10 tokens a second.
+    assert limiter.acquire(KEY, tokens=50) == pytest.approx(5.0)
+
+    # The first call only used 100 of its estimate; the rest comes back.
+    limiter.settle(KEY, estimated=600, actual=100)
+    assert limiter.acquire(KEY, tokens=400) == 0
+
+
+def test_acquire_async_waits_without_blocking(clock, monkeypatch):
+    waits = []
+
+    async def sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep)
+    limiter = RateLimiter(requests_per_second=2, burst=1)
+
+    async def main():
+        return [await limiter.acquire_async(KEY) for _ in range(3)]
+
+    assert asyncio.run(main()) == pytest.approx([0, 0.5, 1.0])
+    assert waits == pytest.approx([0.5, 1.0])
+    assert clock.sleeps == []
+
+
+def test_headers_set_the_limits(clock):
+    limiter = RateLimiter()
+    limiter.update_from_headers(KEY, {"x-ratelimit-limit-requests": "120", "x-ratelimit-limit-tokens": "6000"})
+    requests, tokens = limiter._get(KEY)
+    assert requests.rate == pytest.approx(2.0)
+    assert tokens.rate == pytest.approx(100.0)
+    assert tokens.capacity == 6000
+
+    # A lower limit from the server slows the client down.
+    limiter.update_from_headers(KEY, {"x-ratelimit-limit-requests": "60"})
+    assert requests.rate == pytest.approx(1.0)
+
+
+def test_remaining_header_caps_the_bucket(clock):
+    limiter = RateLimiter(requests_per_second=10, burst=10)
+    limiter.acquire(KEY)
+    limiter.update_from_headers(KEY, {"x-ratelimit-remaining-requests": "1"})
+    assert limiter.acquire(KEY) == 0
+    assert limiter.acquire(KEY) == pytest.approx(0.1)
+
+
+def test_client_paces_and_follows_response_headers(clock):
+    limiter = RateLimiter(requests_per_second=100, tokens_per_minute=60000)
+    headers = {"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "0"}
+    transport = FakeTransport(FakeResponse(chat_reply("hi"), headers=headers))
+    client = ModelAsAService("key", "m", transport=transport, rate_limiter=limiter, coalesce=False)
+    messages = [{"role": "user", "content": "hello"}]
+
+    client.chat_completion(messages)
+    requests, _ = limiter._get(("key", "m"))
+    assert requests.rate == pytest.approx(1.0)
+
+    # The server said nothing remains, so the next call waits a full second.
+    client.chat_completion(messages)
+    assert clock.sleeps == pytest.approx([1.0])
+    assert len(transport.requests) == 2
+
+
+def test_unparseable_headers_are_ignored(clock):
+    limiter = RateLimiter(requests_per_second=1)
+    limiter.update_from_headers(KEY, {"x-ratelimit-limit-requests": "soon", "x-ratelimit-remaining-requests": ""})
+    requests, _ = limiter._get(KEY)
+    assert requests.rate == 1.0
+
+
+def test_estimate_tokens_counts_prompt_and_completion():
+    payload = {"messages": [{"role": "user", "content": "x" * 40}], "max_tokens": 5}
+    assert estimate_tokens(payload) == 15
+    assert estimate_tokens({"input": ["abcd", "efgh"]}) == 2
+    assert estimate_tokens(None) == 0
@@ -0,0 +1,63 @@
+import re
+
+from sify.aiplatform.observability.langfuse.redaction import REDACTED, PayloadLimiter, content_hash
+
+
+def test_long_strings_keep_a_prefix_length_and_hash():
+    text = "x" * 50
+    limited = PayloadLimiter(max_field_chars=10).apply(text)
+    assert limited == f"{'x' * 10}... [truncated 50 chars, sha256={content_hash(text)}]"
+    # Identical prompts hash the same, so they can be matched across traces.
+    assert PayloadLimiter(max_field_chars=10).apply("x" * 50) == limited
+    assert PayloadLimiter(max_field_chars=10).apply("x" * 10) == "x" * 10
+
+
+def test_lists_and_depth_are_bounded():
+    limiter = PayloadLimiter(max_items=2, max_depth=2)
+    assert limiter.apply([1, 2, 3, 4]) == [1, 2, "[2 more items]"]
+    assert limiter.apply({"a": {"b": {"c": 1}}}) == {"a": {"b": "[depth limit]"}}
+    assert limiter.apply((1,)) == [1]
+
+
+def test_bytes_become_their_size():
+    assert PayloadLimiter().apply({"audio": b"\x00" * 1024}) == {"audio": "[1024 bytes]"}
+
+
+def test_sensitive_keys_are_redacted_at_any_depth():
+    payload = {
+        "Authorization": "Bearer abc",
+        "messages": [{"role": "user", "content": "hi", "api_key": "k"}],
+        "options": {"password": {"nested": "value"}},
+        "tokens": 5,
+    }
+    assert PayloadLimiter().apply(payload) == {
+        "Authorization": REDACTED,
+        "messages": [{"role": "user", "content": "hi", "api_key": REDACTED}],
+        "options": {"password": REDACTED},
+        "tokens": 5,
+    }
+
+
+def test_patterns_redact_inside_strings():
+    limiter = PayloadLimiter(
+        redact_patterns=[r"sk-[A-Za-z0-9]+", (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "[SSN]")]
+    )
+    assert limiter.apply("key sk-abc123 and 123-45-6789") == f"key {REDACTED} and [SSN]"
+
+
+def test_match_straddling_the_cut_is_redacted_whole():
+    secret = "sk-" + "a" * 20
+    limited = PayloadLimiter(max_field_chars=10, redact_patterns=[r"sk-a+"]).apply("12345" + secret + " tail")
+    assert limited.startswith("12345[REDA...")
+    assert "aaaa" not in limited
+
+
+def test_no_limits_copies_without_mutating():
+    payload = {"messages": [{"content": "y" * 10_000}], "items": list(range(500))}
+    limiter = PayloadLimiter(max_field_chars=None, max_items=None, redact_keys=())
+    copy = limiter.apply(payload)
+    assert copy == payload and copy is not payload
+    assert copy["messages"][0] is not payload["messages"][0]
+
+    PayloadLimiter(max_field_chars=5, max_items=1).apply(payload)
+    assert len(payload["messages"][0]["content"]) == 10_000 and len(payload["items"]) == 500
@@ -0,0 +1,108 @@
+import pytest
+from conftest import FakeResponse, FakeTransport, chat_reply
+
+from sify.aiplatform.cache import response_cache
+from sify.aiplatform.cache.lru import LRUCache
+from sify.aiplatform.cache.response_cache import ResponseCache
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache, "time", clock)
+    return clock
+
+
+def cached_client(cache, *replies):
+    transport = FakeTransport(*(FakeResponse(chat_reply(reply)) for reply in replies or ("hello",)))
+    return ModelAsAService("key", "m", transport=transport, response_cache=cache, coalesce=False), transport
+
+
+def test_identical_deterministic_request_is_served_from_cache():
+    cache = ResponseCache()
+    client, transport = cached_client(cache, "first", "second")
+
+    first = client.chat_completion(MESSAGES, temperature=0)
+    second = client.chat_completion(MESSAGES, temperature=0)
+
+    assert len(transport.requests) == 1
+    assert first.choices[0].message.content == second.choices[0].message.content == "first"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # Any change to the body is a different key.
+    assert client.chat_completion(MESSAGES, temperature=0, max_tokens=5).choices[0].message.content == "second"
+
+
+def test_sampled_requests_are_not_cached():
+    client, transport = cached_client(ResponseCache())
+    client.chat_completion(MESSAGES, temperature=0.7)
+    client.chat_completion(MESSAGES, temperature=0.7)
+    client.chat_completion(MESSAGES)
+    assert len(transport.requests) == 3
+
+
+def test_streaming_hit_replays_the_cached_response():
+    client, transport = cached_client(ResponseCache())
+    client.chat_completion(MESSAGES, temperature=0)
+
+    chunks = list(client.chat_completion(MESSAGES, temperature=0, stream=True))
+
+    assert len(transport.requests) == 1
+    assert "".join(chunk.choices[0]["delta"].get("content") or "" for chunk in chunks if chunk.choices) == "hello"
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl=60)
+    key = ResponseCache.key("/v1/chat/completions", {"messages": MESSAGES})
+    cache.put(key, chat_reply("hello"))
+
+    clock.now += 59
+    assert cache.get(key)["choices"][0]["message"]["content"] == "hello"
+    clock.now += 2
+    assert cache.get(key) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "expired": 1, "bytes": 0}
+
+
+def test_key_ignores_stream_flags_but_not_the_body():
+    body = {"model": "m", "messages": MESSAGES, "temperature": 0}
+    key = ResponseCache.key("/v1/chat/completions", body)
+    assert ResponseCache.key("/v1/chat/completions", {**body, "stream": True}) == key
+    assert ResponseCache.key("/v1/completions", body) != key
+    assert ResponseCache.key("/v1/chat/completions", {**body, "model": "other"}) != key
+
+
+def test_lru_evicts_least_recently_used_by_size():
+    lru = LRUCache(max_bytes=30)
+    for key in "abc":
+        lru.put(key, b"x" * 10)
+    lru.get("a")
+
+    lru.put("d", b"x" * 10)
+
+    assert lru.get("b") is None
+    assert all(lru.get(key) is not None for key in "acd")
+    assert lru.evictions == 1 and lru.size_bytes == 30
+
+    lru.put("huge", b"x" * 31)  # larger than the whole cache: not stored
+    assert lru.get("huge") is None and len(lru) == 3
+
+
+def test_response_cache_is_bounded_by_max_bytes():
+    cache = ResponseCache(max_bytes=1000)
+    keys = [ResponseCache.key("/v1/chat/completions", {"n": n}) for n in range(10)]
+    for key in keys:
+        cache.put(key, chat_reply("x" * 100))
+    assert cache.stats()["bytes"] <= 1000
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) is not None
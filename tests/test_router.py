@@ -0,0 +1,152 @@
+import asyncio
+import io
+
+import pytest
+from conftest import AsyncFakeChatClient, FakeChatClient
+
+from sify.aiplatform.models.router import AsyncModelRouter, ModelRoute, ModelRouter
+from sify.aiplatform.transport.errors import (
+    AuthenticationError,
+    CircuitOpenError,
+    RateLimitError,
+    ServerError,
+)
+from sify.aiplatform.transport.http_transport import get_transport
+from sify.aiplatform.transport.retry import RetryPolicy
+
+class SpeechClient(FakeChatClient):
+    def speech_to_text(self, file, **kwargs):
+        return self.chat_completion([{"role": "user", "content": file.read()}])
+
+
+class FakeRouter(ModelRouter):
+    client_class = SpeechClient
+
+
+class AsyncFakeRouter(AsyncModelRouter):
+    client_class = AsyncFakeChatClient
+
+
+@pytest.fixture(autouse=True)
+def failures(fake_chat):
+    return fake_chat.failures
+
+
+def called():
+    return [model for model, _ in FakeChatClient.calls]
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.parametrize("weight", [-1.0, float("nan"), float("inf")])
+def test_rejects_invalid_weights(weight):
+    with pytest.raises(ValueError):
+        ModelRouter("key", [ModelRoute("a"), ModelRoute("b", weight=weight)], strategy="weighted")
+
+
+def test_zero_weight_route_is_tried_last():
+    router = ModelRouter("key", [ModelRoute("fallback", weight=0), ModelRoute("main")], strategy="weighted")
+    assert all(router._candidates() == [1, 0] for _ in range(50))
+
+
+@pytest.mark.parametrize("router_class", [ModelRouter, AsyncModelRouter])
+def test_routes_do_not_retry_and_share_circuits(router_class):
+    router = router_class("key", ["a", "b"])
+    transport = router.clients[0].transport
+    assert transport.config.retry.max_retries == 0
+    assert all(client.transport is transport for client in router.clients)
+    assert transport.circuits is get_transport().circuits
+
+
+@pytest.mark.parametrize("router_class", [ModelRouter, AsyncModelRouter])
+def test_routers_reuse_one_transport_per_retry_policy(router_class):
+    first = router_class("key", ["a"]).clients[0].transport
+    assert router_class("key", ["b"]).clients[0].transport is first
+    patient = router_class("key", ["a"], retry=RetryPolicy(max_retries=2)).clients[0].transport
+    assert patient is not first
+    assert patient.config.retry.max_retries == 2
+    assert router_class("key", ["b"], retry=RetryPolicy(max_retries=2)).clients[0].transport is patient
+
+
+def test_rate_limits_never_open_a_route(failures):
+    router = FakeRouter("key", ["a", "b"], failure_threshold=2)
+    failures["a"] = RateLimitError("slow down", status_code=429)
+    for _ in range(3):
+        assert router.chat_completion(MESSAGES).served_by == "b"
+    assert router.health()[0]["state"] == "closed"
+    assert called() == ["a", "b"] * 3
+
+
+def test_fails_over_on_server_errors_and_rate_limits(failures):
+    router = FakeRouter("key", ["a", "b", "c"])
+    failures["a"] = ServerError("down", status_code=503)
+    failures["b"] = RateLimitError("slow down", status_code=429)
+
+    response = router.chat_completion(MESSAGES)
+
+    assert response.served_by == "c"
+    assert called() == ["a", "b", "c"]
+    # Throttling is not a failure of "b".
+    assert [route["failures"] for route in router.health()] == [1, 0, 0]
+
+
+def test_client_errors_are_not_failed_over(failures):
+    router = FakeRouter("key", ["a", "b"])
+    failures["a"] = AuthenticationError("bad key", status_code=401)
+
+    with pytest.raises(AuthenticationError):
+        router.chat_completion(MESSAGES)
+
+    assert called() == ["a"]
+    assert router.health()[0]["state"] == "closed"
+
+
+def test_open_route_is_skipped_until_every_route_is_open(failures):
+    router = FakeRouter("key", ["a", "b"], failure_threshold=2)
+    failures["a"] = ServerError("down", status_code=500)
+    for _ in range(2):
+        assert router.chat_completion(MESSAGES).served_by == "b"
+    FakeChatClient.calls.clear()
+
+    assert router.chat_completion(MESSAGES).served_by == "b"
+    assert called() == ["b"]
+
+    failures["b"] = ServerError("down", status_code=500)
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            router.chat_completion(MESSAGES)
+    FakeChatClient.calls.clear()
+
+    with pytest.raises(CircuitOpenError):
+        router.chat_completion(MESSAGES)
+    assert called() == []
+
+
+def test_stream_fails_over_before_the_first_chunk(failures):
+    router = FakeRouter("key", ["a", "b"])
+    failures["a"] = ServerError("down", status_code=502)
+
+    stream = router.chat_completion(MESSAGES, stream=True)
+
+    assert stream.served_by == "b"
+    assert [chunk["choices"][0]["delta"]["content"] for chunk in stream] == ["HI"]
+
+
+def test_uploads_are_rewound_for_the_next_route(failures):
+    router = FakeRouter("key", ["a", "b"])
+    failures["a"] = ServerError("down", status_code=500)
+
+    router.speech_to_text(io.BytesIO(b"audio"))
+
+    assert FakeChatClient.calls == [("a", b"audio"), ("b", b"audio")]
+
+
+def test_async_router_fails_over(failures):
+    router = AsyncFakeRouter("key", ["a", "b"])
+    failures["a"] = ServerError("down", status_code=500)
+
+    response = asyncio.run(router.chat_completion(MESSAGES))
+
+    assert response.served_by == "b"
+    assert called() == ["a", "b"]
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from conftest import FakeResponse, FakeTracer
+
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+from sify.aiplatform.transport.errors import ServerError
+from sify.aiplatform.transport.singleflight import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+EMBEDDINGS = {
+    "object": "list", "model": "m",
+    "data": [{"object": "embedding", "index": 0, "embedding": [0.5, 0.25]}],
+    "usage": {"prompt_tokens": 3, "total_tokens": 3},
+}
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class GatedTransport:
+    """Holds every request until ``release`` is set, then answers with ``response``."""
+
+    def __init__(self, response):
+        self.response = response
+        self.release = threading.Event()
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        if isinstance(self.response, BaseException):
+            raise self.response
+        return self.response
+
+
+class AsyncGatedTransport:
+    def __init__(self, response):
+        self.response = response
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        return self.response
+
+
+def coalescing_client(client_class, transport, flight):
+    client = client_class("key", "m", transport=transport)
+    client.single_flight = flight
+    client.tracer = FakeTracer()
+    return client
+
+
+def run_threads(client):
+    results = [None] * CALLERS
+
+    def call(i):
+        try:
+            results[i] = client.create_embeddings("same text")
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_identical_calls_share_one_request():
+    flight = SingleFlight()
+    transport = GatedTransport(FakeResponse(EMBEDDINGS))
+    client = coalescing_client(ModelAsAService, transport, flight)
+
+    threads, results = run_threads(client)
+    wait_for(lambda: flight.coalesced == CALLERS - 1)
+    transport.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert transport.calls == 1
+    assert all(result.data[0].embedding == [0.5, 0.25] for result in results)
+
+
+def test_only_the_sender_reports_usage():
+    flight = SingleFlight()
+    transport = GatedTransport(FakeResponse(EMBEDDINGS))
+    client = coalescing_client(ModelAsAService, transport, flight)
+
+    threads, _ = run_threads(client)
+    wait_for(lambda: flight.coalesced == CALLERS - 1)
+    transport.release.set()
+    for thread in threads:
+        thread.join()
+
+    usages = [span.generation["usage"] for span in client.tracer.spans]
+    assert usages.count(EMBEDDINGS["usage"]) == 1
+    assert usages.count(None) == CALLERS - 1
+    assert sum(1 for span in client.tracer.spans if span.metadata.get("coalesced")) == CALLERS - 1
+
+
+def test_every_caller_gets_the_exception():
+    flight = SingleFlight()
+    transport = GatedTransport(FakeResponse({"message": "down"}, status_code=503))
+    client = coalescing_client(ModelAsAService, transport, flight)
+
+    threads, results = run_threads(client)
+    wait_for(lambda: flight.coalesced == CALLERS - 1)
+    transport.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert transport.calls == 1
+    assert all(isinstance(result, ServerError) for result in results)
+
+
+def test_async_concurrent_identical_calls_share_one_request():
+    flight = AsyncSingleFlight()
+
+    async def main():
+        transport = AsyncGatedTransport(FakeResponse(EMBEDDINGS))
+        client = coalescing_client(AsyncModelAsAService, transport, flight)
+        tasks = [asyncio.create_task(client.create_embeddings("same text")) for _ in range(CALLERS)]
+        while flight.coalesced < CALLERS - 1:
+            await asyncio.sleep(0)
+        transport.release.set()
+        return transport, await asyncio.gather(*tasks)
+
+    transport, results = asyncio.run(main())
+    assert transport.calls == 1
+    assert all(result.data[0].embedding == [0.5, 0.25] for result in results)
+
+
+def test_async_every_caller_gets_the_exception():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ServerError("down", status_code=503)
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", fail) for _ in range(CALLERS)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ServerError) for result in results)
+    assert flight.coalesced == CALLERS - 1
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(asyncio.current_task())
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(main()) == ["value"] * 3
+    assert len(calls) == 2  # the cancelled leader, then one follower taking over
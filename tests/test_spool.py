@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from sify.aiplatform.observability.langfuse.spool import SpanSpool
+
+
+def test_replay_delivers_in_order_and_removes_segments(tmp_path):
+    spool = SpanSpool(str(tmp_path), segment_bytes=200)
+    spool.append([{"n": i} for i in range(10)])
+    spool.append([{"n": i} for i in range(10, 20)])
+    got = []
+    assert spool.replay(lambda entry: got.append(entry["n"])) == 20
+    assert got == list(range(20))
+    assert spool.empty
+
+
+def test_failed_entry_is_kept_and_replayed_later(tmp_path):
+    spool = SpanSpool(str(tmp_path))
+    spool.append([{"n": i} for i in range(10)])
+    got = []
+
+    def flaky(entry):
+        if entry["n"] == 4:
+            raise ConnectionError("down")
+        got.append(entry["n"])
+
+    with pytest.raises(ConnectionError):
+        spool.replay(flaky, checkpoint_every=2)
+    assert got == [0, 1, 2, 3]
+    assert not spool.empty
+
+    rest = []
+    assert spool.replay(lambda entry: rest.append(entry["n"])) == 6
+    assert rest == [4, 5, 6, 7, 8, 9]
+    assert spool.empty
+
+
+def test_replay_limit_resumes_from_cursor(tmp_path):
+    spool = SpanSpool(str(tmp_path))
+    spool.append([{"n": i} for i in range(5)])
+    first, second = [], []
+    assert spool.replay(lambda entry: first.append(entry["n"]), limit=2) == 2
+    assert spool.replay(lambda entry: second.append(entry["n"])) == 3
+    assert first + second == list(range(5))
+
+
+def test_size_cap_drops_oldest_segments(tmp_path):
+    spool = SpanSpool(str(tmp_path), max_bytes=2000, segment_bytes=500)
+    for i in range(40):
+        spool.append([{"n": i, "pad": "x" * 40}])
+    assert spool.size_bytes <= 2000 + 500
+    assert spool.dropped > 0
+    got = []
+    spool.replay(lambda entry: got.append(entry["n"]))
+    assert got == list(range(40 - len(got), 40))
+
+
+def test_torn_line_is_skipped(tmp_path):
+    spool = SpanSpool(str(tmp_path))
+    spool.append([{"n": 1}])
+    segment = os.path.join(str(tmp_path), sorted(os.listdir(str(tmp_path)))[0])
+    with open(segment, "a") as f:
+        f.write(json.dumps({"n": 2})[:5])
+    got = []
+    spool.replay(lambda entry: got.append(entry["n"]))
+    assert got == [1]
+    assert spool.dropped == 1
@@ -0,0 +1,61 @@
+import time
+
+from sify.aiplatform.cache.sqlite_store import SQLiteStore
+
+
+def test_hits_do_not_write_until_the_batch_fills(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.db"), touch_batch=2)
+    store.put("a", b"1")
+    store.put("b", b"2")
+    changes = store._conn.total_changes
+
+    store.get("a")
+    store.get("a")
+    store.get("missing")
+    assert store._conn.total_changes == changes
+
+    store.get("b")  # second distinct key: both access times are saved together
+    assert store._conn.total_changes == changes + 2
+    store.close()
+
+
+def test_eviction_uses_buffered_access_times(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.db"), max_bytes=350)
+    for key in "abc":
+        store.put(key, b"x" * 100)
+        time.sleep(0.01)
+    store.get("a")  # buffered, not yet written
+
+    store.put("d", b"x" * 100)
+
+    assert store.get("a") is not None
+    assert store.get("b") is None
+    assert store.get("c") is not None
+    assert store.evictions == 1
+    assert store.size_bytes == 300
+
+
+def test_eviction_trims_to_target_in_batches(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.db"), max_bytes=10_000)
+    for i in range(1000):
+        store.put(f"k{i}", b"x" * 10)
+    store.put("big", b"x" * 100)
+
+    assert store.size_bytes <= 9_000
+    assert store.size_bytes > 9_000 - 100
+    assert store.get("big") is not None
+    assert store.size_bytes == store._conn.execute("SELECT SUM(size) FROM entries").fetchone()[0]
+
+
+def test_close_saves_buffered_access_times(tmp_path):
+    path = str(tmp_path / "cache.db")
+    store = SQLiteStore(path)
+    store.put("a", b"1")
+    before = store._conn.execute("SELECT accessed FROM entries").fetchone()[0]
+    time.sleep(0.01)
+    store.get("a")
+    store.close()
+
+    reopened = SQLiteStore(path)
+    assert reopened._conn.execute("SELECT accessed FROM entries").fetchone()[0] > before
+    reopened.close()
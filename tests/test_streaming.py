@@ -0,0 +1,75 @@
+import asyncio
+
+from conftest import FakeAsyncTransport, FakeResponse, FakeTransport, sse
+
+from sify.aiplatform.aistudio.app import AIApplication
+from sify.aiplatform.models.async_model_as_a_service import AsyncModelAsAService
+from sify.aiplatform.models.model_as_a_service import ModelAsAService
+
+CHUNKS = [
+    {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "m",
+     "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]}
+    for word in ("one", "two", "three")
+]
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def test_breaking_out_of_a_stream_closes_response_and_reports_stats():
+    stats = []
+    response = FakeResponse(frames=sse(CHUNKS))
+    client = ModelAsAService(
+        "key", "m", transport=FakeTransport(response), on_stream_stats=stats.append, coalesce=False
+    )
+
+    stream = client.chat_completion(MESSAGES, stream=True)
+    for _ in stream:
+        break
+    stream.close()
+
+    assert response.closed
+    assert len(stats) == 1 and not stats[0].completed and stats[0].chunks == 1
+
+
+def test_finished_stream_reports_completed():
+    stats = []
+    response = FakeResponse(frames=sse(CHUNKS))
+    client = ModelAsAService(
+        "key", "m", transport=FakeTransport(response), on_stream_stats=stats.append, coalesce=False
+    )
+
+    text = "".join(chunk.choices[0]["delta"]["content"] for chunk in client.chat_completion(MESSAGES, stream=True))
+
+    assert text == "onetwothree"
+    assert response.closed
+    assert stats[0].completed and stats[0].chunks == 3
+
+
+def test_async_stream_aclose_closes_response_and_reports_stats():
+    stats = []
+    response = FakeResponse(frames=sse(CHUNKS))
+    client = AsyncModelAsAService(
+        "key", "m", transport=FakeAsyncTransport(response), on_stream_stats=stats.append, coalesce=False
+    )
+
+    async def main():
+        stream = await client.chat_completion(MESSAGES, stream=True)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+    asyncio.run(main())
+    assert response.closed
+    assert len(stats) == 1 and not stats[0].completed
+
+
+def test_aistudio_stream_close_reports_incomplete():
+    stats = []
+    response = FakeResponse(frames=sse([{"event": "message", "answer": "a"}, {"event": "message", "answer": "b"}]))
+    app = AIApplication("https://example.invalid/v1", "key", transport=FakeTransport(response), on_stream_stats=stats.append)
+
+    stream = app.chat_message("hi", "user", "streaming")
+    next(stream)
+    stream.close()
+
+    assert response.closed
+    assert len(stats) == 1 and not stats[0].completed
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from sify.aiplatform.transport.async_transport import get_async_transport
+from sify.aiplatform.transport.http_transport import configure_transport
+
+
+@pytest.fixture(autouse=True)
+def reset_transport():
+    yield
+    configure_transport()
+
+
+def test_reconfiguring_closes_the_old_async_clients():
+    async def main():
+        old = get_async_transport()
+        client = old._client()
+        configure_transport(read_timeout=5.0)
+        new = get_async_transport()
+        await asyncio.sleep(0)
+        return old, client, new
+
+    old, client, new = asyncio.run(main())
+    assert new is not old
+    assert client.is_closed
+    assert new.config.read_timeout == 5.0
+
+
+def test_closed_async_transport_reopens_on_demand():
+    async def main():
+        transport = get_async_transport()
+        first = transport._client()
+        transport.close()
+        await asyncio.sleep(0)
+        return first, transport._client()
+
+    first, second = asyncio.run(main())
+    assert first.is_closed and not second.is_closed